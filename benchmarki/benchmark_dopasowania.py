@@ -0,0 +1,32 @@
+import time
+import argparse
+
+from pomiar import dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_1')
+
+import numpy as np
+from dopasowanie_zipfa import dopasuj_zipfa
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dopasowania prawa Zipfa')
+    parser.add_argument('--rangi', type=int, default=10_000_000)
+    parser.add_argument('--wykladnik', type=float, default=1.05)
+    parser.add_argument('--proby', type=int, default=1000, help='liczba prób bootstrapu')
+    args = parser.parse_args()
+    
+    f = (1e8 / np.arange(1, args.rangi + 1) ** args.wykladnik).astype(np.int64) + 1
+    
+    start = time.perf_counter()
+    wynik = dopasuj_zipfa(f, liczba_prob=args.proby)
+    czas = time.perf_counter() - start
+    
+    print("=" * 60)
+    print(wynik.raport())
+    print("=" * 60)
+    print(f"Czas dopasowania ({args.rangi:,} rang, {args.proby} prób): {czas:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import argparse
+import platform
+import subprocess
+import contextlib
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, zmierz_w_procesie, zmierz_etap
+from generator_korpusu import korpus_zipfa
+
+
+def _etap(wyniki: List[Dict], nazwa: str, funkcja: Callable, *args,
+          liczba: Optional[Callable] = None) -> bool:
+    # Pomiar etapu z wyciszonym wydrukiem; brak zasobów (model spaCy, dane NLTK)
+    # zapisywany jako etap pominięty, a kolejne etapy projektu nie są uruchamiane
+    try:
+        with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+            pomiar = zmierz_etap(nazwa, funkcja, *args)
+    except (LookupError, OSError, ImportError) as e:
+        blad = next((l.strip() for l in str(e).splitlines() if l.strip(' *')), type(e).__name__)
+        wyniki.append({'etap': nazwa, 'status': 'pominięty', 'blad': blad})
+        return False
+    wynik = pomiar.pop('wynik')
+    pomiar['liczba'] = liczba(wynik) if liczba else None
+    pomiar['status'] = 'ok'
+    wyniki.append(pomiar)
+    return True
+
+
+def etapy_projektu_1(sciezka: str, top_n: int) -> List[Dict]:
+    dodaj_sciezke_projektu('projekt_1')
+    from analiza_korpusu import AnalizaKorpusu
+
+    analiza = AnalizaKorpusu(sciezka)
+    wyniki = []
+    etapy = [
+        ('otworz_magazyn', analiza.otworz_magazyn, (), lambda m: len(m.tokeny)),
+        ('wczytaj_korpus', analiza.wczytaj_korpus, (None,), lambda _: len(analiza.tokeny)),
+        ('oblicz_statystyki', analiza.oblicz_statystyki, (), len),
+        ('odciecie_90_procent', analiza.odciecie_90_procent, (), lambda w: w[0]),
+        ('generuj_graf_sasiedztwa', analiza.generuj_graf_sasiedztwa, (3,), len),
+        ('znajdz_rzeczowniki', analiza.znajdz_rzeczowniki, (top_n,), len),
+    ]
+    for nazwa, funkcja, args, liczba in etapy:
+        if not _etap(wyniki, nazwa, funkcja, *args, liczba=liczba):
+            break
+    return wyniki
+
+
+def etapy_projektu_3(sciezka: str, limit_slow: int) -> List[Dict]:
+    dodaj_sciezke_projektu('projekt_3')
+    import spacy
+    from analiza_semantyczna import AnalizaSemanyczna
+
+    # Bez pamięci parsowania - mierzony jest koszt parsowania, nie odczytu z dysku
+    analiza = AnalizaSemanyczna(sciezka, uzyj_pamieci=False)
+    wyniki = []
+    if not spacy.util.is_package('en_core_web_sm'):
+        # zaladuj_spacy() próbowałby pobrać model z sieci
+        return [{'etap': 'zaladuj_spacy', 'status': 'pominięty', 'blad': 'brak modelu en_core_web_sm'}]
+
+    tekst = {}
+
+    def wczytaj():
+        tekst['t'] = analiza.wczytaj_korpus(limit_slow)
+        return tekst['t']
+
+    etapy = [
+        ('zaladuj_spacy', analiza.zaladuj_spacy, (), None),
+        ('wczytaj_korpus', wczytaj, (), lambda t: len(t.split())),
+        ('parsuj', lambda: analiza.parsuj(tekst['t']), (), lambda k: k.liczba_tokenow),
+        ('analiza_pos', analiza.analiza_pos, (),
+         lambda _: len(analiza.rzeczowniki) + len(analiza.przymiotniki) + len(analiza.czasowniki)),
+        ('znajdz_polaczenia', analiza.znajdz_polaczenia, (),
+         lambda _: sum(len(v) for v in analiza.polaczenia_adj_noun.values())
+         + sum(len(v) for v in analiza.polaczenia_verb_noun.values())),
+    ]
+    for nazwa, funkcja, args, liczba in etapy:
+        if not _etap(wyniki, nazwa, funkcja, *args, liczba=liczba):
+            break
+    return wyniki
+
+
+def metadane(args) -> Dict:
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=KATALOG_REPO,
+                                capture_output=True, text=True).stdout.strip()
+    except OSError:
+        commit = None
+    return {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': sys.version.split()[0],
+        'platforma': platform.platform(),
+        'procesory': os.cpu_count(),
+        'argumenty': vars(args),
+    }
+
+
+def porownaj(wyniki: List[Dict], sciezka_poprzednich: str, tolerancja: float, prog_s: float = 0.05) -> List[str]:
+    # Regresja: etap wolniejszy lub z wyższym szczytem RSS niż tolerancja * poprzedni wynik
+    with open(sciezka_poprzednich, 'r', encoding='utf-8') as f:
+        poprzednie = {(w['projekt'], w['tokeny'], w['etap']): w
+                      for w in json.load(f)['wyniki'] if w.get('status') == 'ok'}
+
+    regresje = []
+    for w in wyniki:
+        stary = poprzednie.get((w['projekt'], w['tokeny'], w['etap']))
+        if stary is None or w.get('status') != 'ok':
+            continue
+        if w['czas_s'] > prog_s and w['czas_s'] > tolerancja * stary['czas_s']:
+            regresje.append(f"{w['projekt']} {w['tokeny']:,} {w['etap']}: czas "
+                            f"{stary['czas_s']:.2f} s -> {w['czas_s']:.2f} s")
+        if w['szczyt_rss_mb'] > tolerancja * stary['szczyt_rss_mb']:
+            regresje.append(f"{w['projekt']} {w['tokeny']:,} {w['etap']}: RSS "
+                            f"{stary['szczyt_rss_mb']:.0f} MB -> {w['szczyt_rss_mb']:.0f} MB")
+    return regresje
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark etapów analizy na syntetycznych korpusach Zipfa')
+    parser.add_argument('--tokeny', type=int, nargs='+', default=[1_000_000, 10_000_000, 100_000_000])
+    parser.add_argument('--projekty', nargs='+', default=['projekt_1', 'projekt_3'])
+    parser.add_argument('--wykladnik', type=float, default=1.1)
+    parser.add_argument('--ziarno', type=int, default=0)
+    parser.add_argument('--top-n', type=int, default=50, help='top_n dla znajdz_rzeczowniki')
+    parser.add_argument('--limit-spacy', type=int, default=200_000,
+                        help='maksymalna liczba słów dla etapów spaCy (projekt 3)')
+    parser.add_argument('--wyjscie', default='wyniki_etapow.json')
+    parser.add_argument('--porownaj', default=None, help='poprzedni plik JSON do wykrycia regresji')
+    parser.add_argument('--tolerancja', type=float, default=1.25)
+    args = parser.parse_args()
+
+    wyniki = []
+    print("=" * 96)
+    print(f"{'projekt':<11}{'tokeny':>13}  {'etap':<26}{'czas [s]':>10}{'CPU [s]':>10}"
+          f"{'RSS [MB]':>10}{'+RSS [MB]':>11}{'liczba':>13}")
+    print("=" * 96)
+    for liczba_tokenow in args.tokeny:
+        sciezka = korpus_zipfa(liczba_tokenow, args.wykladnik, args.ziarno)
+        for projekt in args.projekty:
+            # Każdy projekt i rozmiar w osobnym procesie - pomiary RSS nie sumują się
+            if projekt == 'projekt_1':
+                etapy = zmierz_w_procesie(etapy_projektu_1, sciezka, args.top_n)['wynik']
+            else:
+                etapy = zmierz_w_procesie(etapy_projektu_3, sciezka, min(args.limit_spacy, liczba_tokenow))['wynik']
+
+            for etap in etapy:
+                etap.update(projekt=projekt, tokeny=liczba_tokenow)
+                wyniki.append(etap)
+                if etap['status'] == 'ok':
+                    liczba = f"{etap['liczba']:,}" if etap['liczba'] is not None else '-'
+                    print(f"{projekt:<11}{liczba_tokenow:>13,}  {etap['etap']:<26}{etap['czas_s']:>10.2f}"
+                          f"{etap['cpu_s']:>10.2f}{etap['szczyt_rss_mb']:>10.0f}{etap['przyrost_rss_mb']:>11.0f}{liczba:>13}")
+                else:
+                    print(f"{projekt:<11}{liczba_tokenow:>13,}  {etap['etap']:<26}  pominięty: {etap['blad']}")
+    print("=" * 96)
+
+    with open(args.wyjscie, 'w', encoding='utf-8') as f:
+        json.dump({'meta': metadane(args), 'wyniki': wyniki}, f, ensure_ascii=False, indent=2)
+    print(f"Wyniki zapisane: {args.wyjscie}")
+
+    if args.porownaj:
+        regresje = porownaj(wyniki, args.porownaj, args.tolerancja)
+        for regresja in regresje:
+            print(f"REGRESJA {regresja}")
+        if regresje:
+            sys.exit(1)
+        print("Brak regresji względem", args.porownaj)
+
+
+if __name__ == "__main__":
+    main()
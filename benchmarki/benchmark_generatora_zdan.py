@@ -0,0 +1,77 @@
+import os
+import sys
+import argparse
+import resource
+import tempfile
+import contextlib
+import multiprocessing as mp
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_2')
+
+from gramatyka import wczytaj_dane
+from generator_zdan import FORMATY, ROZMIAR_PACZKI, zapisz_zdania
+
+
+def _rss_mb(kto: int) -> float:
+    rss = resource.getrusage(kto).ru_maxrss
+    # Linux podaje ru_maxrss w KB, macOS w bajtach
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def generuj(kolejka, sciezka: str, format_: str, tryb: str, liczba: int, procesy: int, paczka: int) -> None:
+    data = wczytaj_dane(os.path.join(KATALOG_REPO, 'projekt_2', 'data.json'))
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        wynik = zapisz_zdania(sciezka, data, format_, tryb, liczba, 0, paczka, procesy)
+    # Szczyt RSS procesu głównego i (po zamknięciu puli) największy z procesów roboczych
+    wynik['rss_glowny_mb'] = _rss_mb(resource.RUSAGE_SELF)
+    wynik['rss_roboczego_mb'] = _rss_mb(resource.RUSAGE_CHILDREN)
+    wynik['rozmiar_mb'] = os.path.getsize(sciezka) / (1024 * 1024)
+    os.remove(sciezka)
+    kolejka.put(wynik)
+
+
+def zmierz(*args) -> dict:
+    # Osobny proces na każdy pomiar; nie z puli (zmierz_w_procesie) - procesy demony
+    # nie mogą uruchomić własnej puli procesów roboczych. fork tam, gdzie jest dostępny:
+    # proces uruchomiony przez spawn startowałby przez spawn także pulę generatora
+    # (każdy proces roboczy importuje od nowa inflect, lemminflect i NumPy), inaczej niż
+    # "python generator_zdan.py" na Linuksie
+    ctx = mp.get_context('fork' if 'fork' in mp.get_all_start_methods() else 'spawn')
+    kolejka = ctx.Queue()
+    proces = ctx.Process(target=generuj, args=(kolejka, *args))
+    proces.start()
+    wynik = kolejka.get()
+    proces.join()
+    return wynik
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Przepustowość generatora zdań (projekt 2): zdania/s '
+                                                 'i szczyt RSS dla różnej liczby zdań, procesów i formatów')
+    parser.add_argument('--liczby', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000])
+    parser.add_argument('--procesy', type=int, nargs='+', default=sorted({1, 2, os.cpu_count() or 1}))
+    parser.add_argument('--formaty', choices=FORMATY, nargs='+', default=list(FORMATY))
+    parser.add_argument('--tryb', choices=('wszystkie', 'losowe'), default='losowe')
+    parser.add_argument('--paczka', type=int, default=ROZMIAR_PACZKI)
+    args = parser.parse_args()
+
+    print(f"Tryb: {args.tryb}, paczka: {args.paczka:,}, rdzenie: {os.cpu_count()}")
+    print("=" * 96)
+    print(f"{'format':<8}{'procesy':>8}{'zdania':>12}{'czas [s]':>10}{'zdania/s':>12}"
+          f"{'plik [MB]':>11}{'RSS główny [MB]':>17}{'RSS roboczy [MB]':>18}")
+    print("=" * 96)
+    for format_ in args.formaty:
+        for procesy in args.procesy:
+            for liczba in args.liczby:
+                sciezka = os.path.join(tempfile.gettempdir(), f'zdania_{os.getpid()}.{format_}')
+                w = zmierz(sciezka, format_, args.tryb, liczba, procesy, args.paczka)
+                roboczy = f"{w['rss_roboczego_mb']:.0f}" if procesy > 1 else '-'
+                print(f"{format_:<8}{procesy:>8}{w['zdania']:>12,}{w['czas_s']:>10.2f}{w['zdania_na_s']:>12,.0f}"
+                      f"{w['rozmiar_mb']:>11.0f}{w['rss_glowny_mb']:>17.0f}{roboczy:>18}")
+    print("=" * 96)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from pomiar import dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_3')
+
+import numpy as np
+from wykresy_semantyczne import KOLORY_LICZB, kolor_liczby, rysuj_graf_dwudzielny
+from wspolne.renderowanie import ustaw_tryb_wsadowy, zakoncz_rysunek
+
+ustaw_tryb_wsadowy()
+
+
+def rysuj_graf_networkx(set_a, set_b, krawedzie, sciezka, dpi):
+    # Punkt odniesienia: poprzednia wersja rysuj_graf_dwudzielny - nx.Graph budowany krawędź
+    # po krawędzi, kolor z kolor_liczby dla każdej krawędzi, rysowanie i podpisy przez networkx
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as mpatches
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_nodes_from(set_a, bipartite=0)
+    G.add_nodes_from(set_b, bipartite=1)
+    edge_colors, edge_widths = [], []
+    for word_a, word_b, count in krawedzie:
+        G.add_edge(word_a, word_b, weight=count)
+        edge_colors.append(kolor_liczby(count))
+        edge_widths.append(min(count * 0.5, 5))
+
+    fig, ax = plt.subplots(figsize=(18, 12))
+    pos = {node: (0, 1 - (i + 1) / (len(set_a) + 1)) for i, node in enumerate(set_a)}
+    pos.update({node: (1, 1 - (i + 1) / (len(set_b) + 1)) for i, node in enumerate(set_b)})
+    nx.draw_networkx_edges(G, pos, edge_color=edge_colors, width=edge_widths, alpha=0.6, ax=ax)
+    nx.draw_networkx_nodes(G, pos, nodelist=set_a, node_color='#ecf0f1', node_size=800, node_shape='s',
+                           edgecolors='#34495e', linewidths=2, ax=ax)
+    nx.draw_networkx_nodes(G, pos, nodelist=set_b, node_color='#ecf0f1', node_size=800, node_shape='o',
+                           edgecolors='#34495e', linewidths=2, ax=ax)
+    nx.draw_networkx_labels(G, pos, {n: n for n in set_a}, font_size=8, font_weight='bold', ax=ax)
+    nx.draw_networkx_labels(G, pos, {n: n for n in set_b}, font_size=8, font_weight='bold', ax=ax)
+    ax.text(0, 1.05, 'A', ha='center', fontsize=14, fontweight='bold')
+    ax.text(1, 1.05, 'B', ha='center', fontsize=14, fontweight='bold')
+    ax.legend(handles=[mpatches.Patch(facecolor=k, label=k) for k in KOLORY_LICZB], loc='upper center',
+              bbox_to_anchor=(0.5, -0.05), ncol=4, frameon=True, fontsize=10)
+    ax.set_title('graf', fontsize=16, fontweight='bold', pad=20)
+    ax.axis('off')
+    plt.tight_layout()
+    zakoncz_rysunek(fig, sciezka, dpi)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark grafu dwudzielnego: networkx vs LineCollection')
+    parser.add_argument('--top', type=int, nargs='+', default=[30, 100, 300, 500, 1000])
+    parser.add_argument('--gestosc', type=float, default=0.02, help='odsetek par top x top połączonych krawędzią')
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    katalog = tempfile.mkdtemp()
+    rng = np.random.default_rng(0)
+
+    print("=" * 62)
+    print(f"{'metoda':<22}{'top':>8}{'krawędzie':>12}{'czas [s]':>10}")
+    print("=" * 62)
+    for top_n in args.top:
+        set_a = [f'a{i}' for i in range(top_n)]
+        set_b = [f'b{i}' for i in range(top_n)]
+        pary = np.flatnonzero(rng.random(top_n * top_n) < args.gestosc)
+        wiersze, kolumny = pary // top_n, pary % top_n
+        liczby = rng.zipf(1.8, len(pary))
+        krawedzie = [(set_a[i], set_b[j], c) for i, j, c in zip(wiersze.tolist(), kolumny.tolist(), liczby.tolist())]
+
+        sciezka = os.path.join(katalog, 'graf.png')
+        start = time.perf_counter()
+        rysuj_graf_networkx(set_a, set_b, krawedzie, sciezka, args.dpi)
+        print(f"{'networkx':<22}{top_n:>8}{len(pary):>12,}{time.perf_counter() - start:>10.2f}")
+        start = time.perf_counter()
+        rysuj_graf_dwudzielny(set_a, set_b, wiersze, kolumny, liczby, 'graf', 'A', 'B', sciezka, args.dpi)
+        print(f"{'LineCollection':<22}{top_n:>8}{len(pary):>12,}{time.perf_counter() - start:>10.2f}")
+    print("=" * 62)
+
+    shutil.rmtree(katalog)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import json
+import argparse
+import subprocess
+import statistics
+
+from pomiar import KATALOG_REPO
+
+# Budżet sprawdzany także w testach (testy/test_budzet_importu.py)
+BUDZET_MS = 250.0
+# Moduły ładowane tylko przez etapy, które ich używają - nie mogą pojawić się po samym imporcie
+CIEZKIE = ['pandas', 'matplotlib', 'networkx', 'scipy', 'nltk', 'spacy']
+MODULY = [
+    ('projekt_1', 'analiza_korpusu'),
+    ('projekt_3', 'analiza_semantyczna'),
+]
+KOD_POMIARU = """
+import sys, time, json
+start = time.perf_counter()
+import {modul}
+czas = time.perf_counter() - start
+print(json.dumps({{'czas_s': czas, 'ciezkie': [m for m in {ciezkie!r} if m in sys.modules]}}))
+"""
+
+
+def zmierz_import(projekt: str, modul: str) -> dict:
+    # Świeży interpreter na każdy pomiar - bez modułów z poprzednich importów
+    wynik = subprocess.run(
+        [sys.executable, '-c', KOD_POMIARU.format(modul=modul, ciezkie=CIEZKIE)],
+        cwd=os.path.join(KATALOG_REPO, projekt), capture_output=True, text=True, check=True,
+    )
+    return json.loads(wynik.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Czas importu modułów analizy i budżet startu')
+    parser.add_argument('--powtorzenia', type=int, default=5)
+    parser.add_argument('--budzet-ms', type=float, default=BUDZET_MS,
+                        help='maksymalna mediana czasu importu modułu (kod wyjścia 1 po przekroczeniu)')
+    args = parser.parse_args()
+
+    przekroczenia = []
+    print("=" * 72)
+    print(f"{'moduł':<24}{'mediana [ms]':>14}{'maks. [ms]':>12}  ciężkie zależności")
+    print("=" * 72)
+    for projekt, modul in MODULY:
+        pomiary = [zmierz_import(projekt, modul) for _ in range(args.powtorzenia)]
+        czasy = [1000 * p['czas_s'] for p in pomiary]
+        ciezkie = sorted({m for p in pomiary for m in p['ciezkie']})
+        mediana = statistics.median(czasy)
+        print(f"{modul:<24}{mediana:>14.1f}{max(czasy):>12.1f}  {', '.join(ciezkie) or '-'}")
+
+        if mediana > args.budzet_ms:
+            przekroczenia.append(f"{modul}: {mediana:.1f} ms > budżet {args.budzet_ms:g} ms")
+        if ciezkie:
+            przekroczenia.append(f"{modul}: import ładuje {', '.join(ciezkie)}")
+    print("=" * 72)
+
+    for przekroczenie in przekroczenia:
+        print(f"PRZEKROCZENIE {przekroczenie}")
+    if przekroczenia:
+        sys.exit(1)
+    print(f"Importy w budżecie {args.budzet_ms:g} ms, bez ciężkich zależności")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+import os
+import sys
+import json
+import time
+import shutil
+import socket
+import argparse
+import tempfile
+import contextlib
+import subprocess
+import http.client
+import threading
+from urllib.parse import urlparse, quote
+
+import numpy as np
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu
+from benchmark_polaczen import kolumny_syntetyczne
+
+dodaj_sciezke_projektu('projekt_3')
+
+from analiza_semantyczna import AnalizaSemanyczna
+from indeks_kolokacji import IndeksKolokacji
+
+
+def zbuduj_indeks(katalog: str, tokeny: int, typy: int, top_n: int) -> str:
+    analiza = AnalizaSemanyczna('')
+    analiza.kolumny = kolumny_syntetyczne(tokeny, typy)
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        analiza.analiza_pos(top_n=top_n)
+        analiza.znajdz_polaczenia()
+        return analiza.zapisz_indeks(katalog)
+
+
+def zapytania_zipfa(indeks: IndeksKolokacji, liczba: int, ziarno: int = 0) -> list:
+    # Słowa losowane z rozkładem Zipfa po rangach - część kluczy powtarza się jak w ruchu rzeczywistym
+    rng = np.random.default_rng(ziarno)
+    zapytania = []
+    for relacja, typ in [(r, t) for r in indeks.meta['relacje'] for t in ('rzeczowniki', 'okreslenia')]:
+        slowa = indeks.kierunki[(relacja, typ)].indeks
+        lista = list(slowa)
+        rangi = (rng.zipf(1.2, liczba // 4) - 1) % len(lista)
+        zapytania += [{'typ': typ, 'slowo': lista[r], 'relacja': relacja, 'k': 10} for r in rangi.tolist()]
+    rng.shuffle(zapytania)
+    return zapytania
+
+
+def percentyle_us(czasy) -> str:
+    p50, p99 = np.percentile(np.asarray(czasy) * 1e6, [50, 99])
+    return f"{p50:>10.1f}{p99:>10.1f}"
+
+
+def pomiar_api(indeks: IndeksKolokacji, zapytania: list, paczka: int) -> None:
+    print("=" * 62)
+    print(f"{'API (w procesie)':<42}{'p50 [µs]':>10}{'p99 [µs]':>10}")
+    print("=" * 62)
+    for nazwa, pamiec in (('pojedyncze, bez pamięci', False), ('pojedyncze, pamięć LRU', True)):
+        czasy = []
+        for z in zapytania:
+            if not pamiec:
+                indeks.wyczysc_pamiec()
+            start = time.perf_counter()
+            indeks.wiele([z])
+            czasy.append(time.perf_counter() - start)
+        print(f"{nazwa:<42}{percentyle_us(czasy)}")
+
+    czasy = []
+    indeks.wyczysc_pamiec()
+    for i in range(0, len(zapytania) - paczka + 1, paczka):
+        start = time.perf_counter()
+        indeks.wiele(zapytania[i:i + paczka])
+        czasy.append(time.perf_counter() - start)
+    print(f"{f'paczka {paczka} zapytań, pamięć LRU':<42}{percentyle_us(czasy)}")
+    stan = indeks.stan_pamieci()
+    print(f"Pamięć LRU: {stan['trafienia']:,} trafień, {stan['chybienia']:,} chybień, "
+          f"{stan['rozmiar']:,}/{stan['pojemnosc']:,} wpisów")
+
+
+def klient(host: str, port: int, zapytania: list, czasy: list) -> None:
+    # Jedno połączenie HTTP/1.1 na klienta, zapytania GET po kolei
+    polaczenie = http.client.HTTPConnection(host, port)
+    for z in zapytania:
+        sciezka = f"/{z['typ']}?slowo={quote(z['slowo'])}&relacja={z['relacja']}&k={z['k']}"
+        start = time.perf_counter()
+        polaczenie.request('GET', sciezka)
+        odpowiedz = polaczenie.getresponse()
+        odpowiedz.read()
+        czasy.append(time.perf_counter() - start)
+        if odpowiedz.status != 200:
+            raise RuntimeError(f"{sciezka}: HTTP {odpowiedz.status}")
+    polaczenie.close()
+
+
+def czekaj_na_serwer(host: str, port: int, limit_s: float = 10.0) -> None:
+    koniec = time.time() + limit_s
+    while time.time() < koniec:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return
+        except OSError:
+            time.sleep(0.05)
+    raise RuntimeError(f"Serwer {host}:{port} nie odpowiada")
+
+
+def wolny_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def pomiar_http(host: str, port: int, zapytania: list, klienci: int) -> None:
+    czasy_klientow = [[] for _ in range(klienci)]
+    watki = [threading.Thread(target=klient, args=(host, port, zapytania[i::klienci], czasy_klientow[i]))
+             for i in range(klienci)]
+    start = time.perf_counter()
+    for w in watki:
+        w.start()
+    for w in watki:
+        w.join()
+    czas = time.perf_counter() - start
+    czasy = [c for czasy_klienta in czasy_klientow for c in czasy_klienta]
+    print(f"{klienci:>8}{len(czasy):>12,}{len(czasy) / czas:>14,.0f}{percentyle_us(czasy)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Test obciążenia indeksu kolokacji: API w procesie '
+                                                 'i serwer HTTP (serwer_kolokacji.py)')
+    parser.add_argument('--indeks', default=None,
+                        help='katalog indeksu (domyślnie indeks z syntetycznego korpusu)')
+    parser.add_argument('--adres', default=None,
+                        help='działający serwer, np. http://127.0.0.1:8765 (domyślnie uruchamiany lokalnie)')
+    parser.add_argument('--tokeny', type=int, default=2_000_000)
+    parser.add_argument('--top', type=int, default=5000, help='liczba słów każdej części mowy w indeksie')
+    parser.add_argument('--zapytania', type=int, default=20_000)
+    parser.add_argument('--paczka', type=int, default=100)
+    parser.add_argument('--klienci', type=int, nargs='+', default=[1, 4, 16])
+    args = parser.parse_args()
+
+    katalog_tmp = None
+    katalog = args.indeks
+    if katalog is None:
+        katalog_tmp = tempfile.mkdtemp()
+        katalog = zbuduj_indeks(os.path.join(katalog_tmp, 'kolokacje'), args.tokeny, 200_000, args.top)
+
+    start = time.perf_counter()
+    indeks = IndeksKolokacji.otworz(katalog)
+    print(f"Otwarcie indeksu (memmap): {time.perf_counter() - start:.3f} s, "
+          + ", ".join(f"{r}: {o['pary']:,} par" for r, o in indeks.meta['relacje'].items()))
+    zapytania = zapytania_zipfa(indeks, args.zapytania)
+    pomiar_api(indeks, zapytania, args.paczka)
+
+    serwer = None
+    if args.adres:
+        adres = urlparse(args.adres)
+        host, port = adres.hostname, adres.port
+    else:
+        host, port = '127.0.0.1', wolny_port()
+        serwer = subprocess.Popen([sys.executable, os.path.join(KATALOG_REPO, 'projekt_3', 'serwer_kolokacji.py'),
+                                   '--indeks', katalog, '--port', str(port)], stdout=subprocess.DEVNULL)
+    try:
+        czekaj_na_serwer(host, port)
+        print("=" * 62)
+        print(f"{'klienci':>8}{'zapytania':>12}{'zapytania/s':>14}{'p50 [µs]':>10}{'p99 [µs]':>10}")
+        print("=" * 62)
+        for klienci in args.klienci:
+            pomiar_http(host, port, zapytania, klienci)
+        print("=" * 62)
+        polaczenie = http.client.HTTPConnection(host, port)
+        polaczenie.request('GET', '/stan')
+        stan = json.loads(polaczenie.getresponse().read())['pamiec']
+        print(f"Serwer: pamięć LRU {stan['trafienia']:,} trafień, {stan['chybienia']:,} chybień")
+    finally:
+        if serwer is not None:
+            serwer.terminate()
+            serwer.wait()
+        if katalog_tmp is not None:
+            shutil.rmtree(katalog_tmp)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+import os
+import time
+import random
+import logging
+import argparse
+
+import numpy as np
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_2')
+
+from streamlit.testing.v1 import AppTest
+from gramatyka import CZASY, LICZBY, OSOBY, PRZEDIMKI, RODZAJE, TablicaOdmian, build_sentence, wczytaj_dane
+
+KATALOG_PROJEKTU = os.path.join(KATALOG_REPO, 'projekt_2')
+# Wariant "przed": data.json czytany i odmiany liczone na bieżąco w każdym przebiegu skryptu
+WCZYTANIE_Z_PAMIECIA = "data, odmiany = load_data()"
+WCZYTANIE_BEZ_PAMIECI = "data, odmiany = wczytaj_dane(DATA_PATH), None"
+
+KROKI = ('krok 1 -> 2', 'krok 2 -> 3', 'krok 3 -> 4 (zdanie)', 'krok 4 -> 1')
+
+
+def losowe_zdanie(data: dict, rng: random.Random) -> dict:
+    return {
+        'subject': {'noun': rng.choice(data['nouns']), 'number': rng.choice(LICZBY),
+                    'person': rng.choice(OSOBY), 'adj': rng.choice([None] + data['adjectives'])},
+        'verb': {'base': rng.choice(data['verbs']), 'tense': rng.choice(CZASY), 'type': rng.choice(RODZAJE)},
+        'object': {'noun': rng.choice(data['nouns']), 'article': rng.choice(PRZEDIMKI)},
+    }
+
+
+def percentyle(czasy, skala: float) -> str:
+    p50, p99 = np.percentile(np.asarray(czasy) * skala, [50, 99])
+    return f"{p50:>10.2f}{p99:>10.2f}"
+
+
+def przejdz_kreator(at: AppTest, zd: dict, czasy: dict) -> str:
+    # Jedno przejście czterech kroków; mierzony przebieg skryptu po każdym przycisku
+    def kliknij(krok, przycisk):
+        start = time.perf_counter()
+        przycisk.click().run()
+        czasy[krok].append(time.perf_counter() - start)
+
+    s, v, o = zd['subject'], zd['verb'], zd['object']
+    at.radio[0].set_value(s['number'])
+    at.select_slider[0].set_value(s['person'])
+    at.selectbox[0].set_value(s['noun'])
+    # Pole przymiotnika pojawia się dopiero po zaznaczeniu (dodatkowy przebieg, niemierzony)
+    at.checkbox[0].set_value(bool(s['adj'])).run()
+    if s['adj']:
+        at.selectbox[1].set_value(s['adj'])
+    kliknij(KROKI[0], at.button[0])
+    at.selectbox[0].set_value(v['base'])
+    at.selectbox[1].set_value(v['tense'])
+    at.radio[0].set_value(v['type'])
+    kliknij(KROKI[1], at.button[1])
+    at.selectbox[0].set_value(o['noun'])
+    at.radio[0].set_value(o['article'])
+    kliknij(KROKI[2], at.button[1])
+    zdanie = at.header[0].value.strip('"')
+    kliknij(KROKI[3], at.button[0])
+    return zdanie
+
+
+def pomiar_aplikacji(nazwa: str, skrypt: str, zdania: list) -> list:
+    at = AppTest.from_string(skrypt, default_timeout=60)
+    start = time.perf_counter()
+    at.run()
+    pierwszy = time.perf_counter() - start
+    czasy = {krok: [] for krok in KROKI}
+    wyniki = [przejdz_kreator(at, zd, czasy) for zd in zdania]
+    print(f"{nazwa}: pierwszy przebieg (importy, przygotowanie danych) {pierwszy * 1e3:.0f} ms")
+    for krok in KROKI:
+        print(f"  {krok:<38}{percentyle(czasy[krok], 1e3)}")
+    return wyniki
+
+
+def pomiar_logiki(data: dict, zdania: list) -> None:
+    # Sama praca skryptu poza Streamlit: odczyt data.json i odmiany w build_sentence
+    # vs stat pliku (klucz pamięci) i zdanie z tablicy odmian
+    start = time.perf_counter()
+    tablica = TablicaOdmian.z_danych(data)
+    print(f"Przygotowanie tablicy odmian: {(time.perf_counter() - start) * 1e3:.1f} ms "
+          f"({len(tablica.mnogie)} rzeczowników, {len(tablica.przedimki)} przymiotników, "
+          f"{len(tablica.czasowniki)} czasowników)")
+
+    sciezka = os.path.join(KATALOG_PROJEKTU, 'data.json')
+
+    def przed(zd):
+        wczytaj_dane(sciezka)
+        return build_sentence(zd)
+
+    def po(zd):
+        os.stat(sciezka)
+        return build_sentence(zd, tablica)
+
+    for nazwa, interakcja in (('przed: json.load + odmiany na bieżąco', przed),
+                              ('po: os.stat + tablica odmian', po)):
+        czasy = []
+        for zd in zdania:
+            start = time.perf_counter()
+            interakcja(zd)
+            czasy.append(time.perf_counter() - start)
+        print(f"  {nazwa:<38}{percentyle(czasy, 1e6)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Opóźnienie interakcji w kreatorze zdań (projekt 2): '
+                                                 'data.json i odmiany w każdym przebiegu vs st.cache_resource')
+    parser.add_argument('--przejscia', type=int, default=100, help='liczba przejść kreatora (AppTest)')
+    parser.add_argument('--zdania', type=int, default=20_000, help='liczba zdań w pomiarze samej logiki')
+    parser.add_argument('--ziarno', type=int, default=0)
+    args = parser.parse_args()
+
+    # AppTest uruchamia skrypt jak "streamlit run" w katalogu projektu (data.json względem CWD)
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+    os.chdir(KATALOG_PROJEKTU)
+    data = wczytaj_dane('data.json')
+    rng = random.Random(args.ziarno)
+
+    print("=" * 58)
+    print(f"{'Logika jednej interakcji':<40}{'p50 [µs]':>10}{'p99 [µs]':>10}")
+    print("=" * 58)
+    pomiar_logiki(data, [losowe_zdanie(data, rng) for _ in range(args.zdania)])
+
+    with open('app.py', 'r', encoding='utf-8') as f:
+        skrypt = f.read()
+    if WCZYTANIE_Z_PAMIECIA not in skrypt:
+        raise RuntimeError(f"app.py nie zawiera '{WCZYTANIE_Z_PAMIECIA}'")
+    zdania = [losowe_zdanie(data, rng) for _ in range(args.przejscia)]
+    print("=" * 58)
+    print(f"{'Przebieg skryptu po kliknięciu (AppTest)':<40}{'p50 [ms]':>10}{'p99 [ms]':>10}")
+    print("=" * 58)
+    przed = pomiar_aplikacji('przed', skrypt.replace(WCZYTANIE_Z_PAMIECIA, WCZYTANIE_BEZ_PAMIECI), zdania)
+    po = pomiar_aplikacji('po (st.cache_resource)', skrypt, zdania)
+    print(f"Zdania identyczne: {przed == po} ({len(po)} przejść)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import os
+import math
+import time
+import argparse
+import contextlib
+from collections import defaultdict
+
+from pomiar import dodaj_sciezke_projektu
+from benchmark_polaczen import kolumny_syntetyczne
+
+dodaj_sciezke_projektu('projekt_3')
+
+from analiza_semantyczna import AnalizaSemanyczna
+from miary_kolokacji import MIARY, ranking
+
+
+def _xlogx(k: float, oczekiwane: float) -> float:
+    return k * math.log(k / oczekiwane) if k > 0 else 0.0
+
+
+def ranking_slownikowy(polaczenia, miara: str, k: int) -> int:
+    # Punkt odniesienia: zagnieżdżone słowniki, marginesy i wynik każdej pary w pętli
+    # Pythona, pełne sortowanie rzeczowników każdego słowa
+    wiersze = defaultdict(int)
+    kolumny = defaultdict(int)
+    for a, rzeczowniki in polaczenia.items():
+        for b, liczba in rzeczowniki.items():
+            wiersze[a] += liczba
+            kolumny[b] += liczba
+    n = sum(wiersze.values())
+
+    wybrane = 0
+    for a, rzeczowniki in polaczenia.items():
+        r = wiersze[a]
+        wyniki = []
+        for b, liczba in rzeczowniki.items():
+            c = kolumny[b]
+            if miara == 'liczba':
+                wynik = liczba
+            elif miara == 'pmi':
+                wynik = math.log(liczba * n / (r * c))
+            elif miara == 't':
+                wynik = (liczba - r * c / n) / math.sqrt(liczba)
+            elif miara == 'dice':
+                wynik = 2 * liczba / (r + c)
+            else:
+                wynik = 2 * (_xlogx(liczba, r * c / n) + _xlogx(r - liczba, r * (n - c) / n)
+                             + _xlogx(c - liczba, (n - r) * c / n) + _xlogx(n - r - c + liczba, (n - r) * (n - c) / n))
+            wyniki.append((wynik, b))
+        wybrane += len(sorted(wyniki, reverse=True)[:k])
+    return wybrane
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark miar siły kolokacji: pętla po słownikach '
+                                                 'vs tablice NumPy i wybór top-k (miary_kolokacji.ranking)')
+    parser.add_argument('--tokeny', type=int, default=5_000_000)
+    parser.add_argument('--typy', type=int, default=500_000)
+    parser.add_argument('--top', type=int, default=50_000, help='liczba słów każdej części mowy (wiersze i kolumny)')
+    parser.add_argument('--k', type=int, default=10)
+    args = parser.parse_args()
+
+    analiza = AnalizaSemanyczna('')
+    analiza.kolumny = kolumny_syntetyczne(args.tokeny, args.typy)
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        analiza.analiza_pos(top_n=args.top)
+        analiza.znajdz_polaczenia()
+    macierz = analiza.polaczenia_adj_noun
+    slowniki = defaultdict(dict)
+    for a, b, liczba in macierz.krawedzie(len(macierz.wiersze), len(macierz.kolumny)):
+        slowniki[a][b] = liczba
+    print(f"Macierz {len(macierz.wiersze):,} x {len(macierz.kolumny):,}, {macierz.liczba_par:,} par, top-{args.k}")
+
+    print("=" * 56)
+    print(f"{'miara':<10}{'słowniki [s]':>16}{'NumPy [s]':>14}{'przyspieszenie':>16}")
+    print("=" * 56)
+    for miara in MIARY:
+        start = time.perf_counter()
+        ranking_slownikowy(slowniki, miara, args.k)
+        czas_slownikow = time.perf_counter() - start
+        start = time.perf_counter()
+        ranking(macierz, miara, args.k)
+        czas_numpy = time.perf_counter() - start
+        print(f"{miara:<10}{czas_slownikow:>16.3f}{czas_numpy:>14.3f}{czas_slownikow / czas_numpy:>15.1f}x")
+    print("=" * 56)
+
+
+if __name__ == "__main__":
+    main()
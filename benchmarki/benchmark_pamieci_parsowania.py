@@ -0,0 +1,55 @@
+import os
+import sys
+import shutil
+import argparse
+import tempfile
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, zmierz_w_procesie
+
+dodaj_sciezke_projektu('projekt_3')
+
+from analiza_semantyczna import AnalizaSemanyczna
+from pamiec_parsowania import PamiecParsowania, rozmiar_katalogu
+
+
+def parsowanie(sciezka: str, limit_slow: int, katalog_pamieci: str) -> int:
+    # Jak uruchom_analize: model ładowany przez parsuj tylko przy braku wpisu w pamięci
+    analiza = AnalizaSemanyczna(sciezka)
+    analiza.pamiec_parsowania = PamiecParsowania(katalog_pamieci)
+    analiza.parsuj(analiza.wczytaj_korpus(limit_slow))
+    analiza.analiza_pos()
+    return analiza.kolumny.liczba_tokenow
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parsowanie spaCy bez pamięci i z pamięcią parsowania (.pjn_cache/parsowania)')
+    parser.add_argument('--limit-slow', type=int, default=100_000)
+    parser.add_argument('--powtorzenia', type=int, default=3)
+    args = parser.parse_args()
+
+    import spacy
+    if not spacy.util.is_package('en_core_web_sm'):
+        print("Brak modelu en_core_web_sm (python -m spacy download en_core_web_sm)")
+        sys.exit(1)
+
+    sciezka = os.path.join(KATALOG_REPO, 'projekt_3', 'corpus', 'corpus.txt')
+    katalog = tempfile.mkdtemp(prefix='parsowania_')
+    try:
+        pomiary = [('zimny (model + parsowanie)', zmierz_w_procesie(parsowanie, sciezka, args.limit_slow, katalog))]
+        for i in range(args.powtorzenia):
+            pomiary.append((f'ciepły #{i + 1}', zmierz_w_procesie(parsowanie, sciezka, args.limit_slow, katalog)))
+        rozmiar = sum(rozmiar_katalogu(e.path) for e in os.scandir(katalog) if e.is_dir())
+    finally:
+        shutil.rmtree(katalog)
+
+    print("=" * 64)
+    print(f"{'uruchomienie':<30}{'tokeny':>10}{'czas [s]':>12}{'RSS [MB]':>12}")
+    print("=" * 64)
+    for nazwa, pomiar in pomiary:
+        print(f"{nazwa:<30}{pomiar['wynik']:>10,}{pomiar['czas_s']:>12.2f}{pomiar['szczyt_rss_mb']:>12.0f}")
+    print("=" * 64)
+    print(f"Rozmiar wpisu w pamięci: {rozmiar / 1024 / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
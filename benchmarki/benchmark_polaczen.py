@@ -0,0 +1,88 @@
+import os
+import argparse
+import contextlib
+from collections import defaultdict
+
+import numpy as np
+
+from pomiar import dodaj_sciezke_projektu, zmierz_w_procesie
+
+dodaj_sciezke_projektu('projekt_3')
+
+from analiza_semantyczna import AnalizaSemanyczna
+from potok_spacy import KolumnyParsowania
+
+
+def kolumny_syntetyczne(tokeny: int, typy: int, ziarno: int = 0) -> KolumnyParsowania:
+    # Tokeny o rozkładzie Zipfa z jedną częścią mowy na słowo (NOUN / ADJ / VERB / inne)
+    rng = np.random.default_rng(ziarno)
+    ids = ((rng.zipf(1.1, tokeny) - 1) % typy).astype(np.int32)
+    pos_slow = rng.choice(4, size=typy, p=[0.4, 0.2, 0.2, 0.2]).astype(np.uint8)
+    slownik = [f"slowo{i}" for i in range(typy)]
+    return KolumnyParsowania(slownik, ids, pos_slow[ids], ['NOUN', 'ADJ', 'VERB', 'X'])
+
+
+def polaczenia_slownikowe(tokeny: int, typy: int, top_n: int):
+    # Punkt odniesienia: zagnieżdżone defaultdict wypełniane token po tokenie, krawędzie grafu
+    # i macierz z podwójnych pętli po listach top, listy sortowane słownik po słowniku
+    analiza = AnalizaSemanyczna('')
+    analiza.kolumny = kolumny_syntetyczne(tokeny, typy)
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        analiza.analiza_pos(top_n=top_n)
+    k = analiza.kolumny
+    slowa = [k.slownik[i] for i in k.ids.tolist()]
+    tagi = [k.nazwy_pos[p] for p in k.pos.tolist()]
+    rzeczowniki, przymiotniki = set(analiza.rzeczowniki), set(analiza.przymiotniki)
+
+    polaczenia = defaultdict(lambda: defaultdict(int))
+    for i in range(1, len(slowa)):
+        if tagi[i] == 'NOUN' and tagi[i - 1] == 'ADJ' and slowa[i] in rzeczowniki and slowa[i - 1] in przymiotniki:
+            polaczenia[slowa[i - 1]][slowa[i]] += 1
+
+    krawedzie = [(a, b, polaczenia[a][b]) for a in analiza.przymiotniki if a in polaczenia
+                 for b in analiza.rzeczowniki if polaczenia[a].get(b, 0) > 0]
+    matrix = np.zeros((50, 50))
+    for i, a in enumerate(analiza.przymiotniki[:50]):
+        if a in polaczenia:
+            for j, b in enumerate(analiza.rzeczowniki[:50]):
+                matrix[i, j] = polaczenia[a].get(b, 0)
+    wiersze = sum(len(sorted(polaczenia[a].items(), key=lambda x: x[1], reverse=True))
+                  for a in analiza.przymiotniki if a in polaczenia)
+    return len(krawedzie), wiersze
+
+
+def polaczenia_macierzowe(tokeny: int, typy: int, top_n: int):
+    analiza = AnalizaSemanyczna('')
+    analiza.kolumny = kolumny_syntetyczne(tokeny, typy)
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        analiza.analiza_pos(top_n=top_n)
+    with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+        analiza.znajdz_polaczenia()
+    polaczenia = analiza.polaczenia_adj_noun
+    krawedzie = polaczenia.krawedzie(top_n, top_n)
+    polaczenia.gesta(50, 50).astype(np.float64)
+    wiersze = sum(len(polaczenia.wiersz(i)[0]) for i in polaczenia.niepuste_wiersze().tolist())
+    return len(krawedzie), wiersze
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark połączeń przymiotnik-rzeczownik: '
+                                                 'zagnieżdżone słowniki vs macierz rzadka (MacierzPolaczen)')
+    parser.add_argument('--tokeny', type=int, default=2_000_000)
+    parser.add_argument('--typy', type=int, default=200_000)
+    parser.add_argument('--top', type=int, nargs='+', default=[100, 1000, 10000])
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print(f"{'metoda':<24}{'top':>8}{'krawędzie':>12}{'czas [s]':>10}{'RSS [MB]':>10}")
+    print("=" * 70)
+    for top_n in args.top:
+        for nazwa, funkcja in (('defaultdict', polaczenia_slownikowe), ('MacierzPolaczen', polaczenia_macierzowe)):
+            pomiar = zmierz_w_procesie(funkcja, args.tokeny, args.typy, top_n)
+            krawedzie, _ = pomiar['wynik']
+            print(f"{nazwa:<24}{top_n:>8}{krawedzie:>12,}{pomiar['czas_s']:>10.2f}{pomiar['szczyt_rss_mb']:>10.0f}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
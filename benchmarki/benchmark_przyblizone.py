@@ -0,0 +1,71 @@
+import argparse
+import numpy as np
+
+from pomiar import dodaj_sciezke_projektu, zmierz_w_procesie
+from generator_korpusu import korpus_zipfa
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+TOP = 1000
+
+
+def najczestsze_pary(analiza: AnalizaKorpusu, n: int) -> dict:
+    s = analiza.sasiedztwo
+    kolejnosc = np.argsort(-s.wagi, kind='stable')[:n]
+    klucze = s.klucze[kolejnosc]
+    slowo1 = (klucze >> np.uint64(32)).astype(np.int64).tolist()
+    slowo2 = (klucze & np.uint64(0xFFFFFFFF)).astype(np.int64).tolist()
+    return {(analiza.slownik[a], analiza.slownik[b]): w for a, b, w in zip(slowo1, slowo2, s.wagi[kolejnosc].tolist())}
+
+
+def dokladne(sciezka: str):
+    analiza = AnalizaKorpusu(sciezka)
+    analiza.zlicz_rownolegle(liczba_procesow=1)
+    analiza.oblicz_statystyki()
+    slowa = dict(zip(analiza.tabela.wyrazy[:TOP].tolist(), analiza.tabela.f[:TOP].tolist()))
+    return slowa, najczestsze_pary(analiza, TOP)
+
+
+def przyblizone(sciezka: str, pojemnosc: int):
+    analiza = AnalizaKorpusu(sciezka)
+    analiza.zlicz_przyblizone(pojemnosc=pojemnosc)
+    slowa = dict(zip(analiza.tabela.wyrazy[:TOP].tolist(), analiza.tabela.f[:TOP].tolist()))
+    return slowa, najczestsze_pary(analiza, TOP)
+
+
+def porownaj(wzorzec: dict, wynik: dict):
+    # Trafność top-N i maksymalny błąd względny częstości wspólnych elementów
+    wspolne = set(wzorzec) & set(wynik)
+    blad = max((abs(wynik[x] - wzorzec[x]) / wzorzec[x] for x in wspolne), default=0.0)
+    return len(wspolne) / len(wzorzec), blad
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark trybu przybliżonego (Space-Saving) vs zliczanie dokładne')
+    parser.add_argument('--tokeny', type=int, default=10_000_000)
+    parser.add_argument('--pojemnosci', type=int, nargs='+', default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    sciezka = korpus_zipfa(args.tokeny)
+    wzorzec = zmierz_w_procesie(dokladne, sciezka)
+    slowa_wzorcowe, pary_wzorcowe = wzorzec['wynik']
+
+    print("=" * 88)
+    print(f"{'tryb':<22}{'czas [s]':>10}{'RSS [MB]':>10}{f'słowa top {TOP}':>16}{'błąd':>8}"
+          f"{f'pary top {TOP}':>14}{'błąd':>8}")
+    print("=" * 88)
+    print(f"{'dokładny':<22}{wzorzec['czas_s']:>10.2f}{wzorzec['szczyt_rss_mb']:>10.0f}{1:>16.3f}{0:>8.3f}{1:>14.3f}{0:>8.3f}")
+    for pojemnosc in args.pojemnosci:
+        pomiar = zmierz_w_procesie(przyblizone, sciezka, pojemnosc)
+        slowa, pary = pomiar['wynik']
+        trafnosc_slow, blad_slow = porownaj(slowa_wzorcowe, slowa)
+        trafnosc_par, blad_par = porownaj(pary_wzorcowe, pary)
+        print(f"{f'przybliżony k={pojemnosc:,}':<22}{pomiar['czas_s']:>10.2f}{pomiar['szczyt_rss_mb']:>10.0f}"
+              f"{trafnosc_slow:>16.3f}{blad_slow:>8.3f}{trafnosc_par:>14.3f}{blad_par:>8.3f}")
+    print("=" * 88)
+
+
+if __name__ == "__main__":
+    main()
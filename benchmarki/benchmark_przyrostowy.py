@@ -0,0 +1,71 @@
+import os
+import shutil
+import argparse
+import tempfile
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, zmierz_w_procesie, korpus_powielony
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def pelne_przeliczenie(sciezka: str, min_czestotliwosc: int):
+    analiza = AnalizaKorpusu(sciezka)
+    analiza.zlicz_rownolegle(liczba_procesow=1)
+    analiza.oblicz_statystyki()
+    analiza.odciecie_90_procent()
+    return len(analiza.generuj_graf_sasiedztwa(min_czestotliwosc))
+
+
+def aktualizacja(sciezka: str, min_czestotliwosc: int, katalog_stanu: str):
+    analiza = AnalizaKorpusu(sciezka)
+    analiza.aktualizuj_przyrostowo(min_czestotliwosc, 1, katalog_stanu)
+    analiza.odciecie_90_procent()
+    return len(analiza.macierz_sasiedztwa)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark aktualizacji przyrostowej po dopisaniu tekstu')
+    parser.add_argument('--rozmiar-mb', type=int, default=100)
+    parser.add_argument('--przyrost-mb', type=int, default=1)
+    parser.add_argument('--min-czestotliwosc', type=int, default=3)
+    args = parser.parse_args()
+
+    zrodlo = os.path.join(KATALOG_REPO, 'projekt_1', 'corpus', 'corpus.txt')
+    katalog = tempfile.mkdtemp()
+    sciezka = os.path.join(katalog, 'korpus.txt')
+    katalog_stanu = os.path.join(katalog, 'stan')
+    shutil.copyfile(korpus_powielony(
+        zrodlo,
+        os.path.join(tempfile.gettempdir(), f'korpus_{args.rozmiar_mb}mb.txt'),
+        args.rozmiar_mb
+    ), sciezka)
+    przyrost = korpus_powielony(
+        zrodlo,
+        os.path.join(tempfile.gettempdir(), f'korpus_{args.przyrost_mb}mb.txt'),
+        args.przyrost_mb
+    )
+
+    print("=" * 60)
+    print(f"{'etap':<22}{'krawędzie':>12}{'czas [s]':>12}{'RSS [MB]':>12}")
+    print("=" * 60)
+
+    def wypisz(nazwa, pomiar):
+        print(f"{nazwa:<22}{pomiar['wynik']:>12,}{pomiar['czas_s']:>12.2f}{pomiar['szczyt_rss_mb']:>12.0f}")
+
+    wypisz('stan początkowy', zmierz_w_procesie(aktualizacja, sciezka, args.min_czestotliwosc, katalog_stanu))
+
+    with open(sciezka, 'ab') as cel, open(przyrost, 'rb') as dopisek:
+        shutil.copyfileobj(dopisek, cel)
+
+    wypisz(f'przyrost {args.przyrost_mb} MB', zmierz_w_procesie(aktualizacja, sciezka, args.min_czestotliwosc, katalog_stanu))
+    wypisz('bez zmian', zmierz_w_procesie(aktualizacja, sciezka, args.min_czestotliwosc, katalog_stanu))
+    wypisz('pełne przeliczenie', zmierz_w_procesie(pelne_przeliczenie, sciezka, args.min_czestotliwosc))
+    print("=" * 60)
+
+    shutil.rmtree(katalog)
+
+
+if __name__ == "__main__":
+    main()
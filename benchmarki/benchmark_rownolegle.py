@@ -0,0 +1,46 @@
+import os
+import time
+import argparse
+import tempfile
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, korpus_powielony
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Skalowanie zliczania równoległego z liczbą procesów')
+    parser.add_argument('--rozmiar-mb', type=int, default=200)
+    parser.add_argument('--procesy', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--fragment-mb', type=int, default=8)
+    args = parser.parse_args()
+    
+    zrodlo = os.path.join(KATALOG_REPO, 'projekt_1', 'corpus', 'corpus.txt')
+    sciezka = korpus_powielony(
+        zrodlo,
+        os.path.join(tempfile.gettempdir(), f'korpus_{args.rozmiar_mb}mb.txt'),
+        args.rozmiar_mb
+    )
+    print(f"Korpus: {sciezka} ({os.path.getsize(sciezka) / 1024 / 1024:.0f} MB), "
+          f"rdzenie: {os.cpu_count()}")
+    
+    wyniki = []
+    for procesy in args.procesy:
+        analiza = AnalizaKorpusu(sciezka)
+        start = time.perf_counter()
+        analiza.zlicz_rownolegle(liczba_procesow=procesy, rozmiar_fragmentu=args.fragment_mb * 1024 * 1024)
+        wyniki.append((procesy, time.perf_counter() - start))
+    
+    print("=" * 50)
+    print(f"{'procesy':>10}{'czas [s]':>15}{'przyspieszenie':>20}")
+    print("=" * 50)
+    for procesy, czas in wyniki:
+        print(f"{procesy:>10}{czas:>15.2f}{wyniki[0][1] / czas:>19.2f}x")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
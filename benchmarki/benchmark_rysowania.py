@@ -0,0 +1,71 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+
+from pomiar import dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_1')
+
+import numpy as np
+import networkx as nx
+import wykresy_korpusu
+from wykresy_korpusu import rysuj_zipfa, rysuj_graf_sasiedztwa
+from wspolne.renderowanie import KolejkaRysunkow, ustaw_tryb_wsadowy, uklad_sprezynowy
+
+ustaw_tryb_wsadowy()
+
+
+def czas(funkcja, *args) -> float:
+    start = time.perf_counter()
+    funkcja(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark renderowania wykresów w trybie wsadowym')
+    parser.add_argument('--typy', type=int, default=3_000_000, help='liczba rang na wykresie Zipfa')
+    parser.add_argument('--wezly', type=int, default=300, help='liczba węzłów grafu sąsiedztwa')
+    parser.add_argument('--procesy', type=int, default=None)
+    parser.add_argument('--dpi', type=int, default=300)
+    args = parser.parse_args()
+
+    katalog = tempfile.mkdtemp()
+    katalog_ukladow = os.path.join(katalog, 'uklady')
+    r = np.arange(1, args.typy + 1)
+    f = (1e7 / r).astype(np.int64) + 1
+
+    G = nx.gnm_random_graph(args.wezly, args.wezly * 10, seed=1)
+    G = nx.relabel_nodes(G, {i: f'w{i}' for i in G.nodes()})
+    stopnie = dict(G.degree())
+
+    print("=" * 60)
+    print(f"{'etap':<40}{'czas [s]':>12}")
+    print("=" * 60)
+
+    probkuj = wykresy_korpusu.probkuj_logarytmicznie
+    wykresy_korpusu.probkuj_logarytmicznie = lambda r, f: (r, f)
+    print(f"{'Zipf, wszystkie rangi':<40}{czas(rysuj_zipfa, r, f, os.path.join(katalog, 'z.png'), args.dpi):>12.2f}")
+    wykresy_korpusu.probkuj_logarytmicznie = probkuj
+    print(f"{'Zipf, przedziały logarytmiczne':<40}{czas(rysuj_zipfa, r, f, os.path.join(katalog, 'z.png'), args.dpi):>12.2f}")
+
+    uklad = lambda: uklad_sprezynowy(G, k=0.5, iterations=50, seed=42, katalog=katalog_ukladow)
+    print(f"{'spring_layout, pierwszy raz':<40}{czas(uklad):>12.3f}")
+    print(f"{'spring_layout, z pamięci':<40}{czas(uklad):>12.3f}")
+
+    def zadania(kolejka):
+        for i in range(4):
+            kolejka.dodaj(rysuj_zipfa, r, f, os.path.join(katalog, f'z{i}.png'), args.dpi)
+            kolejka.dodaj(rysuj_graf_sasiedztwa, G, stopnie, args.wezly, os.path.join(katalog, f'g{i}.png'), args.dpi)
+        return kolejka
+
+    print(f"{'8 rysunków szeregowo':<40}{czas(zadania(KolejkaRysunkow()).renderuj, 1):>12.2f}")
+    print(f"{'8 rysunków w puli procesów':<40}{czas(zadania(KolejkaRysunkow()).renderuj, args.procesy):>12.2f}")
+    print("=" * 60)
+
+    shutil.rmtree(katalog)
+
+
+if __name__ == "__main__":
+    main()
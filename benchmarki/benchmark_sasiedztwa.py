@@ -0,0 +1,62 @@
+import os
+import re
+import argparse
+import tempfile
+from collections import defaultdict
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, zmierz_w_procesie, korpus_powielony
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def graf_slownikowy(sciezka: str, min_czestotliwosc: int):
+    # Poprzednia implementacja generuj_graf_sasiedztwa (bez budowy nx.Graph)
+    with open(sciezka, 'r', encoding='utf-8') as f:
+        tekst = f.read()
+    
+    pary = defaultdict(int)
+    for zdanie in re.split(r'[.!?]+', tekst):
+        slowa_zdania = re.sub(r'[^\w\s]', ' ', zdanie.lower()).split()
+        for i in range(len(slowa_zdania) - 1):
+            slowo1, slowo2 = slowa_zdania[i], slowa_zdania[i + 1]
+            if slowo1 and slowo2 and len(slowo1) > 1 and len(slowo2) > 1:
+                pary[tuple(sorted([slowo1, slowo2]))] += 1
+    return sum(1 for waga in pary.values() if waga >= min_czestotliwosc)
+
+
+def graf_rzadki(sciezka: str, min_czestotliwosc: int):
+    analiza = AnalizaKorpusu(sciezka)
+    macierz = analiza.generuj_graf_sasiedztwa(min_czestotliwosc)
+    macierz.macierz
+    return len(macierz)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark zliczania par sąsiednich słów')
+    parser.add_argument('--rozmiar-mb', type=int, default=200)
+    parser.add_argument('--min-czestotliwosc', type=int, default=3)
+    args = parser.parse_args()
+    
+    zrodlo = os.path.join(KATALOG_REPO, 'projekt_1', 'corpus', 'corpus.txt')
+    sciezka = korpus_powielony(
+        zrodlo,
+        os.path.join(tempfile.gettempdir(), f'korpus_{args.rozmiar_mb}mb.txt'),
+        args.rozmiar_mb
+    )
+    # Kompilacja magazynu poza pomiarem
+    AnalizaKorpusu(sciezka).otworz_magazyn()
+    
+    print("=" * 60)
+    print(f"{'metoda':<14}{'krawędzie':>12}{'czas [s]':>12}{'RSS [MB]':>12}{'przyrost':>10}")
+    print("=" * 60)
+    for nazwa, funkcja in [('defaultdict', graf_slownikowy), ('CSR', graf_rzadki)]:
+        pomiar = zmierz_w_procesie(funkcja, sciezka, args.min_czestotliwosc)
+        print(f"{nazwa:<14}{pomiar['wynik']:>12,}{pomiar['czas_s']:>12.2f}"
+              f"{pomiar['szczyt_rss_mb']:>12.0f}{pomiar['przyrost_rss_mb']:>10.0f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
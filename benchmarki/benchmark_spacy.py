@@ -0,0 +1,71 @@
+import os
+import sys
+import time
+import argparse
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_3')
+
+from analiza_semantyczna import AnalizaSemanyczna, MODEL_SPACY
+from potok_spacy import PROFILE_POTOKU, PROFIL, zaladuj_model, podziel_tekst
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Przepustowość spaCy: profile potoku (dokumenty/s) '
+                                                 'i parsowanie (parsuj, nlp.pipe) z liczbą procesów')
+    parser.add_argument('--model', default=MODEL_SPACY, help='nazwa pakietu lub katalog modelu')
+    parser.add_argument('--limit-slow', type=int, default=100_000)
+    parser.add_argument('--profile', nargs='+', choices=list(PROFILE_POTOKU), default=list(PROFILE_POTOKU))
+    parser.add_argument('--procesy', type=int, nargs='+',
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    parser.add_argument('--fragment', type=int, default=20_000, help='rozmiar fragmentu tekstu (znaki)')
+    args = parser.parse_args()
+
+    import spacy
+    if not os.path.isdir(args.model) and not spacy.util.is_package(args.model):
+        print(f"Brak modelu {args.model} (python -m spacy download {args.model})")
+        sys.exit(1)
+
+    sciezka = os.path.join(KATALOG_REPO, 'projekt_3', 'corpus', 'corpus.txt')
+    wzorzec = AnalizaSemanyczna(sciezka)
+    tekst = wzorzec.wczytaj_korpus(args.limit_slow)
+    fragmenty = list(podziel_tekst(tekst, args.fragment))
+    slowa = len(tekst.split())
+
+    print("=" * 102)
+    print(f"{'profil':<12}{'składniki':<56}{'ładowanie [s]':>14}{'dok./s':>8}{'słowa/s':>12}")
+    print("=" * 102)
+    for profil in args.profile:
+        start = time.perf_counter()
+        nlp = zaladuj_model(args.model, profil)
+        ladowanie = time.perf_counter() - start
+
+        start = time.perf_counter()
+        liczba_dokumentow = sum(1 for _ in nlp.pipe(fragmenty, batch_size=32))
+        czas = time.perf_counter() - start
+        print(f"{profil:<12}{','.join(nlp.pipe_names):<56}{ladowanie:>14.2f}"
+              f"{liczba_dokumentow / czas:>8.1f}{slowa / czas:>12,.0f}")
+    print("=" * 102)
+
+    wyniki = []
+    for procesy in args.procesy:
+        analiza = AnalizaSemanyczna(sciezka, liczba_procesow=procesy, rozmiar_fragmentu=args.fragment,
+                                    uzyj_pamieci=False)
+        analiza.model = args.model
+        analiza.zaladuj_spacy()
+        start = time.perf_counter()
+        analiza.parsuj(tekst)
+        wyniki.append((procesy, time.perf_counter() - start))
+
+    print("=" * 60)
+    print(f"{'procesy':>10}{'czas [s]':>12}{'słowa/s':>16}{'przyspieszenie':>20}")
+    print("=" * 60)
+    for procesy, czas in wyniki:
+        print(f"{procesy:>10}{czas:>12.2f}{slowa / czas:>16,.0f}{wyniki[0][1] / czas:>19.2f}x")
+    print("=" * 60)
+    print(f"Parsowanie z profilem '{PROFIL}', {len(fragmenty)} fragmentów po {args.fragment:,} znaków")
+
+
+if __name__ == "__main__":
+    main()
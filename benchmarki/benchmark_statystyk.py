@@ -0,0 +1,93 @@
+import time
+import argparse
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from pomiar import dodaj_sciezke_projektu
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def tokeny_zipfa(liczba_typow: int, skala: int, seed: int = 42):
+    # Typ o randze r występuje skala // r + 1 razy - każdy typ co najmniej raz
+    liczniki = skala // np.arange(1, liczba_typow + 1) + 1
+    tokeny = np.repeat(np.arange(liczba_typow, dtype=np.uint32), liczniki)
+    np.random.default_rng(seed).shuffle(tokeny)
+    
+    # Identyfikatory w kolejności pierwszego wystąpienia, jak w magazynie korpusu
+    _, pierwsze = np.unique(tokeny, return_index=True)
+    nowe_id = np.empty(liczba_typow, dtype=np.uint32)
+    nowe_id[np.argsort(pierwsze)] = np.arange(liczba_typow, dtype=np.uint32)
+    tokeny = nowe_id[tokeny]
+    slownik = [f"w{i}" for i in range(liczba_typow)]
+    return slownik, tokeny
+
+
+def stara_tabela(slowa):
+    # Poprzednie oblicz_statystyki + odciecie_90_procent
+    posortowane = Counter(slowa).most_common()
+    dane = []
+    for ranga, (wyraz, czestotliwosc) in enumerate(posortowane, start=1):
+        dane.append({'wyraz': wyraz, 'r': ranga, 'f': czestotliwosc, 'r*f': ranga * czestotliwosc})
+    df = pd.DataFrame(dane)
+    
+    czas_tabeli = time.perf_counter()
+    prog_90 = 0.9 * df['f'].sum()
+    suma_kumulatywna = 0
+    pozycja_odciecia = 0
+    for idx, row in df.iterrows():
+        suma_kumulatywna += row['f']
+        if suma_kumulatywna >= prog_90:
+            pozycja_odciecia = idx + 1
+            break
+    return df, pozycja_odciecia, czas_tabeli
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark tabeli częstotliwości i odcięcia 90%')
+    parser.add_argument('--typy', type=int, default=1_000_000)
+    parser.add_argument('--skala', type=int, default=1_000_000)
+    parser.add_argument('--bez-starej', action='store_true', help='pomiń poprzednią implementację')
+    args = parser.parse_args()
+    
+    slownik, tokeny = tokeny_zipfa(args.typy, args.skala)
+    print(f"Typy: {args.typy:,}, tokeny: {len(tokeny):,}")
+    print("=" * 70)
+    
+    analiza = AnalizaKorpusu('')
+    analiza.slownik, analiza.tokeny = slownik, tokeny
+    
+    start = time.perf_counter()
+    df_nowa = analiza.oblicz_statystyki()
+    czas_tabeli = time.perf_counter() - start
+    start = time.perf_counter()
+    pozycja_nowa, _ = analiza.odciecie_90_procent()
+    czas_odciecia = time.perf_counter() - start
+    start = time.perf_counter()
+    odciecia = analiza.tabela.odciecia([0.5, 0.8, 0.9, 0.99])
+    czas_poziomow = time.perf_counter() - start
+    
+    wyniki = [('kolumnowa', czas_tabeli, czas_odciecia)]
+    
+    if not args.bez_starej:
+        slowa = analiza.slowa
+        start = time.perf_counter()
+        df_stara, pozycja_stara, czas_posredni = stara_tabela(slowa)
+        koniec = time.perf_counter()
+        wyniki.append(('lista słowników', czas_posredni - start, koniec - czas_posredni))
+        assert pozycja_stara == pozycja_nowa
+        assert df_stara.equals(df_nowa)
+    
+    print("=" * 70)
+    print(f"{'metoda':<20}{'tabela [s]':>15}{'odcięcie 90% [s]':>20}")
+    for nazwa, tabela, odciecie in wyniki:
+        print(f"{nazwa:<20}{tabela:>15.3f}{odciecie:>20.4f}")
+    print(f"\nOdcięcia {odciecia} w jednym wywołaniu: {czas_poziomow * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
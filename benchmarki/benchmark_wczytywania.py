@@ -0,0 +1,73 @@
+import os
+import re
+import argparse
+import tempfile
+
+from pomiar import KATALOG_REPO, dodaj_sciezke_projektu, zmierz_w_procesie, korpus_powielony
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def wczytaj_pelny_odczyt(sciezka: str, limit_slow):
+    # Poprzednia implementacja AnalizaKorpusu.wczytaj_korpus
+    with open(sciezka, 'r', encoding='utf-8') as f:
+        tekst = f.read()
+    
+    slowa_raw = re.findall(r'\b[a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ]+\b', tekst.lower())
+    slowa_filtrowane = [
+        slowo for slowo in slowa_raw
+        if len(slowo) > 1 or slowo in ['i', 'a']
+    ]
+    return len(slowa_filtrowane[:limit_slow])
+
+
+def wczytaj_strumieniowo(sciezka: str, limit_slow):
+    analiza = AnalizaKorpusu(sciezka, uzyj_magazynu=False)
+    analiza.wczytaj_korpus(limit_slow=limit_slow)
+    return len(analiza.tokeny)
+
+
+def wczytaj_z_magazynu(sciezka: str, limit_slow):
+    analiza = AnalizaKorpusu(sciezka)
+    analiza.wczytaj_korpus(limit_slow=limit_slow)
+    return len(analiza.tokeny)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark wczytywania korpusu (czas i szczytowe RSS)')
+    parser.add_argument('--rozmiar-mb', type=int, default=200)
+    parser.add_argument('--limity', type=int, nargs='+', default=[100000, 0],
+                        help='0 oznacza brak limitu')
+    args = parser.parse_args()
+    
+    zrodlo = os.path.join(KATALOG_REPO, 'projekt_1', 'corpus', 'corpus.txt')
+    sciezka = korpus_powielony(
+        zrodlo,
+        os.path.join(tempfile.gettempdir(), f'korpus_{args.rozmiar_mb}mb.txt'),
+        args.rozmiar_mb
+    )
+    
+    print(f"Korpus: {sciezka} ({os.path.getsize(sciezka) / 1024 / 1024:.0f} MB)")
+    # Kompilacja magazynu poza pomiarem - mierzony jest odczyt "na ciepło"
+    zmierz_w_procesie(wczytaj_z_magazynu, sciezka, 0)
+    
+    print("=" * 78)
+    print(f"{'metoda':<14}{'limit':>12}{'słowa':>14}{'czas [s]':>12}{'RSS [MB]':>12}{'przyrost':>12}")
+    print("=" * 78)
+    
+    for limit in args.limity:
+        limit_slow = limit or None
+        for nazwa, funkcja in [('pełny odczyt', wczytaj_pelny_odczyt),
+                               ('strumień', wczytaj_strumieniowo),
+                               ('magazyn', wczytaj_z_magazynu)]:
+            pomiar = zmierz_w_procesie(funkcja, sciezka, limit_slow)
+            print(f"{nazwa:<14}{str(limit_slow):>12}{pomiar['wynik']:>14,}"
+                  f"{pomiar['czas_s']:>12.2f}{pomiar['szczyt_rss_mb']:>12.0f}"
+                  f"{pomiar['przyrost_rss_mb']:>12.0f}")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import math
+import argparse
+from collections import Counter
+
+from pomiar import dodaj_sciezke_projektu, zmierz_w_procesie
+from generator_korpusu import korpus_zipfa
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def wspolwystepowanie_slownikowe(sciezka: str, okno: int, min_czestotliwosc: int):
+    # Punkt odniesienia: Counter par z przesuwanego okna i PPMI liczone parami w Pythonie
+    magazyn = AnalizaKorpusu(sciezka).otworz_magazyn()
+    slownik = magazyn.slownik
+    tokeny = magazyn.tokeny.tolist()
+    granice = magazyn.poczatki_zdan.tolist() + [len(tokeny)]
+
+    pary = Counter()
+    for poczatek, koniec in zip(granice[:-1], granice[1:]):
+        zdanie = [slownik[t] for t in tokeny[poczatek:koniec]]
+        for i, slowo1 in enumerate(zdanie):
+            if len(slowo1) < 2:
+                continue
+            for slowo2 in zdanie[i + 1:i + 1 + okno]:
+                if len(slowo2) > 1:
+                    pary[tuple(sorted([slowo1, slowo2]))] += 1
+
+    wiersze = Counter()
+    for (slowo1, slowo2), liczba in pary.items():
+        wiersze[slowo1] += liczba
+        wiersze[slowo2] += liczba
+    n = 2 * sum(pary.values())
+    krawedzie = {}
+    for (slowo1, slowo2), liczba in pary.items():
+        if liczba >= min_czestotliwosc:
+            k11 = liczba * (2 if slowo1 == slowo2 else 1)
+            pmi = math.log(k11 * n / (wiersze[slowo1] * wiersze[slowo2]))
+            if pmi > 0:
+                krawedzie[(slowo1, slowo2)] = pmi
+    return len(krawedzie)
+
+
+def wspolwystepowanie_rzadkie(sciezka: str, okno: int, min_czestotliwosc: int, miara: str = 'ppmi'):
+    analiza = AnalizaKorpusu(sciezka)
+    return len(analiza.generuj_graf_wspolwystepowania(okno, miara, min_czestotliwosc))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark współwystępowania w oknie ±k z miarami PMI/PPMI/LLR')
+    parser.add_argument('--tokeny', type=int, default=1_000_000)
+    parser.add_argument('--okna', type=int, nargs='+', default=[2, 5])
+    parser.add_argument('--min-czestotliwosc', type=int, default=5)
+    args = parser.parse_args()
+
+    sciezka = korpus_zipfa(args.tokeny)
+    # Kompilacja magazynu poza pomiarem
+    AnalizaKorpusu(sciezka).otworz_magazyn()
+
+    print("=" * 64)
+    print(f"{'metoda':<26}{'okno':>6}{'krawędzie':>12}{'czas [s]':>10}{'RSS [MB]':>10}")
+    print("=" * 64)
+    for okno in args.okna:
+        metody = [('Counter + PPMI', wspolwystepowanie_slownikowe, ())]
+        metody += [(f'uint64 + {miara}', wspolwystepowanie_rzadkie, (miara,)) for miara in ('ppmi', 'llr')]
+        for nazwa, funkcja, dodatkowe in metody:
+            pomiar = zmierz_w_procesie(funkcja, sciezka, okno, args.min_czestotliwosc, *dodatkowe)
+            print(f"{nazwa:<26}{okno:>6}{pomiar['wynik']:>12,}{pomiar['czas_s']:>10.2f}{pomiar['szczyt_rss_mb']:>10.0f}")
+    print("=" * 64)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import os
+import shutil
+import argparse
+import tempfile
+
+from pomiar import dodaj_sciezke_projektu, zmierz_w_procesie
+from generator_korpusu import korpus_zipfa
+
+dodaj_sciezke_projektu('projekt_1')
+
+from analiza_korpusu import AnalizaKorpusu
+
+
+def przygotuj(sciezka: str, katalog: str) -> str:
+    # Wyniki zapisywane obok kopii korpusu: katalog/analiza_czestotliwosci.csv i katalog/wyniki/
+    os.makedirs(os.path.join(katalog, 'corpus'), exist_ok=True)
+    kopia = os.path.join(katalog, 'corpus', 'corpus.txt')
+    os.symlink(sciezka, kopia)
+    analiza = AnalizaKorpusu(kopia)
+    analiza.zlicz_rownolegle(liczba_procesow=1)
+    analiza.oblicz_statystyki()
+    analiza.generuj_graf_sasiedztwa(3)
+    analiza.zapisz_wyniki()
+    return kopia
+
+
+def wczytaj_csv(katalog: str) -> int:
+    import pandas as pd
+    df = pd.read_csv(os.path.join(katalog, 'analiza_czestotliwosci.csv'), keep_default_na=False)
+    return len(df)
+
+
+def wczytaj_kolumnowo(katalog: str, mmap: bool) -> int:
+    analiza = AnalizaKorpusu.z_wynikow(os.path.join(katalog, 'wyniki'), mmap)
+    return len(analiza.tabela) + len(analiza.macierz_sasiedztwa)
+
+
+def odciecie_z_wynikow(katalog: str) -> int:
+    # Zapytanie bez przeliczania: odcięcie 90% i top krawędzie grafu
+    analiza = AnalizaKorpusu.z_wynikow(os.path.join(katalog, 'wyniki'))
+    analiza.odciecie_90_procent()
+    return int(analiza.macierz_sasiedztwa.wagi.max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark wczytania wyników: CSV vs pliki kolumnowe .npy')
+    parser.add_argument('--tokeny', type=int, default=10_000_000)
+    args = parser.parse_args()
+
+    katalog = tempfile.mkdtemp()
+    zmierz_w_procesie(przygotuj, korpus_zipfa(args.tokeny), katalog)
+
+    print("=" * 60)
+    print(f"{'wczytanie':<26}{'wiersze':>12}{'czas [s]':>10}{'RSS [MB]':>12}")
+    print("=" * 60)
+    for nazwa, funkcja, argumenty in [
+        ('CSV (tylko tabela)', wczytaj_csv, (katalog,)),
+        ('z_wynikow (memmap)', wczytaj_kolumnowo, (katalog, True)),
+        ('z_wynikow (pełny odczyt)', wczytaj_kolumnowo, (katalog, False)),
+        ('z_wynikow + odcięcie 90%', odciecie_z_wynikow, (katalog,)),
+    ]:
+        pomiar = zmierz_w_procesie(funkcja, *argumenty)
+        print(f"{nazwa:<26}{pomiar['wynik']:>12,}{pomiar['czas_s']:>10.3f}{pomiar['szczyt_rss_mb']:>12.0f}")
+    print("=" * 60)
+
+    shutil.rmtree(katalog)
+
+
+if __name__ == "__main__":
+    main()
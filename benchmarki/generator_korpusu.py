@@ -0,0 +1,103 @@
+import os
+import re
+import argparse
+import tempfile
+import itertools
+from collections import Counter
+from typing import List, Optional
+
+import numpy as np
+
+from pomiar import KATALOG_REPO
+
+KORPUS_WZORCOWY = os.path.join(KATALOG_REPO, 'projekt_1', 'corpus', 'corpus.txt')
+ROZMIAR_PACZKI = 1_000_000
+SPOLGLOSKI = 'bcdfghjklmnprstwz'
+SAMOGLOSKI = 'aeiou'
+ZAKONCZENIA = np.array(['. ', '. ', '. ', '. ', '. ', '. ', '. ', '? ', '! ', '.\n'], dtype=object)
+
+
+def slownik_syntetyczny(liczba_typow: int, zrodlo: str = KORPUS_WZORCOWY) -> List[str]:
+    # Najpierw prawdziwe słowa z korpusu wzorcowego (wg częstości - tagery POS widzą
+    # zwykły angielski), dalej wymyślone słowa z sylab spółgłoska+samogłoska
+    with open(zrodlo, 'r', encoding='utf-8') as f:
+        licznik = Counter(re.findall(r'[a-z]+', f.read().lower()))
+    slowa = [s for s, _ in licznik.most_common(liczba_typow)]
+
+    uzyte = set(slowa)
+    sylaby = [s + w for s in SPOLGLOSKI for w in SAMOGLOSKI]
+    for dlugosc in itertools.count(2):
+        for czesci in itertools.product(sylaby, repeat=dlugosc):
+            if len(slowa) >= liczba_typow:
+                return slowa
+            slowo = ''.join(czesci)
+            if slowo not in uzyte:
+                slowa.append(slowo)
+    return slowa
+
+
+def domyslna_liczba_typow(liczba_tokenow: int) -> int:
+    # Przybliżenie prawa Heapsa: V ~ 30 * N^0.6
+    return max(10_000, int(30 * liczba_tokenow ** 0.6))
+
+
+def generuj_korpus(sciezka: str, liczba_tokenow: int, wykladnik: float = 1.1,
+                   liczba_typow: Optional[int] = None, ziarno: int = 0,
+                   srednia_dlugosc_zdania: float = 15.0) -> str:
+    # Tokeny losowane z rozkładu Zipfa p(r) ~ r^-wykladnik, zdania o geometrycznej długości
+    # zakończone '.', '?' lub '!'; dla tych samych parametrów plik jest identyczny
+    liczba_typow = liczba_typow or domyslna_liczba_typow(liczba_tokenow)
+    slowa = np.array(slownik_syntetyczny(liczba_typow), dtype=object)
+    wielkie = np.array([s.capitalize() for s in slowa], dtype=object)
+
+    dystrybuanta = np.cumsum(np.arange(1, liczba_typow + 1, dtype=np.float64) ** -wykladnik)
+    dystrybuanta /= dystrybuanta[-1]
+    rng = np.random.default_rng(ziarno)
+
+    with open(sciezka + '.tmp', 'w', encoding='utf-8') as f:
+        for start in range(0, liczba_tokenow, ROZMIAR_PACZKI):
+            n = min(ROZMIAR_PACZKI, liczba_tokenow - start)
+            rangi = np.minimum(np.searchsorted(dystrybuanta, rng.random(n)), liczba_typow - 1)
+
+            dlugosci = rng.geometric(1 / srednia_dlugosc_zdania, size=n // 2 + 1)
+            konce = np.cumsum(dlugosci) - 1
+            konce = np.append(konce[konce < n - 1], n - 1)
+            poczatki = np.concatenate([[0], konce[:-1] + 1])
+
+            tokeny = slowa[rangi]
+            tokeny[poczatki] = wielkie[rangi[poczatki]]
+            separatory = np.full(n, ' ', dtype=object)
+            separatory[konce] = ZAKONCZENIA[rng.integers(0, len(ZAKONCZENIA), size=len(konce))]
+            f.write(''.join(tokeny + separatory))
+
+    os.replace(sciezka + '.tmp', sciezka)
+    return sciezka
+
+
+def korpus_zipfa(liczba_tokenow: int, wykladnik: float = 1.1, ziarno: int = 0,
+                 katalog: Optional[str] = None) -> str:
+    # Korpus w katalogu tymczasowym, generowany tylko raz dla danych parametrów
+    katalog = katalog or tempfile.gettempdir()
+    os.makedirs(katalog, exist_ok=True)
+    sciezka = os.path.join(katalog, f'korpus_zipf_{liczba_tokenow}_{wykladnik:g}_{ziarno}.txt')
+    if not os.path.exists(sciezka):
+        print(f"Generowanie korpusu: {liczba_tokenow:,} tokenów -> {sciezka}")
+        generuj_korpus(sciezka, liczba_tokenow, wykladnik, ziarno=ziarno)
+    return sciezka
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generator syntetycznych korpusów o rozkładzie Zipfa')
+    parser.add_argument('tokeny', type=int, nargs='+', help='liczby tokenów, np. 1000000 10000000 100000000')
+    parser.add_argument('--wykladnik', type=float, default=1.1)
+    parser.add_argument('--ziarno', type=int, default=0)
+    parser.add_argument('--katalog', default=None, help='katalog wyjściowy (domyślnie katalog tymczasowy)')
+    args = parser.parse_args()
+
+    for liczba in args.tokeny:
+        sciezka = korpus_zipfa(liczba, args.wykladnik, args.ziarno, args.katalog)
+        print(f"{sciezka}: {os.path.getsize(sciezka) / 1024**2:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
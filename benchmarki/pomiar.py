@@ -0,0 +1,74 @@
+import os
+import sys
+import time
+import multiprocessing as mp
+from typing import Callable, Dict, Any
+
+KATALOG_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if KATALOG_REPO not in sys.path:
+    sys.path.insert(0, KATALOG_REPO)
+
+from wspolne.metryki import szczyt_rss_mb, zeruj_szczyt_rss, szczyt_rss_od_zerowania_mb
+
+
+def dodaj_sciezke_projektu(nazwa_projektu: str) -> None:
+    sciezka = os.path.join(KATALOG_REPO, nazwa_projektu)
+    if sciezka not in sys.path:
+        sys.path.insert(0, sciezka)
+
+
+def zmierz_etap(nazwa: str, funkcja: Callable, *args, **kwargs) -> Dict[str, Any]:
+    # Czas, czas CPU i szczyt RSS jednego etapu w bieżącym procesie. Po wyzerowaniu
+    # VmHWM równa się bieżącemu RSS; bez zerowania (poza Linuksem) przyrost liczony
+    # jest względem dotychczasowego szczytu ru_maxrss
+    wyzerowano = zeruj_szczyt_rss()
+    rss_start = szczyt_rss_od_zerowania_mb() if wyzerowano else szczyt_rss_mb()
+    start, cpu_start = time.perf_counter(), time.process_time()
+    wynik = funkcja(*args, **kwargs)
+    czas, cpu = time.perf_counter() - start, time.process_time() - cpu_start
+    szczyt = szczyt_rss_od_zerowania_mb() if wyzerowano else szczyt_rss_mb()
+    return {
+        'etap': nazwa,
+        'czas_s': czas,
+        'cpu_s': cpu,
+        'szczyt_rss_mb': szczyt,
+        'przyrost_rss_mb': max(szczyt - rss_start, 0.0),
+        'wynik': wynik,
+    }
+
+
+def _uruchom(funkcja: Callable, args: tuple) -> Dict[str, Any]:
+    rss_start = szczyt_rss_mb()
+    start = time.perf_counter()
+    wynik = funkcja(*args)
+    czas = time.perf_counter() - start
+    rss_koniec = szczyt_rss_mb()
+    return {
+        'czas_s': czas,
+        'szczyt_rss_mb': rss_koniec,
+        'przyrost_rss_mb': rss_koniec - rss_start,
+        'wynik': wynik,
+    }
+
+
+def zmierz_w_procesie(funkcja: Callable, *args) -> Dict[str, Any]:
+    # Osobny proces na każdy pomiar - ru_maxrss jest szczytem całego procesu
+    ctx = mp.get_context('spawn')
+    with ctx.Pool(1) as pula:
+        return pula.apply(_uruchom, (funkcja, args))
+
+
+def korpus_powielony(sciezka_zrodla: str, sciezka_celu: str, rozmiar_mb: int) -> str:
+    with open(sciezka_zrodla, 'r', encoding='utf-8') as f:
+        tekst = f.read()
+    
+    if os.path.exists(sciezka_celu) and os.path.getsize(sciezka_celu) >= rozmiar_mb * 1024 * 1024:
+        return sciezka_celu
+    
+    with open(sciezka_celu, 'w', encoding='utf-8') as f:
+        zapisano = 0
+        while zapisano < rozmiar_mb * 1024 * 1024:
+            f.write(tekst)
+            f.write('\n')
+            zapisano += len(tekst.encode('utf-8')) + 1
+    return sciezka_celu
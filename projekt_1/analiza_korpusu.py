@@ -1,70 +1,236 @@
 import os
 import re
-from collections import Counter, defaultdict
-import pandas as pd
-import matplotlib.pyplot as plt
+import sys
+import json
+import argparse
+import contextlib
+from array import array
 import numpy as np
-import nltk
-import networkx as nx
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Iterator, Optional, TYPE_CHECKING
 
-# Pobierz zasoby NLTK
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt', quiet=True)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.magazyn_korpusu import MagazynKorpusu, czytaj_bloki, ROZMIAR_BLOKU
+from tabela_czestotliwosci import TabelaCzestotliwosci
+from zliczanie_rownolegle import zlicz_rownolegle, rozwin_zrodla, ROZMIAR_FRAGMENTU
+from macierz_sasiedztwa import MacierzSasiedztwa
+from miary_wspolwystepowania import wybierz_krawedzie, MIARY
+from stan_przyrostowy import StanKorpusu
+from najczestsze_przyblizone import StrumienNajczestszych, POJEMNOSC
+from tagi_pos import PamiecTagow
+from dopasowanie_zipfa import dopasuj_zipfa, WynikDopasowania, MIN_LICZBA_RANG
+from wyniki_kolumnowe import zapisz_kolumnowo, wczytaj_kolumnowo
+from wykresy_korpusu import rysuj_zipfa, rysuj_graf_sasiedztwa
+from wspolne.renderowanie import KolejkaRysunkow, ustaw_tryb_wsadowy
+from wspolne.metryki import Metryki, etap, parsuj_profilowanie
 
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger', quiet=True)
+# pandas, networkx, matplotlib i NLTK importowane dopiero przez etapy, które ich używają;
+# zasoby NLTK sprawdzane przy pierwszym tagowaniu (tagi_pos.py)
+if TYPE_CHECKING:
+    import pandas as pd
+    import networkx as nx
 
-try:
-    nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-except LookupError:
-    nltk.download('averaged_perceptron_tagger_eng', quiet=True)
+
+LITERY = 'a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ'
+WZORZEC_SLOWA = re.compile(rf'\b[{LITERY}]+\b')
+WZORZEC_WYRAZU = re.compile(rf'[{LITERY}]+')
+
+
+def czy_wyraz(slowo: str) -> bool:
+    return WZORZEC_WYRAZU.fullmatch(slowo) is not None and (len(slowo) > 1 or slowo in ['i', 'a'])
+
+
+def bloki_slow(sciezka: str, rozmiar_bloku: int = ROZMIAR_BLOKU) -> Iterator[List[str]]:
+    for blok in czytaj_bloki(sciezka, rozmiar_bloku):
+        yield [
+            slowo for slowo in WZORZEC_SLOWA.findall(blok.lower())
+            if len(slowo) > 1 or slowo in ['i', 'a']
+        ]
 
 
 class AnalizaKorpusu:
-    def __init__(self, sciezka_korpusu: str):
+    def __init__(self, sciezka_korpusu: str, uzyj_magazynu: bool = True):
         self.sciezka_korpusu = sciezka_korpusu
-        self.slowa = []
+        self.uzyj_magazynu = uzyj_magazynu
+        self.magazyn = None
+        self.slownik = []
+        self.tokeny = np.zeros(0, dtype=np.uint32)
+        self.liczniki = None
+        self.sasiedztwo = None
+        # Liczniki par w oknie ±k (k -> macierz), liczone przez zlicz_wspolwystepowania
+        self.wspolwystepowania: Dict[int, MacierzSasiedztwa] = {}
+        self.tabela = None
         self.df_analiza = None
-        self.graf_sasiedztwa = None
-        
-    def wczytaj_korpus(self, limit_slow=100000) -> None:
+        self.macierz_sasiedztwa = None
+        self._graf_sasiedztwa = None
+        self.pamiec_tagow = None
+        self.dopasowanie = None
+        # Szkice najczęstszych słów i par (tryb przybliżony, zlicz_przyblizone)
+        self.strumien = None
+        # Pozycje top rzeczowników w tabeli (ranga - 1), ustawiane przez znajdz_rzeczowniki
+        self.rzeczowniki = None
+        # Pomiary etapów (wspolne.metryki); None - bez pomiarów
+        self.metryki: Optional[Metryki] = None
+    
+    @classmethod
+    def z_wynikow(cls, katalog: Optional[str] = None, mmap: bool = True) -> 'AnalizaKorpusu':
+        # Analiza odtworzona z wyników kolumnowych zapisanych przez zapisz_wyniki():
+        # tabela, graf i rzeczowniki jako memmapy - bez liczenia od nowa i parsowania CSV
+        katalog = katalog or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'wyniki')
+        wyniki = wczytaj_kolumnowo(katalog, mmap)
+        
+        sciezka_korpusu = wyniki.meta['zrodlo'] or os.path.join(katalog, '..', 'corpus', 'corpus.txt')
+        analiza = cls(sciezka_korpusu)
+        analiza.slownik = wyniki.slownik
+        analiza.tabela = wyniki.tabela
+        analiza.df_analiza = wyniki.tabela.do_dataframe()
+        analiza.macierz_sasiedztwa = wyniki.graf
+        analiza.rzeczowniki = wyniki.rzeczowniki
+        analiza.dopasowanie = wyniki.dopasowanie
+        return analiza
+    
+    @property
+    def slowa(self) -> List[str]:
+        slownik = self.slownik
+        return [slownik[i] for i in self.tokeny.tolist()]
+    
+    @property
+    def graf_sasiedztwa(self) -> Optional['nx.Graph']:
+        # Graf networkx tworzony dopiero przy pierwszym użyciu
+        if self._graf_sasiedztwa is None and self.macierz_sasiedztwa is not None:
+            self._graf_sasiedztwa = self.macierz_sasiedztwa.do_networkx()
+        return self._graf_sasiedztwa
+    
+    @etap(lambda self, m: {'tokeny': len(m.tokeny), 'typy': len(m.slownik)})
+    def otworz_magazyn(self) -> MagazynKorpusu:
+        if self.magazyn is None:
+            self.magazyn = MagazynKorpusu.otworz(self.sciezka_korpusu)
+        return self.magazyn
+        
+    @etap(lambda self, _: {'tokeny': len(self.tokeny), 'typy': len(self.slownik)})
+    def wczytaj_korpus(self, limit_slow: Optional[int] = 100000,
+                       rozmiar_bloku: int = ROZMIAR_BLOKU) -> None:
         print(f"Wczytywanie korpusu z: {self.sciezka_korpusu}")
         
-        with open(self.sciezka_korpusu, 'r', encoding='utf-8') as f:
-            tekst = f.read()
-        
-        slowa_raw = re.findall(r'\b[a-zA-ZąćęłńóśźżĄĆĘŁŃÓŚŹŻ]+\b', tekst.lower())
-        
-        slowa_filtrowane = [
-            slowo for slowo in slowa_raw 
-            if len(slowo) > 1 or slowo in ['i', 'a']
-        ]
-        
-        self.slowa = slowa_filtrowane[:limit_slow]
-        
-        print(f"Wczytano {len(self.slowa):,} słów")
+        magazyn = None
+        if self.uzyj_magazynu:
+            # Z limitem tylko magazyn już skompilowany - kompilacja czyta cały plik,
+            # a odczyt blokami kończy się po limit_slow słowach
+            if limit_slow is None:
+                magazyn = self.otworz_magazyn()
+            elif self.magazyn is None:
+                magazyn = self.magazyn = MagazynKorpusu.otworz(self.sciezka_korpusu, kompiluj=False)
+            else:
+                magazyn = self.magazyn
+        
+        if magazyn is not None:
+            maska = np.fromiter((czy_wyraz(t) for t in magazyn.slownik),
+                                dtype=bool, count=len(magazyn.slownik))
+            self.slownik = magazyn.slownik
+            self.tokeny = magazyn.filtruj(maska, limit_slow)
+        else:
+            # Plik czytany blokami; odczyt kończy się po zebraniu limit_slow słów
+            indeks = {}
+            ids = array('I')
+            strumien = bloki_slow(self.sciezka_korpusu, rozmiar_bloku)
+            for slowa_bloku in strumien:
+                ids.extend([indeks.setdefault(slowo, len(indeks)) for slowo in slowa_bloku])
+                if limit_slow is not None and len(ids) >= limit_slow:
+                    del ids[limit_slow:]
+                    break
+            strumien.close()
+            
+            self.slownik = list(indeks)
+            self.tokeny = np.frombuffer(ids, dtype=np.uint32)
         
-    def oblicz_statystyki(self) -> pd.DataFrame:
+        self.liczniki = None
+        print(f"Wczytano {len(self.tokeny):,} słów")
+    
+    @etap(lambda self, _: {'tokeny': self.liczniki.sum(), 'typy': len(self.slownik), 'pary': len(self.sasiedztwo)})
+    def zlicz_rownolegle(self, zrodlo: Optional[str] = None, liczba_procesow: Optional[int] = None,
+                         rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU) -> None:
+        # Map-reduce po plikach i fragmentach bajtowych; bez limitu słów
+        zrodlo = zrodlo or self.sciezka_korpusu
+        print(f"Zliczanie równoległe: {zrodlo} (procesy: {liczba_procesow or os.cpu_count()})")
+        
+        wynik = zlicz_rownolegle(zrodlo, liczba_procesow, rozmiar_fragmentu)
+        
+        self.slownik = wynik.slownik
+        maska = np.fromiter((czy_wyraz(t) for t in self.slownik), dtype=bool, count=len(self.slownik))
+        self.liczniki = np.array(wynik.liczniki, dtype=np.int64) * maska
+        self.tokeny = np.zeros(0, dtype=np.uint32)
+        self.sasiedztwo = MacierzSasiedztwa.z_czesci(self.slownik, wynik.czesci_par)
+        
+        print(f"Zliczono {int(self.liczniki.sum()):,} słów, {len(self.sasiedztwo):,} par")
+        
+    @etap(lambda self, _: {'tokeny': self.strumien.slowa.suma, 'typy': len(self.tabela), 'pary': len(self.sasiedztwo)})
+    def zlicz_przyblizone(self, zrodlo: Optional[str] = None, pojemnosc: int = POJEMNOSC,
+                          pojemnosc_par: Optional[int] = None, rozmiar_bloku: int = 8 * ROZMIAR_BLOKU) -> None:
+        # Strumień w stałej pamięci: top `pojemnosc` słów i `pojemnosc_par` par (Space-Saving)
+        # z oszacowaniem błędu; tabela, Zipf i graf liczone z najczęstszych elementów
+        zrodlo = zrodlo or self.sciezka_korpusu
+        print(f"Zliczanie przybliżone: {zrodlo} (pojemność: {pojemnosc:,} słów)")
+        
+        pliki = rozwin_zrodla(zrodlo)
+        if not pliki:
+            raise FileNotFoundError(f"Brak plików dla: {zrodlo}")
+        
+        self.strumien = StrumienNajczestszych(czy_wyraz, pojemnosc, pojemnosc_par)
+        for plik in pliki:
+            self.strumien.nowy_plik()
+            for blok in czytaj_bloki(plik, rozmiar_bloku):
+                self.strumien.dodaj_tekst(blok)
+        
+        self.slownik, self.tabela, bledy, self.sasiedztwo = self.strumien.wyniki()
+        self.liczniki = None
+        self.tokeny = np.zeros(0, dtype=np.uint32)
+        self.df_analiza = self.tabela.do_dataframe()
+        self.df_analiza['blad'] = bledy
+        self.rzeczowniki = None
+        self.macierz_sasiedztwa = None
+        self._graf_sasiedztwa = None
+        
+        print(self.strumien.slowa.raport('Słowa'))
+        print(self.strumien.pary.raport('Pary'))
+    
+    @etap(lambda self, przyrost: {'bajty': przyrost, 'typy': len(self.tabela), 'pary': len(self.sasiedztwo)})
+    def aktualizuj_przyrostowo(self, min_czestotliwosc=3, liczba_procesow: Optional[int] = 1,
+                               katalog_stanu: Optional[str] = None) -> int:
+        # Stan zapisany po poprzednim uruchomieniu + tylko tekst dopisany od tamtej pory;
+        # tabela i graf (próg min_czestotliwosc) aktualizowane dla zmienionych słów i par
+        print(f"Aktualizacja przyrostowa: {self.sciezka_korpusu}")
+        
+        stan = StanKorpusu.wczytaj(self.sciezka_korpusu, czy_wyraz, katalog_stanu)
+        przyrost = stan.aktualizuj(liczba_procesow)
+        if stan.ustaw_prog(min_czestotliwosc) or przyrost:
+            stan.zapisz()
+        
+        self.slownik = stan.slownik
+        self.liczniki = stan.liczniki
+        self.tokeny = np.zeros(0, dtype=np.uint32)
+        self.tabela = stan.tabela
+        self.df_analiza = self.tabela.do_dataframe()
+        self.rzeczowniki = None
+        self.sasiedztwo = stan.pary
+        self.macierz_sasiedztwa = stan.graf
+        self._graf_sasiedztwa = None
+        
+        print(f"Przetworzono nowych bajtów: {przyrost:,}")
+        print(f"Znaleziono {len(self.df_analiza)} unikalnych wyrazów, {len(self.sasiedztwo):,} par")
+        print(f"Graf: {self.macierz_sasiedztwa.liczba_wezlow()} węzłów, {len(self.macierz_sasiedztwa)} krawędzi")
+        
+        return przyrost
+        
+    @etap(lambda self, _: {'typy': len(self.tabela), 'tokeny': self.tabela.suma})
+    def oblicz_statystyki(self) -> 'pd.DataFrame':
         print("\nObliczanie statystyk...")
         
-        licznik = Counter(self.slowa)
-        posortowane = licznik.most_common()
-        
-        dane = []
-        for ranga, (wyraz, czestotliwosc) in enumerate(posortowane, start=1):
-            dane.append({
-                'wyraz': wyraz,
-                'r': ranga,
-                'f': czestotliwosc,
-                'r*f': ranga * czestotliwosc
-            })
-        
-        self.df_analiza = pd.DataFrame(dane)
+        if self.liczniki is not None:
+            liczniki = self.liczniki
+        else:
+            liczniki = np.bincount(self.tokeny, minlength=len(self.slownik))
+        self.tabela = TabelaCzestotliwosci.z_licznikow(liczniki, self.slownik)
+        self.df_analiza = self.tabela.do_dataframe()
+        self.rzeczowniki = None
         
         print(f"Znaleziono {len(self.df_analiza)} unikalnych wyrazów")
         
@@ -76,155 +242,164 @@ class AnalizaKorpusu:
         print(self.df_analiza.head(n).to_string(index=False))
         print("=" * 70)
         
-    def wykres_zipfa(self, zapisz=True) -> None:
+    @etap(lambda self, _: {'rangi': len(self.tabela)})
+    def wykres_zipfa(self, zapisz=True, kolejka: Optional[KolejkaRysunkow] = None, dpi=300) -> None:
         print("\nGenerowanie wykresu prawa Zipfa...")
         
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+        sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', 'wykres_zipfa.png') if zapisz else None
+        # Przy kolejce rysunek renderowany jest później, razem z pozostałymi
+        if kolejka is not None:
+            kolejka.dodaj(rysuj_zipfa, self.tabela.r, self.tabela.f, sciezka, dpi)
+        else:
+            rysuj_zipfa(self.tabela.r, self.tabela.f, sciezka, dpi)
         
-        ax1.plot(self.df_analiza['r'], self.df_analiza['f'], 'b-', linewidth=1.5, alpha=0.7)
-        ax1.set_xlabel('Ranga (r)', fontsize=12)
-        ax1.set_ylabel('Częstotliwość (f)', fontsize=12)
-        ax1.set_title('Prawo Zipfa - Skala Liniowa', fontsize=14, fontweight='bold')
-        ax1.grid(True, alpha=0.3)
+    @etap(lambda self, _: {'rangi': len(self.tabela)})
+    def dopasuj_prawo_zipfa(self, liczba_prob=1000, poziom_ufnosci=0.95) -> Optional[WynikDopasowania]:
+        print("\nDopasowanie prawa Zipfa...")
         
-        ax2.loglog(self.df_analiza['r'], self.df_analiza['f'], 'r-', linewidth=1.5, alpha=0.7)
-        ax2.set_xlabel('Ranga (r) - skala log', fontsize=12)
-        ax2.set_ylabel('Częstotliwość (f) - skala log', fontsize=12)
-        ax2.set_title('Prawo Zipfa - Skala Logarytmiczna', fontsize=14, fontweight='bold')
-        ax2.grid(True, alpha=0.3, which='both')
+        # Mały korpus lub mocno przycięta tabela (--przyblizone) - bez przerywania analizy
+        if len(self.tabela) < MIN_LICZBA_RANG:
+            print(f"Za mało rang do dopasowania ({len(self.tabela)}, wymagane {MIN_LICZBA_RANG}) - pominięto")
+            self.dopasowanie = None
+            return None
         
-        plt.tight_layout()
+        self.dopasowanie = dopasuj_zipfa(self.tabela.f, liczba_prob, poziom_ufnosci)
         
-        if zapisz:
-            sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', 'wykres_zipfa.png')
-            plt.savefig(sciezka, dpi=300, bbox_inches='tight')
-            print(f"Wykres zapisany: {sciezka}")
+        print(self.dopasowanie.raport())
         
-        plt.show()
+        return self.dopasowanie
         
-    def odciecie_90_procent(self) -> Tuple[int, pd.DataFrame]:
-        print("\nObliczanie odcięcia 90%...")
+    @etap(lambda self, odciecia: {'poziomy': len(odciecia)})
+    def odciecia_pokrycia(self, poziomy=(0.5, 0.8, 0.9, 0.99)) -> Dict[float, int]:
+        print("\nObliczanie odcięć pokrycia...")
+        
+        odciecia = self.tabela.odciecia(poziomy)
         
-        suma_calkowita = self.df_analiza['f'].sum()
-        prog_90 = 0.9 * suma_calkowita
+        for poziom, pozycja in odciecia.items():
+            print(f"{100*poziom:g}% wystąpień pokrywa {pozycja} najczęstszych słów "
+                  f"({100*pozycja/len(self.tabela):.2f}% unikalnych)")
+        if self.tabela.pokrycie < max(poziomy):
+            print(f"Tabela obejmuje {100*self.tabela.pokrycie:.1f}% wystąpień - wyższe odcięcia są dolnym oszacowaniem")
         
-        suma_kumulatywna = 0
-        pozycja_odciecia = 0
+        return odciecia
+    
+    @etap(lambda self, wynik: {'odciecie': wynik[0], 'typy': len(self.tabela)})
+    def odciecie_90_procent(self) -> Tuple[int, 'pd.DataFrame']:
+        print("\nObliczanie odcięcia 90%...")
         
-        for idx, row in self.df_analiza.iterrows():
-            suma_kumulatywna += row['f']
-            if suma_kumulatywna >= prog_90:
-                pozycja_odciecia = idx + 1
-                break
+        pozycja_odciecia = self.tabela.odciecia([0.9])[0.9]
         
         df_90 = self.df_analiza.iloc[:pozycja_odciecia]
         
         print(f"90% wystąpień pokrywa {pozycja_odciecia} najczęstszych słów")
         print(f"(z {len(self.df_analiza)} unikalnych słów)")
         print(f"Procent unikalnych słów: {100*pozycja_odciecia/len(self.df_analiza):.2f}%")
+        if self.tabela.pokrycie < 0.9:
+            print(f"Tabela obejmuje {100*self.tabela.pokrycie:.1f}% wystąpień - odcięcie jest dolnym oszacowaniem")
         
         return pozycja_odciecia, df_90
     
-    def generuj_graf_sasiedztwa(self, min_czestotliwosc=5) -> nx.Graph:
-        print("\nGenerowanie grafu sąsiedztwa słów...")
-        
-        with open(self.sciezka_korpusu, 'r', encoding='utf-8') as f:
-            tekst = f.read()
+    @etap(lambda self, _: {'pary': len(self.sasiedztwo)})
+    def zlicz_pary(self) -> None:
+        magazyn = self.otworz_magazyn()
+        dlugie = np.fromiter((len(t) > 1 for t in magazyn.slownik), dtype=bool, count=len(magazyn.slownik))
+        self.sasiedztwo = MacierzSasiedztwa.z_tokenow(
+            magazyn.slownik, magazyn.tokeny, magazyn.maska_par_w_zdaniu(), dlugie
+        )
+    
+    @etap(lambda self, m: {'pary': len(m)})
+    def zlicz_wspolwystepowania(self, okno=2) -> MacierzSasiedztwa:
+        # Pary słów odległych o 1..okno pozycji w obrębie zdania; okno=1 - pary sąsiednie (zlicz_pary)
+        if okno not in self.wspolwystepowania:
+            magazyn = self.otworz_magazyn()
+            dlugie = np.fromiter((len(t) > 1 for t in magazyn.slownik), dtype=bool, count=len(magazyn.slownik))
+            self.wspolwystepowania[okno] = MacierzSasiedztwa.z_tokenow(
+                magazyn.slownik, magazyn.tokeny, magazyn.maska_par_w_zdaniu(), dlugie, odleglosc=okno
+            )
+        return self.wspolwystepowania[okno]
+    
+    @etap(lambda self, m: {'krawedzie': len(m), 'wezly': m.liczba_wezlow()})
+    def generuj_graf_wspolwystepowania(self, okno=2, miara='ppmi', min_czestotliwosc=5,
+                                       top_n: Optional[int] = None) -> MacierzSasiedztwa:
+        print(f"\nGenerowanie grafu współwystępowania słów (okno ±{okno}, miara {miara})...")
         
-        zdania = re.split(r'[.!?]+', tekst)
-        pary = defaultdict(int)
+        # Wagi krawędzi = wynik miary (pmi, ppmi, llr lub liczba), liczony dla wszystkich par naraz;
+        # krawędzie: pary o liczności >= min_czestotliwosc, opcjonalnie top_n sąsiadów każdego słowa
+        liczniki = self.zlicz_wspolwystepowania(okno)
+        self.macierz_sasiedztwa = wybierz_krawedzie(liczniki, miara, min_czestotliwosc, top_n)
+        self._graf_sasiedztwa = None
         
-        for zdanie in zdania:
-            zdanie_clean = re.sub(r'[^\w\s]', ' ', zdanie.lower())
-            slowa_zdania = zdanie_clean.split()
-            
-            for i in range(len(slowa_zdania) - 1):
-                slowo1 = slowa_zdania[i]
-                slowo2 = slowa_zdania[i + 1]
-                
-                if slowo1 and slowo2 and len(slowo1) > 1 and len(slowo2) > 1:
-                    para = tuple(sorted([slowo1, slowo2]))
-                    pary[para] += 1
+        print(f"Graf utworzony:")
+        print(f"Węzły (słowa): {self.macierz_sasiedztwa.liczba_wezlow()}")
+        print(f"Krawędzie (połączenia): {len(self.macierz_sasiedztwa)} z {len(liczniki):,} par")
         
-        G = nx.Graph()
+        return self.macierz_sasiedztwa
+    
+    @etap(lambda self, m: {'krawedzie': len(m), 'wezly': m.liczba_wezlow()})
+    def generuj_graf_sasiedztwa(self, min_czestotliwosc=5) -> MacierzSasiedztwa:
+        print("\nGenerowanie grafu sąsiedztwa słów...")
         
-        for (slowo1, slowo2), waga in pary.items():
-            if waga >= min_czestotliwosc:
-                G.add_edge(slowo1, slowo2, weight=waga)
+        if self.sasiedztwo is None:
+            self.zlicz_pary()
         
-        self.graf_sasiedztwa = G
+        self.macierz_sasiedztwa = self.sasiedztwo.przytnij(min_czestotliwosc)
+        self._graf_sasiedztwa = None
         
         print(f"Graf utworzony:")
-        print(f"Węzły (słowa): {G.number_of_nodes()}")
-        print(f"Krawędzie (połączenia): {G.number_of_edges()}")
+        print(f"Węzły (słowa): {self.macierz_sasiedztwa.liczba_wezlow()}")
+        print(f"Krawędzie (połączenia): {len(self.macierz_sasiedztwa)}")
         
-        return G
+        return self.macierz_sasiedztwa
     
-    def wizualizuj_graf(self, top_n=50, zapisz=True) -> None:
+    @etap()
+    def wizualizuj_graf(self, top_n=50, zapisz=True, kolejka: Optional[KolejkaRysunkow] = None, dpi=300) -> None:
         print(f"\nWizualizacja grafu (top {top_n} najbardziej połączonych słów)...")
         
-        if self.graf_sasiedztwa is None:
+        if self.macierz_sasiedztwa is None:
             print("Najpierw wygeneruj graf używając generuj_graf_sasiedztwa()")
             return
         
-        stopnie = dict(self.graf_sasiedztwa.degree())
-        top_wezly = sorted(stopnie.items(), key=lambda x: x[1], reverse=True)[:top_n]
-        top_nazwy = [w[0] for w in top_wezly]
-        
-        podgraf = self.graf_sasiedztwa.subgraph(top_nazwy)
-        
-        plt.figure(figsize=(16, 12))
+        # Stopnie z listy krawędzi; do networkx trafia tylko podgraf top_n węzłów
+        macierz = self.macierz_sasiedztwa
+        stopnie_id = macierz.stopnie()
+        wezly = macierz.wezly()
+        top_id = wezly[np.argsort(-stopnie_id[wezly], kind='stable')[:top_n]]
+        stopnie = {macierz.slownik[i]: int(stopnie_id[i]) for i in top_id.tolist()}
         
-        pos = nx.spring_layout(podgraf, k=0.5, iterations=50, seed=42)
+        podgraf = macierz.do_networkx(top_id)
         
-        rozmiary = [stopnie[node] * 30 for node in podgraf.nodes()]
-        
-        nx.draw_networkx_nodes(podgraf, pos, node_size=rozmiary, 
-                               node_color='lightblue', alpha=0.7, 
-                               edgecolors='navy', linewidths=1.5)
-        
-        nx.draw_networkx_edges(podgraf, pos, alpha=0.3, width=0.5)
-        
-        nx.draw_networkx_labels(podgraf, pos, font_size=8, font_weight='bold')
-        
-        plt.title(f'Graf Sąsiedztwa Słów (Top {top_n})', fontsize=16, fontweight='bold')
-        plt.axis('off')
-        plt.tight_layout()
-        
-        if zapisz:
-            sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', 'graf_sasiedztwa.png')
-            plt.savefig(sciezka, dpi=300, bbox_inches='tight')
-            print(f"Graf zapisany: {sciezka}")
-        
-        plt.show()
+        sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', 'graf_sasiedztwa.png') if zapisz else None
+        if kolejka is not None:
+            kolejka.dodaj(rysuj_graf_sasiedztwa, podgraf, stopnie, top_n, sciezka, dpi)
+        else:
+            rysuj_graf_sasiedztwa(podgraf, stopnie, top_n, sciezka, dpi)
     
-    def znajdz_rzeczowniki(self, top_n=50) -> pd.DataFrame:
+    @etap(lambda self, df: {'rzeczowniki': len(df), 'otagowane': len(self.pamiec_tagow.tagi) if self.pamiec_tagow else 0})
+    def znajdz_rzeczowniki(self, top_n=50) -> 'pd.DataFrame':
         print(f"\nIdentyfikacja top {top_n} rzeczowników...")
         
-        rzeczowniki = []
-        unikalne_slowa = self.df_analiza['wyraz'].tolist()
-        
-        batch_size = 1000
-        wszystkie_tagi = []
-        
-        for i in range(0, len(unikalne_slowa), batch_size):
-            batch = unikalne_slowa[i:i+batch_size]
-            tagi = nltk.pos_tag(batch)
-            wszystkie_tagi.extend(tagi)
-        
-        slownik_tagow = dict(wszystkie_tagi)
-        
-        for idx, row in self.df_analiza.iterrows():
-            wyraz = row['wyraz']
-            tag = slownik_tagow.get(wyraz, '')
+        # Tagowanie w kolejności rang, paczkami po batch_size słów, do znalezienia top_n
+        # rzeczowników; tagi z trwałej pamięci nie są liczone ponownie, a lista
+        # z poprzedniego wywołania (lub z z_wynikow) używana, jeśli jest dość długa
+        if self.rzeczowniki is not None and len(self.rzeczowniki) >= top_n:
+            rzeczowniki = self.rzeczowniki.tolist()
+        else:
+            if self.pamiec_tagow is None:
+                self.pamiec_tagow = PamiecTagow()
             
-            if tag.startswith('NN'):
-                rzeczowniki.append(row)
+            rzeczowniki = []
+            unikalne_slowa = self.df_analiza['wyraz'].tolist()
+            batch_size = 1000
             
-            if len(rzeczowniki) >= top_n:
-                break
+            for i in range(0, len(unikalne_slowa), batch_size):
+                tagi = self.pamiec_tagow.otaguj(unikalne_slowa[i:i+batch_size])
+                rzeczowniki.extend(i + j for j, tag in enumerate(tagi) if tag.startswith('NN'))
+                
+                if len(rzeczowniki) >= top_n:
+                    break
+            self.rzeczowniki = np.array(rzeczowniki, dtype=np.int64)
         
-        df_rzeczowniki = pd.DataFrame(rzeczowniki)
+        df_rzeczowniki = self.df_analiza.iloc[rzeczowniki[:top_n]]
         
         print(f"Znaleziono {len(df_rzeczowniki)} rzeczowników")
         print(f"\nTop {min(top_n, len(df_rzeczowniki))} rzeczowników:")
@@ -234,45 +409,142 @@ class AnalizaKorpusu:
         
         return df_rzeczowniki
     
-    def zapisz_wyniki(self) -> None:
+    @etap(lambda self, _: {'wiersze': len(self.df_analiza)})
+    def zapisz_wyniki(self, csv=True, kolumnowo=True) -> None:
         print("\nZapisywanie wyników...")
         
         katalog = os.path.dirname(self.sciezka_korpusu)
         katalog_projekt = os.path.join(katalog, '..')
         
-        sciezka_csv = os.path.join(katalog_projekt, 'analiza_czestotliwosci.csv')
-        self.df_analiza.to_csv(sciezka_csv, index=False, encoding='utf-8')
-        print(f"Tabela zapisana: {sciezka_csv}")
+        if csv:
+            sciezka_csv = os.path.join(katalog_projekt, 'analiza_czestotliwosci.csv')
+            self.df_analiza.to_csv(sciezka_csv, index=False, encoding='utf-8')
+            print(f"Tabela zapisana: {sciezka_csv}")
+        
+        if kolumnowo:
+            # Tabela, graf i rzeczowniki w plikach .npy do szybkiego wczytania (z_wynikow)
+            katalog_wynikow = os.path.join(katalog_projekt, 'wyniki')
+            zapisz_kolumnowo(katalog_wynikow, self.slownik, self.tabela, self.macierz_sasiedztwa,
+                             self.rzeczowniki, self.dopasowanie, self.sciezka_korpusu)
+            print(f"Wyniki kolumnowe zapisane: {katalog_wynikow}")
+        
+        if self.dopasowanie is not None:
+            sciezka_json = os.path.join(katalog_projekt, 'dopasowanie_zipfa.json')
+            with open(sciezka_json, 'w', encoding='utf-8') as f:
+                json.dump(self.dopasowanie._asdict(), f, ensure_ascii=False, indent=2)
+            print(f"Dopasowanie zapisane: {sciezka_json}")
 
 
-def main():
+def uruchom_analize(args, metryki: Optional[Metryki]) -> None:
     print("=" * 70)
     print("  ANALIZA KORPUSU JĘZYKOWEGO - PROJEKT 1")
     print("=" * 70)
     
     # Ścieżka do korpusu
-    sciezka_korpusu = os.path.join(
+    sciezka_korpusu = args.zrodlo or os.path.join(
         os.path.dirname(__file__), 
         'corpus', 
         'corpus.txt'
     )
     
     analiza = AnalizaKorpusu(sciezka_korpusu)
+    analiza.metryki = metryki
+    
+    kolejka = None
+    if args.wsadowo:
+        ustaw_tryb_wsadowy()
+        kolejka = KolejkaRysunkow()
     
-    analiza.wczytaj_korpus(limit_slow=100000)
-    df = analiza.oblicz_statystyki()
+    if args.przyrostowo:
+        analiza.aktualizuj_przyrostowo(min_czestotliwosc=3, liczba_procesow=args.procesy or 1)
+    elif args.przyblizone:
+        analiza.zlicz_przyblizone(args.zrodlo, pojemnosc=args.przyblizone)
+    elif args.procesy:
+        analiza.zlicz_rownolegle(liczba_procesow=args.procesy)
+    else:
+        analiza.wczytaj_korpus(limit_slow=100000)
+    if not args.przyrostowo and not args.przyblizone:
+        df = analiza.oblicz_statystyki()
     analiza.pokaz_tabele(n=30)
-    analiza.wykres_zipfa()
+    analiza.wykres_zipfa(kolejka=kolejka)
+    analiza.dopasuj_prawo_zipfa()
     pozycja, df_90 = analiza.odciecie_90_procent()
-    graf = analiza.generuj_graf_sasiedztwa(min_czestotliwosc=3)
-    analiza.wizualizuj_graf(top_n=50)
+    if args.okno > 1 or args.miara != 'liczba' or args.top_sasiadow is not None:
+        graf = analiza.generuj_graf_wspolwystepowania(okno=args.okno, miara=args.miara, min_czestotliwosc=3,
+                                                      top_n=args.top_sasiadow)
+    elif not args.przyrostowo:
+        graf = analiza.generuj_graf_sasiedztwa(min_czestotliwosc=3)
+    analiza.wizualizuj_graf(top_n=50, kolejka=kolejka)
     df_rzeczowniki = analiza.znajdz_rzeczowniki(top_n=50)
-    analiza.zapisz_wyniki()
+    analiza.zapisz_wyniki(csv=not args.bez_csv)
+    if kolejka is not None:
+        kolejka.renderuj(args.procesy_rysowania)
     
     print("\n" + "=" * 70)
     print("  ANALIZA ZAKOŃCZONA POMYŚLNIE!")
     print("=" * 70)
 
 
+def sprawdz_argumenty(parser: argparse.ArgumentParser, args) -> None:
+    if args.okno < 1:
+        parser.error(f"--okno musi być >= 1 (podano {args.okno})")
+    if args.top_sasiadow is not None and args.top_sasiadow < 1:
+        parser.error(f"--top-sasiadow musi być >= 1 (podano {args.top_sasiadow})")
+    
+    # Katalog i wzorzec glob rozwijane są tylko przy zliczaniu równoległym i przybliżonym;
+    # tryb szeregowy, przyrostowy i graf współwystępowania (magazyn) czytają jeden plik
+    if args.zrodlo is not None and not os.path.isfile(args.zrodlo):
+        if not rozwin_zrodla(args.zrodlo):
+            parser.error(f"--zrodlo: brak plików dla {args.zrodlo}")
+        if args.przyrostowo or not (args.procesy or args.przyblizone):
+            parser.error("--zrodlo (katalog lub wzorzec glob) wymaga --procesy lub --przyblizone "
+                         "i nie działa z --przyrostowo")
+        if args.okno > 1 or args.miara != 'liczba' or args.top_sasiadow is not None:
+            parser.error("graf współwystępowania (--okno, --miara, --top-sasiadow) wymaga pojedynczego pliku --zrodlo")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Analiza korpusu językowego')
+    parser.add_argument('--zrodlo', help='plik, katalog lub wzorzec glob (domyślnie corpus/corpus.txt)')
+    parser.add_argument('--procesy', type=int, default=0,
+                        help='liczba procesów zliczania równoległego (0 = tryb szeregowy z limitem słów)')
+    parser.add_argument('--przyrostowo', action='store_true',
+                        help='doliczenie tylko tekstu dopisanego od ostatniego uruchomienia (bez limitu słów)')
+    parser.add_argument('--przyblizone', type=int, default=0, metavar='POJEMNOSC',
+                        help='tryb strumieniowy w stałej pamięci: tylko POJEMNOSC najczęstszych słów (Space-Saving)')
+    parser.add_argument('--okno', type=int, default=1,
+                        help='graf ze współwystępowania w oknie ±OKNO słów w zdaniu (1 = tylko pary sąsiednie)')
+    parser.add_argument('--miara', choices=MIARY, default='liczba',
+                        help='waga krawędzi grafu: liczba par, pmi, ppmi lub llr (log-likelihood)')
+    parser.add_argument('--top-sasiadow', type=int, default=None, metavar='N',
+                        help='tylko N najwyżej ocenionych sąsiadów każdego słowa w grafie')
+    parser.add_argument('--wsadowo', action='store_true',
+                        help='rysunki tylko zapisywane (backend Agg), renderowane razem w puli procesów')
+    parser.add_argument('--procesy-rysowania', type=int, default=None,
+                        help='liczba procesów renderowania w trybie wsadowym (domyślnie liczba rdzeni)')
+    parser.add_argument('--bez-csv', action='store_true',
+                        help='tylko wyniki kolumnowe (wyniki/*.npy), bez analiza_czestotliwosci.csv')
+    parser.add_argument('--metryki', default=None,
+                        help='plik JSON-lines z pomiarami etapów (czas, CPU, szczyt RSS, liczniki)')
+    parser.add_argument('--profiluj', default=None,
+                        help='etapy profilowane cProfile, np. oblicz_statystyki,zlicz_pary, lub "wszystkie"')
+    parser.add_argument('--cicho', action='store_true', help='bez wydruków na standardowe wyjście')
+    args = parser.parse_args()
+    sprawdz_argumenty(parser, args)
+    
+    metryki = None
+    if args.metryki or args.profiluj:
+        metryki = Metryki(args.metryki, profiluj=parsuj_profilowanie(args.profiluj))
+    
+    if args.cicho:
+        with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+            uruchom_analize(args, metryki)
+    else:
+        uruchom_analize(args, metryki)
+        if metryki is not None:
+            print("\nPomiary etapów:")
+            print(metryki.podsumowanie())
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,206 @@
+import numpy as np
+from typing import NamedTuple, Optional, Tuple
+
+# Rangi 1..DOKLADNE_RANGI liczone dokładnie, dalsze zgrupowane w przedziały
+# o logarytmicznej szerokości, a sumy potęgowe w ogonie liczone kwadraturą
+DOKLADNE_RANGI = 1000
+LICZBA_PRZEDZIALOW = 2048
+WEZLY_KWADRATURY = 64
+SIATKA_Q = np.concatenate([[0.0], np.geomspace(0.01, 1000, 81)])
+MIN_LICZBA_RANG = 2
+
+
+# Wynik dopasowania prawa Zipfa f(r) ~ r^-s i Zipfa-Mandelbrota f(r) ~ (r+q)^-s;
+# krotka - porównywalna (==), hashowalna, _asdict() do zapisu w JSON
+class WynikDopasowania(NamedTuple):
+    liczba_rang: int
+    liczba_wystapien: int
+    s_regresja: float
+    r2_regresja: float
+    s_regresja_ci: Tuple[float, float]
+    s_mle: float
+    s_mle_ci: Tuple[float, float]
+    ks_zipf: float
+    s_mandelbrot: float
+    q_mandelbrot: float
+    ks_mandelbrot: float
+    poziom_ufnosci: float
+    liczba_prob: int
+
+    def raport(self) -> str:
+        procent = f"{100 * self.poziom_ufnosci:g}%"
+        return "\n".join([
+            f"Rangi: {self.liczba_rang:,}, wystąpienia: {self.liczba_wystapien:,}",
+            f"Regresja log-log:   s = {self.s_regresja:.4f}  "
+            f"[{procent} CI {self.s_regresja_ci[0]:.4f} - {self.s_regresja_ci[1]:.4f}]  R² = {self.r2_regresja:.4f}",
+            f"MLE Zipf:           s = {self.s_mle:.4f}  "
+            f"[{procent} CI {self.s_mle_ci[0]:.4f} - {self.s_mle_ci[1]:.4f}]  KS = {self.ks_zipf:.4f}",
+            f"MLE Mandelbrot:     s = {self.s_mandelbrot:.4f}, q = {self.q_mandelbrot:.3f}  KS = {self.ks_mandelbrot:.4f}",
+        ])
+
+
+def krawedzie_przedzialow(liczba_rang: int, dokladne: int = DOKLADNE_RANGI,
+                          liczba_przedzialow: int = LICZBA_PRZEDZIALOW) -> np.ndarray:
+    # Początki przedziałów rang (indeksy od 0) i koniec; pierwsze rangi w przedziałach po jednej
+    glowa = np.arange(min(dokladne, liczba_rang) + 1)
+    if liczba_rang <= dokladne:
+        return glowa
+    ogon = np.geomspace(dokladne, liczba_rang, liczba_przedzialow).astype(np.int64)
+    return np.unique(np.concatenate([glowa, ogon, [liczba_rang]]))
+
+
+def punkty_sumy(liczba_rang: int, q: np.ndarray, dokladne: int = DOKLADNE_RANGI) -> Tuple[np.ndarray, np.ndarray]:
+    # Punkty x i wagi w takie, że sum_{r=1..N} g(r + q) ~ sum_j w_j g(x_j) dla gładkich g:
+    # rangi 1..K dokładnie, ogon jako całka od K+0.5 do N+0.5 (kwadratura Gaussa-Legendre'a po log x)
+    q = np.atleast_1d(np.asarray(q, dtype=np.float64))[:, None]
+    k = min(dokladne, liczba_rang)
+    x_glowa = np.arange(1, k + 1, dtype=np.float64)[None, :] + q
+    w_glowa = np.ones_like(x_glowa)
+    if k == liczba_rang:
+        return x_glowa, w_glowa
+
+    wezly, wagi = np.polynomial.legendre.leggauss(WEZLY_KWADRATURY)
+    a, b = np.log(k + 0.5 + q), np.log(liczba_rang + 0.5 + q)
+    u = a + (b - a) * (wezly[None, :] + 1) / 2
+    x_ogon = np.exp(u)
+    w_ogon = wagi[None, :] * (b - a) / 2 * x_ogon
+    return np.concatenate([x_glowa, x_ogon], axis=1), np.concatenate([w_glowa, w_ogon], axis=1)
+
+
+def mle_wykladnika(sredni_log: np.ndarray, log_x: np.ndarray, w: np.ndarray,
+                   s0: float = 1.0, iteracje: int = 50) -> np.ndarray:
+    # Dla p(r) ~ x^-s wiarygodność jest maksymalna, gdy E_s[log x] = średni log x z danych;
+    # metoda Newtona (pochodna: -Var_s[log x]) dla wielu zadań naraz, wiersz = zadanie
+    s = np.full(sredni_log.shape, s0)
+    for _ in range(iteracje):
+        log_wagi = np.log(w) - s[:, None] * log_x
+        log_wagi -= log_wagi.max(axis=1, keepdims=True)
+        p = np.exp(log_wagi)
+        p /= p.sum(axis=1, keepdims=True)
+        srednia = (p * log_x).sum(axis=1)
+        wariancja = (p * log_x ** 2).sum(axis=1) - srednia ** 2
+        krok = (srednia - sredni_log) / np.maximum(wariancja, 1e-12)
+        s = np.clip(s + krok, 1e-3, 20.0)
+        if np.max(np.abs(krok)) < 1e-10:
+            break
+    return s
+
+
+def log_normalizacji(s: np.ndarray, log_x: np.ndarray, w: np.ndarray) -> np.ndarray:
+    log_wagi = np.log(w) - s[:, None] * log_x
+    maks = log_wagi.max(axis=1)
+    return maks + np.log(np.exp(log_wagi - maks[:, None]).sum(axis=1))
+
+
+def calka_potegowa(a: np.ndarray, b: np.ndarray, s: float) -> np.ndarray:
+    # ∫_a^b x^-s dx, stabilnie dla s bliskiego 1
+    t = 1.0 - s
+    log_ba = np.log(b / a)
+    if abs(t) < 1e-12:
+        return log_ba
+    return a ** t * np.expm1(t * log_ba) / t
+
+
+def dystrybuanta_modelu(konce: np.ndarray, liczba_rang: int, s: float, q: float,
+                        dokladne: int = DOKLADNE_RANGI) -> np.ndarray:
+    # P(ranga <= koniec) dla p(r) ~ (r+q)^-s, konce - rangi (od 1)
+    k = min(dokladne, liczba_rang)
+    glowa = np.cumsum((np.arange(1, k + 1) + q) ** -s)
+    konce = np.asarray(konce, dtype=np.float64)
+    w_glowie = konce <= k
+    sumy = np.empty_like(konce)
+    sumy[w_glowie] = glowa[konce[w_glowie].astype(np.int64) - 1]
+    sumy[~w_glowie] = glowa[-1] + calka_potegowa(k + 0.5 + q, konce[~w_glowie] + 0.5 + q, s)
+    suma = glowa[-1] + (calka_potegowa(k + 0.5 + q, liczba_rang + 0.5 + q, s) if liczba_rang > k else 0.0)
+    return sumy / suma
+
+
+def dopasuj_zipfa(f: np.ndarray, liczba_prob: int = 1000, poziom_ufnosci: float = 0.95,
+                  ziarno: Optional[int] = 0, rozmiar_paczki: int = 250) -> WynikDopasowania:
+    # f - częstotliwości posortowane malejąco (ranga r = indeks + 1)
+    f = np.asarray(f, dtype=np.int64)
+    n = len(f)
+    if n < MIN_LICZBA_RANG:
+        raise ValueError(f"Dopasowanie wymaga co najmniej {MIN_LICZBA_RANG} rang (podano {n})")
+    m = int(f.sum())
+    rng = np.random.default_rng(ziarno)
+    alfa = (1 - poziom_ufnosci) / 2
+
+    log_r = np.log(np.arange(1, n + 1, dtype=np.float64))
+    krawedzie = krawedzie_przedzialow(n)
+    starty, szerokosci = krawedzie[:-1], np.diff(krawedzie)
+
+    # Przedziały: wystąpienia, średni log rangi ważony wystąpieniami (do MLE)
+    # i średnie log r, log f po rangach (punkty regresji)
+    wystapienia = np.add.reduceat(f, starty)
+    log_r_wazony = np.add.reduceat(f * log_r, starty) / wystapienia
+    x = np.add.reduceat(log_r, starty) / szerokosci
+    y = np.add.reduceat(np.log(f), starty) / szerokosci
+
+    # Regresja log f = a - s log r po przedziałach (każdy zakres skali z tą samą wagą);
+    # przedział ufności z bootstrapu par (przedziałów), paczkami
+    def nachylenia(xs, ys):
+        xs = xs - xs.mean(axis=-1, keepdims=True)
+        ys = ys - ys.mean(axis=-1, keepdims=True)
+        return (xs * ys).sum(axis=-1) / (xs ** 2).sum(axis=-1)
+
+    nachylenie = nachylenia(x, y)
+    reszty = y - y.mean() - nachylenie * (x - x.mean())
+    r2 = 1 - (reszty ** 2).sum() / ((y - y.mean()) ** 2).sum()
+
+    # MLE Zipfa: bootstrap wystąpień (rozkład wielomianowy po przedziałach), paczkami
+    log_x, w = punkty_sumy(n, np.zeros(1))
+    log_x = np.log(log_x)
+    s_mle = mle_wykladnika(np.array([float(f @ log_r) / m]), log_x, w)[0]
+
+    p_przedzialow = wystapienia / m
+    s_reg_proby, s_mle_proby = [], []
+    for start in range(0, liczba_prob, rozmiar_paczki):
+        paczka = min(rozmiar_paczki, liczba_prob - start)
+        indeksy = rng.integers(0, len(x), size=(paczka, len(x)))
+        s_reg_proby.append(-nachylenia(x[indeksy], y[indeksy]))
+        proby = rng.multinomial(m, p_przedzialow, size=paczka)
+        s_mle_proby.append(mle_wykladnika(proby @ log_r_wazony / m, log_x, w, s0=s_mle))
+    s_reg_proby = np.concatenate(s_reg_proby) if s_reg_proby else np.array([-nachylenie])
+    s_mle_proby = np.concatenate(s_mle_proby) if s_mle_proby else np.array([s_mle])
+
+    # Zipf-Mandelbrot: profil wiarygodności po siatce q (dla każdego q optymalne s),
+    # potem siatka zagęszczona wokół najlepszego q
+    r_przedzialow = np.exp(log_r_wazony)
+
+    def profil(siatka_q):
+        sredni_log = (wystapienia[None, :] * np.log(r_przedzialow[None, :] + siatka_q[:, None])).sum(axis=1) / m
+        xq, wq = punkty_sumy(n, siatka_q)
+        log_xq = np.log(xq)
+        s = mle_wykladnika(sredni_log, log_xq, wq, s0=s_mle)
+        return s, -s * sredni_log - log_normalizacji(s, log_xq, wq)
+
+    s_q, wiarygodnosc = profil(SIATKA_Q)
+    i = int(np.argmax(wiarygodnosc))
+    dolna, gorna = SIATKA_Q[max(i - 1, 0)], SIATKA_Q[min(i + 1, len(SIATKA_Q) - 1)]
+    siatka = np.linspace(dolna, gorna, 41)
+    s_q, wiarygodnosc = profil(siatka)
+    i = int(np.argmax(wiarygodnosc))
+    s_mandelbrot, q_mandelbrot = float(s_q[i]), float(siatka[i])
+
+    # Statystyka KS na końcach przedziałów rang
+    konce = krawedzie[1:]
+    empiryczna = np.cumsum(wystapienia) / m
+    ks_zipf = np.abs(empiryczna - dystrybuanta_modelu(konce, n, s_mle, 0.0)).max()
+    ks_mandelbrot = np.abs(empiryczna - dystrybuanta_modelu(konce, n, s_mandelbrot, q_mandelbrot)).max()
+
+    return WynikDopasowania(
+        liczba_rang=n,
+        liczba_wystapien=m,
+        s_regresja=float(-nachylenie),
+        r2_regresja=float(r2),
+        s_regresja_ci=(float(np.quantile(s_reg_proby, alfa)), float(np.quantile(s_reg_proby, 1 - alfa))),
+        s_mle=float(s_mle),
+        s_mle_ci=(float(np.quantile(s_mle_proby, alfa)), float(np.quantile(s_mle_proby, 1 - alfa))),
+        ks_zipf=float(ks_zipf),
+        s_mandelbrot=s_mandelbrot,
+        q_mandelbrot=q_mandelbrot,
+        ks_mandelbrot=float(ks_mandelbrot),
+        poziom_ufnosci=poziom_ufnosci,
+        liczba_prob=liczba_prob,
+    )
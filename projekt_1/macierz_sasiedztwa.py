@@ -0,0 +1,229 @@
+import numpy as np
+from typing import List, Optional, Tuple, TYPE_CHECKING
+
+# networkx i scipy.sparse importowane przy pierwszym użyciu grafu / macierzy CSR
+if TYPE_CHECKING:
+    import networkx as nx
+    import scipy.sparse as sp
+
+ROZMIAR_OKNA = 1 << 22
+
+
+def ranga_alfabetyczna(slownik: List[str]) -> np.ndarray:
+    # Porządek punktów kodowych jak przy porównaniu str; bez tablicy <U{najdłuższe słowo},
+    # której rozmiar rośnie z długością najdłuższego tokenu
+    kolejnosc = sorted(range(len(slownik)), key=slownik.__getitem__)
+    ranga = np.empty(len(slownik), dtype=np.int64)
+    ranga[np.array(kolejnosc, dtype=np.int64)] = np.arange(len(slownik))
+    return ranga
+
+
+def klucze_par(slowo1: np.ndarray, slowo2: np.ndarray, ranga: np.ndarray) -> np.ndarray:
+    # Para w porządku alfabetycznym (jak tuple(sorted([slowo1, slowo2]))) jako jeden klucz uint64
+    zamien = ranga[slowo1] > ranga[slowo2]
+    pierwsze = np.where(zamien, slowo2, slowo1).astype(np.uint64)
+    drugie = np.where(zamien, slowo1, slowo2).astype(np.uint64)
+    return (pierwsze << np.uint64(32)) | drugie
+
+
+def zlicz_klucze(klucze: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Unikalne klucze, pozycja pierwszego wystąpienia i liczność
+    unikalne, pierwsze, liczby = np.unique(klucze, return_index=True, return_counts=True)
+    return unikalne, pierwsze.astype(np.int64), liczby.astype(np.int64)
+
+
+def scal_czesci(czesci: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not czesci:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    klucze = np.concatenate([c[0] for c in czesci])
+    pierwsze = np.concatenate([c[1] for c in czesci])
+    liczby = np.concatenate([c[2] for c in czesci])
+
+    kolejnosc = np.argsort(klucze, kind='stable')
+    klucze, pierwsze, liczby = klucze[kolejnosc], pierwsze[kolejnosc], liczby[kolejnosc]
+
+    nowe = np.ones(len(klucze), dtype=bool)
+    nowe[1:] = klucze[1:] != klucze[:-1]
+    starty = np.flatnonzero(nowe)
+
+    return klucze[starty], np.minimum.reduceat(pierwsze, starty), np.add.reduceat(liczby, starty)
+
+
+def dolacz_posortowane(baza: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                       delta: Tuple[np.ndarray, np.ndarray, np.ndarray],
+                       sumuj: bool = True) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Wstawia posortowane, unikalne klucze delty do posortowanej bazy: istniejące wagi
+    # są sumowane (lub zastępowane), nowe klucze wstawiane na swoje miejsce.
+    # Koszt: wyszukiwanie binarne dla delty + kopia tablic bazy
+    klucze, pierwsze, wagi = baza
+    d_klucze, d_pierwsze, d_wagi = delta
+
+    pozycje = np.searchsorted(klucze, d_klucze)
+    istnieje = pozycje < len(klucze)
+    istnieje[istnieje] = klucze[pozycje[istnieje]] == d_klucze[istnieje]
+
+    pierwsze = pierwsze.copy()
+    wagi = wagi.copy()
+    p = pozycje[istnieje]
+    wagi[p] = wagi[p] + d_wagi[istnieje] if sumuj else d_wagi[istnieje]
+    pierwsze[p] = np.minimum(pierwsze[p], d_pierwsze[istnieje])
+
+    nowe = ~istnieje
+    return (np.insert(klucze, pozycje[nowe], d_klucze[nowe]),
+            np.insert(pierwsze, pozycje[nowe], d_pierwsze[nowe]),
+            np.insert(wagi, pozycje[nowe], d_wagi[nowe]))
+
+
+# Pary sąsiednich słów jako klucze uint64 posortowane rosnąco, z pozycją pierwszego
+# wystąpienia i wagą; kolejność krawędzi (jak przy dodawaniu do nx.Graph), symetryczna
+# macierz CSR i graf networkx liczone na żądanie
+class MacierzSasiedztwa:
+    def __init__(self, slownik: List[str], klucze: np.ndarray, pierwsze: np.ndarray, wagi: np.ndarray):
+        self.slownik = slownik
+        self.klucze = klucze
+        self.pierwsze = pierwsze
+        self.wagi = wagi
+        self._krawedzie = None
+        self._macierz = None
+
+    @classmethod
+    def z_czesci(cls, slownik: List[str], czesci: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> 'MacierzSasiedztwa':
+        return cls(slownik, *scal_czesci(czesci))
+
+    @classmethod
+    def z_tokenow(cls, slownik: List[str], tokeny: np.ndarray, maska_par: np.ndarray,
+                  maska_slownika: np.ndarray, rozmiar_okna: int = ROZMIAR_OKNA,
+                  odleglosc: int = 1) -> 'MacierzSasiedztwa':
+        # Liczona jest para (tokeny[i], tokeny[i+d]) dla 1 <= d <= odleglosc, gdy maska_par[i..i+d-1]
+        # (to samo zdanie) i oba typy spełniają maska_slownika; pierwsze - pozycja lewego słowa
+        ranga = ranga_alfabetyczna(slownik)
+        czesci = []
+        # Okno krótsze przy większej odległości - stała liczba kluczy na okno
+        krok = max(rozmiar_okna // odleglosc, 1)
+        for start in range(0, len(maska_par), krok):
+            koniec = min(start + krok, len(maska_par))
+            okno = np.asarray(tokeny[start:koniec + odleglosc])
+            # Numer zdania w oknie: granica zdania między i a i+1 zwiększa numer tokenu i+1
+            zdania = np.zeros(len(okno), dtype=np.int64)
+            np.cumsum(~maska_par[start:start + len(okno) - 1], out=zdania[1:])
+            wszystkie_klucze, wszystkie_pozycje = [], []
+            for d in range(1, odleglosc + 1):
+                n = min(koniec - start, len(okno) - d)
+                slowo1, slowo2 = okno[:n], okno[d:d + n]
+                maska = (zdania[:n] == zdania[d:d + n]) & maska_slownika[slowo1] & maska_slownika[slowo2]
+                wszystkie_pozycje.append(np.flatnonzero(maska))
+                wszystkie_klucze.append(klucze_par(slowo1[maska], slowo2[maska], ranga))
+            klucze, pozycje = np.concatenate(wszystkie_klucze), np.concatenate(wszystkie_pozycje)
+            unikalne, pierwsze, liczby = zlicz_klucze(klucze)
+            if odleglosc == 1:
+                pierwsze = pozycje[pierwsze]
+            else:
+                # Pierwsza pozycja klucza - minimum po wszystkich odległościach
+                pierwsze = np.full(len(unikalne), np.iinfo(np.int64).max, dtype=np.int64)
+                np.minimum.at(pierwsze, np.searchsorted(unikalne, klucze), pozycje)
+            czesci.append((unikalne, start + pierwsze, liczby))
+        return cls.z_czesci(slownik, czesci)
+
+    def __len__(self) -> int:
+        return len(self.wagi)
+
+    def przytnij(self, min_czestotliwosc: int) -> 'MacierzSasiedztwa':
+        maska = self.wagi >= min_czestotliwosc
+        return MacierzSasiedztwa(self.slownik, self.klucze[maska], self.pierwsze[maska], self.wagi[maska])
+
+    def dolacz(self, delta: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> 'MacierzSasiedztwa':
+        # Delta może mieć ujemne wagi (cofnięcie); pary z wagą 0 są usuwane
+        klucze, pierwsze, wagi = dolacz_posortowane((self.klucze, self.pierwsze, self.wagi), delta)
+        if (wagi <= 0).any():
+            maska = wagi > 0
+            klucze, pierwsze, wagi = klucze[maska], pierwsze[maska], wagi[maska]
+        return MacierzSasiedztwa(self.slownik, klucze, pierwsze, wagi)
+
+    def aktualizuj_przyciete(self, pelna: 'MacierzSasiedztwa', klucze_delty: np.ndarray,
+                             min_czestotliwosc: int) -> 'MacierzSasiedztwa':
+        # self = pelna.przytnij(min) sprzed dołączenia delty; zmieniają się tylko pary z delty.
+        # Pary z delty, których już nie ma w pelnej lub spadły poniżej progu, są usuwane
+        pozycje = np.searchsorted(pelna.klucze, klucze_delty)
+        istnieje = pozycje < len(pelna.klucze)
+        istnieje[istnieje] = pelna.klucze[pozycje[istnieje]] == klucze_delty[istnieje]
+        wagi = np.zeros(len(klucze_delty), dtype=np.int64)
+        wagi[istnieje] = pelna.wagi[pozycje[istnieje]]
+        maska = wagi >= min_czestotliwosc
+
+        klucze, pierwsze, wagi_grafu = self.klucze, self.pierwsze, self.wagi
+        if not maska.all():
+            zostaja = ~np.isin(klucze, klucze_delty[~maska])
+            klucze, pierwsze, wagi_grafu = klucze[zostaja], pierwsze[zostaja], wagi_grafu[zostaja]
+        return MacierzSasiedztwa(pelna.slownik, *dolacz_posortowane(
+            (klucze, pierwsze, wagi_grafu),
+            (klucze_delty[maska], pelna.pierwsze[pozycje[maska]], wagi[maska]),
+            sumuj=False
+        ))
+
+    def krawedzie(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # (slowo1, slowo2, waga) w kolejności pierwszego wystąpienia pary
+        if self._krawedzie is None:
+            kolejnosc = np.argsort(self.pierwsze, kind='stable')
+            klucze = self.klucze[kolejnosc]
+            self._krawedzie = (
+                (klucze >> np.uint64(32)).astype(np.int64),
+                (klucze & np.uint64(0xFFFFFFFF)).astype(np.int64),
+                self.wagi[kolejnosc],
+            )
+        return self._krawedzie
+
+    @property
+    def macierz(self) -> 'sp.csr_matrix':
+        if self._macierz is None:
+            import scipy.sparse as sp
+            slowo1 = (self.klucze >> np.uint64(32)).astype(np.int64)
+            slowo2 = (self.klucze & np.uint64(0xFFFFFFFF)).astype(np.int64)
+            poza_przekatna = slowo1 != slowo2
+            wiersze = np.concatenate([slowo1, slowo2[poza_przekatna]])
+            kolumny = np.concatenate([slowo2, slowo1[poza_przekatna]])
+            dane = np.concatenate([self.wagi, self.wagi[poza_przekatna]])
+            n = len(self.slownik)
+            self._macierz = sp.coo_matrix((dane, (wiersze, kolumny)), shape=(n, n)).tocsr()
+        return self._macierz
+
+    def wezly(self) -> np.ndarray:
+        # Identyfikatory węzłów w kolejności dodawania do nx.Graph (add_edge(u, v) krawędź po krawędzi)
+        slowo1, slowo2, _ = self.krawedzie()
+        przeplecione = np.empty(2 * len(self), dtype=np.int64)
+        przeplecione[0::2] = slowo1
+        przeplecione[1::2] = slowo2
+        unikalne, pierwsze = np.unique(przeplecione, return_index=True)
+        return unikalne[np.argsort(pierwsze, kind='stable')]
+
+    def stopnie(self) -> np.ndarray:
+        # Stopień jak w networkx: pętla własna liczona podwójnie
+        n = len(self.slownik)
+        slowo1 = (self.klucze >> np.uint64(32)).astype(np.int64)
+        slowo2 = (self.klucze & np.uint64(0xFFFFFFFF)).astype(np.int64)
+        return np.bincount(slowo1, minlength=n) + np.bincount(slowo2, minlength=n)
+
+    def liczba_wezlow(self) -> int:
+        return len(self.wezly())
+
+    def do_networkx(self, wezly: Optional[np.ndarray] = None) -> 'nx.Graph':
+        import networkx as nx
+
+        slowo1, slowo2, wagi = self.krawedzie()
+        kolejnosc_wezlow = self.wezly()
+
+        if wezly is not None:
+            wybrane = np.zeros(len(self.slownik), dtype=bool)
+            wybrane[wezly] = True
+            maska = wybrane[slowo1] & wybrane[slowo2]
+            slowo1, slowo2, wagi = slowo1[maska], slowo2[maska], wagi[maska]
+            kolejnosc_wezlow = kolejnosc_wezlow[wybrane[kolejnosc_wezlow]]
+
+        slownik = self.slownik
+        G = nx.Graph()
+        G.add_nodes_from(slownik[i] for i in kolejnosc_wezlow.tolist())
+        G.add_weighted_edges_from(
+            (slownik[a], slownik[b], w)
+            for a, b, w in zip(slowo1.tolist(), slowo2.tolist(), wagi.tolist())
+        )
+        return G
@@ -0,0 +1,89 @@
+import numpy as np
+from typing import Optional, Tuple
+
+from macierz_sasiedztwa import MacierzSasiedztwa
+
+MIARY = ('liczba', 'pmi', 'ppmi', 'llr')
+
+
+def rozbij_klucze(klucze: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    return (klucze >> np.uint64(32)).astype(np.int64), (klucze & np.uint64(0xFFFFFFFF)).astype(np.int64)
+
+
+def marginesy(macierz: MacierzSasiedztwa) -> Tuple[np.ndarray, np.ndarray, int]:
+    # Liczby par w symetrycznej macierzy współwystępowań: para (x, x) to dwa wpisy (x obok x
+    # z lewej i z prawej), więc suma wierszy = suma całej macierzy = 2 * liczba par
+    slowo1, slowo2 = rozbij_klucze(macierz.klucze)
+    wagi = macierz.wagi.astype(np.float64)
+    n = len(macierz.slownik)
+    wiersze = np.bincount(slowo1, wagi, minlength=n) + np.bincount(slowo2, wagi, minlength=n)
+    k11 = wagi * np.where(slowo1 == slowo2, 2.0, 1.0)
+    return k11, wiersze, 2 * int(macierz.wagi.sum())
+
+
+def _xlogx(k: np.ndarray, oczekiwane: np.ndarray) -> np.ndarray:
+    # k * log(k / oczekiwane), z 0 * log 0 = 0
+    wynik = np.zeros_like(k)
+    dodatnie = k > 0
+    wynik[dodatnie] = k[dodatnie] * np.log(k[dodatnie] / oczekiwane[dodatnie])
+    return wynik
+
+
+def ocen(macierz: MacierzSasiedztwa, miara: str = 'ppmi') -> np.ndarray:
+    # Wynik każdej pary (w kolejności kluczy) liczony naraz dla całej tablicy par:
+    # pmi = log p(x,y) / (p(x) p(y)), ppmi = max(pmi, 0), llr = G^2 Dunninga z tabeli 2x2
+    if miara not in MIARY:
+        raise ValueError(f"Nieznana miara: {miara} (dostępne: {', '.join(MIARY)})")
+    if miara == 'liczba':
+        return macierz.wagi.astype(np.float64)
+
+    k11, wiersze, n = marginesy(macierz)
+    slowo1, slowo2 = rozbij_klucze(macierz.klucze)
+    c1, c2 = wiersze[slowo1], wiersze[slowo2]
+
+    if miara in ('pmi', 'ppmi'):
+        pmi = np.log(k11 * n / (c1 * c2))
+        return np.maximum(pmi, 0.0) if miara == 'ppmi' else pmi
+
+    k12 = c1 - k11
+    k21 = c2 - k11
+    k22 = n - c1 - c2 + k11
+    return 2.0 * (_xlogx(k11, c1 * c2 / n) + _xlogx(k12, c1 * (n - c2) / n)
+                  + _xlogx(k21, (n - c1) * c2 / n) + _xlogx(k22, (n - c1) * (n - c2) / n))
+
+
+def najlepsze_w_wierszach(macierz: MacierzSasiedztwa, wyniki: np.ndarray, top_n: int) -> np.ndarray:
+    # Maska par należących do top_n najwyżej ocenionych sąsiadów co najmniej jednego ze słów
+    slowo1, slowo2 = rozbij_klucze(macierz.klucze)
+    m = len(macierz)
+    wiersze = np.concatenate([slowo1, slowo2])
+    krawedz = np.concatenate([np.arange(m), np.arange(m)])
+    punkty = np.concatenate([wyniki, wyniki])
+
+    kolejnosc = np.lexsort((-punkty, wiersze))
+    wiersze = wiersze[kolejnosc]
+    # Pozycja w wierszu = indeks - początek wiersza w posortowanej tablicy
+    poczatki = np.searchsorted(wiersze, wiersze, side='left')
+    w_top = (np.arange(len(wiersze)) - poczatki) < top_n
+
+    maska = np.zeros(m, dtype=bool)
+    maska[krawedz[kolejnosc][w_top]] = True
+    return maska
+
+
+def wybierz_krawedzie(macierz: MacierzSasiedztwa, miara: str = 'ppmi', min_czestotliwosc: int = 1,
+                      top_n: Optional[int] = None) -> MacierzSasiedztwa:
+    # Macierz z wagami = wynik miary; marginesy z pełnych liczników, potem odcięcie rzadkich
+    # par, par bez dodatniego wyniku (ppmi) i par spoza top_n sąsiadów obu słów
+    if top_n is not None and top_n < 1:
+        raise ValueError(f"top_n musi być dodatnie (podano {top_n})")
+    wyniki = ocen(macierz, miara)
+    maska = macierz.wagi >= min_czestotliwosc
+    if miara == 'ppmi':
+        maska &= wyniki > 0
+    przyciete = MacierzSasiedztwa(macierz.slownik, macierz.klucze[maska], macierz.pierwsze[maska], wyniki[maska])
+    if top_n is not None:
+        maska = najlepsze_w_wierszach(przyciete, przyciete.wagi, top_n)
+        przyciete = MacierzSasiedztwa(macierz.slownik, przyciete.klucze[maska],
+                                      przyciete.pierwsze[maska], przyciete.wagi[maska])
+    return przyciete
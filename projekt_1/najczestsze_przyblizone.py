@@ -0,0 +1,152 @@
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+
+from zliczanie_rownolegle import zlicz_tekst
+from macierz_sasiedztwa import MacierzSasiedztwa, klucze_par, ranga_alfabetyczna
+from tabela_czestotliwosci import TabelaCzestotliwosci, tablica_obiektow
+
+POJEMNOSC = 100_000
+SEPARATOR_PARY = ' '
+
+
+def przytnij(liczby: np.ndarray, pojemnosc: int) -> Tuple[np.ndarray, int]:
+    # Indeksy `pojemnosc` największych liczników i największy odrzucony licznik (0, gdy nic nie odrzucono)
+    if len(liczby) <= pojemnosc:
+        return np.arange(len(liczby)), 0
+    kolejnosc = np.argpartition(-liczby, pojemnosc)
+    return kolejnosc[:pojemnosc], int(liczby[kolejnosc[pojemnosc:]].max())
+
+
+# Podsumowanie Space-Saving o stałej pojemności: elementy (napisy) z licznikiem - górnym
+# oszacowaniem częstości - i błędem (licznik - błąd <= częstość <= licznik). Podsumowania
+# paczek łączone są regułą scalania Space-Saving: element nieobecny w podsumowaniu ma tam
+# częstość co najwyżej równą jego progowi. Każdy element o częstości > prog jest śledzony.
+class SzkicNajczestszych:
+    def __init__(self, pojemnosc: int = POJEMNOSC):
+        self.pojemnosc = pojemnosc
+        self.klucze = np.zeros(0, dtype=object)
+        self.liczniki = np.zeros(0, dtype=np.int64)
+        self.bledy = np.zeros(0, dtype=np.int64)
+        self.prog = 0
+        self.suma = 0
+
+    def __len__(self) -> int:
+        return len(self.klucze)
+
+    def dodaj(self, klucze: np.ndarray, liczby: np.ndarray, prog: int = 0,
+              suma: Optional[int] = None, bledy_paczki: Optional[np.ndarray] = None) -> None:
+        # klucze - unikalne; prog - górna granica częstości elementów spoza paczki,
+        # suma - liczba wszystkich wystąpień w paczce (przed przycięciem),
+        # bledy_paczki - błędy liczb paczki, gdy sama jest podsumowaniem (domyślnie liczby dokładne)
+        liczby = np.asarray(liczby, dtype=np.int64)
+        self.suma += int(liczby.sum()) if suma is None else suma
+
+        wszystkie = np.concatenate([self.klucze, np.asarray(klucze, dtype=object)])
+        unikalne, odwrotne = np.unique(wszystkie, return_inverse=True)
+        n = len(self.klucze)
+
+        # Nieobecne w szkicu: prog szkicu, nieobecne w paczce: prog paczki
+        liczniki = np.full(len(unikalne), self.prog, dtype=np.int64)
+        bledy = np.full(len(unikalne), self.prog, dtype=np.int64)
+        liczniki[odwrotne[:n]] = self.liczniki
+        bledy[odwrotne[:n]] = self.bledy
+        liczniki += prog
+        bledy += prog
+        liczniki[odwrotne[n:]] += liczby - prog
+        bledy[odwrotne[n:]] -= prog
+        if bledy_paczki is not None:
+            bledy[odwrotne[n:]] += bledy_paczki
+
+        zostaja, odrzucony = przytnij(liczniki, self.pojemnosc)
+        self.klucze, self.liczniki, self.bledy = unikalne[zostaja], liczniki[zostaja], bledy[zostaja]
+        self.prog = max(self.prog + prog, odrzucony)
+
+    def scal(self, inny: 'SzkicNajczestszych') -> None:
+        # Podsumowanie innej części strumienia - jak paczka, razem z jej błędami
+        self.dodaj(inny.klucze, inny.liczniki, inny.prog, inny.suma, inny.bledy)
+
+    def najczestsze(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Malejąco po liczniku, przy remisie alfabetycznie (ranga bez tablicy <U{najdłuższy klucz})
+        kolejnosc = np.lexsort((ranga_alfabetyczna(self.klucze), -self.liczniki))
+        return self.klucze[kolejnosc], self.liczniki[kolejnosc], self.bledy[kolejnosc]
+
+    def pewne(self) -> np.ndarray:
+        # Elementy, których częstość na pewno przekracza częstość każdego nieśledzonego
+        return (self.liczniki - self.bledy) > self.prog
+
+    def raport(self, nazwa: str) -> str:
+        return (f"{nazwa}: śledzone {len(self):,} (pojemność {self.pojemnosc:,}) z {self.suma:,} wystąpień; "
+                f"nieśledzone mają częstość <= {self.prog:,}, maks. błąd licznika {int(self.bledy.max(initial=0)):,}, "
+                f"pewne: {int(self.pewne().sum()):,}")
+
+
+# Przybliżone liczniki słów i par sąsiednich słów dla strumienia tekstu w stałej pamięci:
+# każdy blok liczony dokładnie (zlicz_tekst), przycinany do pojemności i scalany ze szkicem.
+# Pary w obrębie zdania i przez granice bloków - jak w WynikZliczania.
+class StrumienNajczestszych:
+    def __init__(self, czy_wyraz: Callable[[str], bool], pojemnosc: int = POJEMNOSC,
+                 pojemnosc_par: Optional[int] = None):
+        self.czy_wyraz = czy_wyraz
+        self.slowa = SzkicNajczestszych(pojemnosc)
+        self.pary = SzkicNajczestszych(pojemnosc_par or 2 * pojemnosc)
+        # Ostatni token otwartego zdania - do pary z pierwszym tokenem następnego bloku
+        self.ostatni = None
+
+    def nowy_plik(self) -> None:
+        self.ostatni = None
+
+    def dodaj_tekst(self, tekst: str) -> None:
+        czesc = zlicz_tekst(tekst)
+        slownik = czesc['slownik']
+
+        maska = np.fromiter((self.czy_wyraz(t) for t in slownik), dtype=bool, count=len(slownik))
+        liczniki = czesc['liczniki'] * maska
+        zostaja, prog = przytnij(liczniki, self.slowa.pojemnosc)
+        zostaja = zostaja[liczniki[zostaja] > 0]
+        self.slowa.dodaj(tablica_obiektow([slownik[i] for i in zostaja.tolist()]),
+                         liczniki[zostaja], prog, int(liczniki.sum()))
+
+        klucze, liczby = czesc['klucze_par'], czesc['liczby_par']
+        if (self.ostatni is not None and czesc['pierwszy'] is not None and czesc['otwarty_poczatek']
+                and len(self.ostatni) > 1 and len(czesc['pierwszy']) > 1):
+            # Para przez granicę bloków; poprzednie słowo spoza bloku dopisywane do lokalnego słownika
+            if self.ostatni not in slownik:
+                slownik = slownik + [self.ostatni]
+            para = klucze_par(np.array([slownik.index(self.ostatni)]), np.array([slownik.index(czesc['pierwszy'])]),
+                              ranga_alfabetyczna(slownik))
+            klucze, odwrotne = np.unique(np.concatenate([klucze, para]), return_inverse=True)
+            liczby = np.bincount(odwrotne, weights=np.append(liczby, 1)).astype(np.int64)
+
+        zostaja, prog = przytnij(liczby, self.pary.pojemnosc)
+        slowo1 = (klucze[zostaja] >> np.uint64(32)).astype(np.int64).tolist()
+        slowo2 = (klucze[zostaja] & np.uint64(0xFFFFFFFF)).astype(np.int64).tolist()
+        self.pary.dodaj(tablica_obiektow([slownik[a] + SEPARATOR_PARY + slownik[b] for a, b in zip(slowo1, slowo2)]),
+                        liczby[zostaja], prog, int(liczby.sum()))
+
+        if czesc['pierwszy'] is None:
+            if not czesc['otwarty_poczatek']:
+                self.ostatni = None
+        else:
+            self.ostatni = czesc['ostatni'] if czesc['otwarty_koniec'] else None
+
+    def wyniki(self) -> Tuple[List[str], TabelaCzestotliwosci, np.ndarray, MacierzSasiedztwa]:
+        # Słownik (słowa z tabeli, potem słowa występujące tylko w parach), tabela rang
+        # z oszacowanymi częstościami i błędami oraz macierz par (kolejność krawędzi: malejąca waga)
+        slowa, liczniki, bledy = self.slowa.najczestsze()
+        slownik = slowa.tolist()
+        indeks = {slowo: i for i, slowo in enumerate(slownik)}
+
+        pary, wagi, _ = self.pary.najczestsze()
+        rozbite = [p.split(SEPARATOR_PARY) for p in pary.tolist()]
+        for slowo in (s for para in rozbite for s in para):
+            if slowo not in indeks:
+                indeks[slowo] = len(slownik)
+                slownik.append(slowo)
+
+        klucze = np.array([(indeks[a] << 32) | indeks[b] for a, b in rozbite], dtype=np.uint64)
+        kolejnosc = np.argsort(klucze)
+        macierz = MacierzSasiedztwa(slownik, klucze[kolejnosc], kolejnosc.astype(np.int64), wagi[kolejnosc])
+
+        ids = np.arange(len(slowa), dtype=np.int64)
+        tabela = TabelaCzestotliwosci(tablica_obiektow(slownik)[ids], liczniki, ids, suma=self.slowa.suma)
+        return slownik, tabela, bledy, macierz
@@ -0,0 +1,235 @@
+import os
+import sys
+import json
+import hashlib
+import numpy as np
+from typing import Callable, Optional
+
+from zliczanie_rownolegle import (WynikZliczania, zlicz_fragmenty, zlicz_tekst, fragmenty_zakresu,
+                                  ostatnia_granica, poczatek_przyrostu, ROZMIAR_FRAGMENTU)
+from macierz_sasiedztwa import MacierzSasiedztwa, scal_czesci
+from tabela_czestotliwosci import TabelaCzestotliwosci, tablica_obiektow
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.magazyn_korpusu import KATALOG_REPO
+
+KATALOG_STANOW = os.path.join(KATALOG_REPO, '.pjn_cache', 'stany')
+ROZMIAR_OGONA = 64 * 1024
+
+
+def hash_zakresu(sciezka: str, start: int, koniec: int) -> str:
+    with open(sciezka, 'rb') as f:
+        f.seek(start)
+        return hashlib.blake2b(f.read(koniec - start), digest_size=16).hexdigest()
+
+
+# Zapisany stan analizy rosnącego korpusu: liczniki słów, wszystkie pary, tabela rang
+# i graf przycięty progiem min_czestotliwosc. Przetworzony plik (do końca) rozpoznawany
+# jest po długości i hashu ostatnich ROZMIAR_OGONA bajtów; nowy tekst doliczany jest
+# jako przyrost, a tabela i graf zmieniają się tylko dla słów i par z przyrostu.
+# Końcówka - tekst po ostatnim białym znaku - może być początkiem słowa dokończonego
+# dopisanym tekstem: przed przyrostem jest cofany i liczony ponownie razem z nim.
+# Liczenie przyrostu jest proporcjonalne do nowego tekstu, ale scalenie nie: tabela
+# (np.insert), klucze par i graf są kopiowane, a zapisz przepisuje wszystkie tablice,
+# więc aktualizacja kosztuje O(słownik + pary) niezależnie od wielkości przyrostu.
+class StanKorpusu:
+    def __init__(self, sciezka_korpusu: str, czy_wyraz: Callable[[str], bool], katalog: str):
+        self.sciezka_korpusu = sciezka_korpusu
+        self.czy_wyraz = czy_wyraz
+        self.katalog = katalog
+        self.wyzeruj()
+
+    def wyzeruj(self) -> None:
+        self.wynik = WynikZliczania()
+        self.maska = np.zeros(0, dtype=bool)
+        self.przetworzono = 0
+        self.hash_ogona = None
+        # Stan sprzed końcówki: granica (ostatni biały znak), pozycja, ostatni, liczba_slow
+        self.koncowka = None
+        self.pary = MacierzSasiedztwa(self.wynik.slownik, np.zeros(0, dtype=np.uint64),
+                                      np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+        self.tabela = None
+        self.graf = None
+        self.min_czestotliwosc = None
+
+    @property
+    def slownik(self):
+        return self.wynik.slownik
+
+    @property
+    def liczniki(self) -> np.ndarray:
+        return self.wynik.liczniki * self.maska
+
+    @classmethod
+    def wczytaj(cls, sciezka_korpusu: str, czy_wyraz: Callable[[str], bool],
+                katalog: Optional[str] = None) -> 'StanKorpusu':
+        if katalog is None:
+            klucz = hashlib.blake2b(os.path.abspath(sciezka_korpusu).encode(), digest_size=8).hexdigest()
+            katalog = os.path.join(KATALOG_STANOW, klucz)
+
+        stan = cls(sciezka_korpusu, czy_wyraz, katalog)
+        if not os.path.exists(os.path.join(katalog, 'meta.json')):
+            return stan
+
+        with open(os.path.join(katalog, 'meta.json'), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(os.path.join(katalog, 'slownik.txt'), 'r', encoding='utf-8') as f:
+            slownik = f.read().split('\n')[:-1]
+
+        wynik = stan.wynik
+        wynik.slownik = slownik
+        wynik.indeks = {slowo: i for i, slowo in enumerate(slownik)}
+        wynik.liczniki = np.load(os.path.join(katalog, 'liczniki.npy'))
+        wynik.pozycja = meta['pozycja']
+        wynik.ostatni = meta['ostatni']
+
+        stan.maska = np.fromiter((czy_wyraz(t) for t in slownik), dtype=bool, count=len(slownik))
+        stan.przetworzono = meta['przetworzono']
+        stan.hash_ogona = meta['hash_ogona']
+        stan.koncowka = meta.get('koncowka')
+        stan.pary = MacierzSasiedztwa(slownik, *stan._wczytaj_pary('pary'))
+
+        ids = np.load(os.path.join(katalog, 'tabela_ids.npy'))
+        stan.tabela = TabelaCzestotliwosci(tablica_obiektow(slownik)[ids], stan.liczniki[ids], ids)
+
+        if meta['min_czestotliwosc'] is not None:
+            stan.min_czestotliwosc = meta['min_czestotliwosc']
+            stan.graf = MacierzSasiedztwa(slownik, *stan._wczytaj_pary('graf'))
+
+        return stan
+
+    def _wczytaj_pary(self, przedrostek: str):
+        return tuple(np.load(os.path.join(self.katalog, f'{przedrostek}_{nazwa}.npy'))
+                     for nazwa in ('klucze', 'pierwsze', 'wagi'))
+
+    def zapisz(self) -> None:
+        os.makedirs(self.katalog, exist_ok=True)
+
+        def zapisz_npy(nazwa, tablica):
+            sciezka = os.path.join(self.katalog, nazwa)
+            np.save(sciezka + '.tmp.npy', tablica)
+            os.replace(sciezka + '.tmp.npy', sciezka)
+
+        with open(os.path.join(self.katalog, 'slownik.txt.tmp'), 'w', encoding='utf-8') as f:
+            for slowo in self.slownik:
+                f.write(slowo + '\n')
+        os.replace(os.path.join(self.katalog, 'slownik.txt.tmp'), os.path.join(self.katalog, 'slownik.txt'))
+
+        zapisz_npy('liczniki.npy', self.wynik.liczniki)
+        zapisz_npy('tabela_ids.npy', self.tabela.ids)
+        for przedrostek, pary in [('pary', self.pary), ('graf', self.graf)]:
+            if pary is not None:
+                zapisz_npy(f'{przedrostek}_klucze.npy', pary.klucze)
+                zapisz_npy(f'{przedrostek}_pierwsze.npy', pary.pierwsze)
+                zapisz_npy(f'{przedrostek}_wagi.npy', pary.wagi)
+
+        meta = {
+            'zrodlo': os.path.abspath(self.sciezka_korpusu),
+            'przetworzono': self.przetworzono,
+            'hash_ogona': self.hash_ogona,
+            'koncowka': self.koncowka,
+            'pozycja': self.wynik.pozycja,
+            'ostatni': self.wynik.ostatni,
+            'min_czestotliwosc': self.min_czestotliwosc if self.graf is not None else None,
+        }
+        with open(os.path.join(self.katalog, 'meta.json.tmp'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+        os.replace(os.path.join(self.katalog, 'meta.json.tmp'), os.path.join(self.katalog, 'meta.json'))
+
+    def ustaw_prog(self, min_czestotliwosc: int) -> bool:
+        if self.graf is not None and self.min_czestotliwosc == min_czestotliwosc:
+            return False
+        self.min_czestotliwosc = min_czestotliwosc
+        self.graf = self.pary.przytnij(min_czestotliwosc)
+        return True
+
+    def czy_dopisano(self) -> bool:
+        # Plik nie został skrócony, a ostatnio przetworzone bajty są niezmienione
+        if os.path.getsize(self.sciezka_korpusu) < self.przetworzono:
+            return False
+        start = max(self.przetworzono - ROZMIAR_OGONA, 0)
+        return self.hash_ogona is None or \
+            hash_zakresu(self.sciezka_korpusu, start, self.przetworzono) == self.hash_ogona
+
+    def _cofnij_koncowke(self) -> np.ndarray:
+        # Końcówka liczona ponownie w kontekście sprzed niej i odejmowana; słowa, które dodała
+        # do słownika, są z niego usuwane. Zwraca klucze par, których wagi się zmieniły
+        wynik, koncowka = self.wynik, self.koncowka
+        with open(self.sciezka_korpusu, 'rb') as f:
+            f.seek(koncowka['granica'])
+            tekst = f.read(self.przetworzono - koncowka['granica']).decode('utf-8')
+
+        # Słownik wspólny z wynikiem - wszystkie słowa końcówki już w nim są
+        cofniecie = WynikZliczania()
+        cofniecie.indeks, cofniecie.slownik = wynik.indeks, wynik.slownik
+        cofniecie.liczniki = np.zeros(len(wynik.slownik), dtype=np.int64)
+        cofniecie.pozycja, cofniecie.ostatni = koncowka['pozycja'], koncowka['ostatni']
+        cofniecie.dodaj_fragment(zlicz_tekst(tekst))
+
+        wynik.liczniki -= cofniecie.liczniki
+        wynik.zmienione.extend(cofniecie.zmienione)
+        klucze, pierwsze, liczby = scal_czesci(cofniecie.czesci_par)
+        # Pierwsze wystąpienie pozostałych par leży przed końcówką - bez zmian
+        self.pary = self.pary.dolacz((klucze, np.full_like(pierwsze, np.iinfo(np.int64).max), -liczby))
+
+        n = koncowka['liczba_slow']
+        for slowo in wynik.slownik[n:]:
+            del wynik.indeks[slowo]
+        del wynik.slownik[n:]
+        wynik.liczniki = wynik.liczniki[:n]
+        self.maska = self.maska[:n]
+        wynik.pozycja, wynik.ostatni = koncowka['pozycja'], koncowka['ostatni']
+        self.przetworzono = koncowka['granica']
+        self.koncowka = None
+        return klucze
+
+    def aktualizuj(self, liczba_procesow: Optional[int] = 1,
+                   rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU) -> int:
+        if not self.czy_dopisano():
+            print("Korpus zmieniony poza dopisaniem na końcu - pełne przeliczenie")
+            min_czestotliwosc = self.min_czestotliwosc
+            self.wyzeruj()
+            self.min_czestotliwosc = min_czestotliwosc
+
+        rozmiar = os.path.getsize(self.sciezka_korpusu)
+        if rozmiar <= self.przetworzono and self.tabela is not None:
+            return 0
+
+        poprzednio = self.przetworzono
+        wynik = self.wynik
+        wynik.czesci_par = []
+        wynik.zmienione = []
+        klucze_cofniete = self._cofnij_koncowke() if self.koncowka is not None else np.zeros(0, dtype=np.uint64)
+
+        # Tekst do ostatniego białego znaku, potem końcówka osobno - do jej cofnięcia
+        # potrzebny jest stan sprzed niej
+        granica = ostatnia_granica(self.sciezka_korpusu)
+        start = poczatek_przyrostu(self.sciezka_korpusu, self.przetworzono)
+        fragmenty = fragmenty_zakresu(self.sciezka_korpusu, start, granica, rozmiar_fragmentu)
+        zlicz_fragmenty(fragmenty, wynik, liczba_procesow)
+        if granica < rozmiar:
+            self.koncowka = {'granica': granica, 'pozycja': wynik.pozycja, 'ostatni': wynik.ostatni,
+                         'liczba_slow': len(wynik.slownik)}
+            zlicz_fragmenty([(self.sciezka_korpusu, granica, rozmiar)], wynik, 1)
+
+        nowe = wynik.slownik[len(self.maska):]
+        self.maska = np.concatenate([self.maska, np.fromiter(
+            (self.czy_wyraz(t) for t in nowe), dtype=bool, count=len(nowe)
+        )])
+
+        zmienione = np.unique(np.concatenate(wynik.zmienione)) if wynik.zmienione else np.zeros(0, dtype=np.int64)
+        if self.tabela is None:
+            self.tabela = TabelaCzestotliwosci.z_licznikow(self.liczniki, self.slownik)
+        else:
+            self.tabela = self.tabela.aktualizuj(zmienione, self.liczniki, self.slownik)
+
+        delta = scal_czesci(wynik.czesci_par)
+        wynik.czesci_par = []
+        self.pary = self.pary.dolacz(delta)
+        if self.graf is not None:
+            self.graf = self.graf.aktualizuj_przyciete(self.pary, np.union1d(klucze_cofniete, delta[0]),
+                                                       self.min_czestotliwosc)
+
+        self.przetworzono = rozmiar
+        self.hash_ogona = hash_zakresu(self.sciezka_korpusu, max(rozmiar - ROZMIAR_OGONA, 0), rozmiar)
+        return rozmiar - poprzednio
@@ -0,0 +1,95 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def klucz_rangi(czestotliwosci: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    # Rosnący klucz = malejąca częstotliwość, przy remisie rosnący identyfikator
+    return ((np.int64(2**31 - 1) - czestotliwosci) << 32) | ids.astype(np.int64)
+
+
+def tablica_obiektow(elementy: List[str]) -> np.ndarray:
+    tablica = np.empty(len(elementy), dtype=object)
+    tablica[:] = elementy
+    return tablica
+
+
+# Tabela wyraz | r | f | r*f trzymana w kolumnach NumPy, posortowana malejąco po f;
+# ids to identyfikatory wyrazów w słowniku (kolejność pierwszego wystąpienia).
+# suma - liczba wszystkich wystąpień, gdy tabela obejmuje tylko najczęstsze wyrazy
+class TabelaCzestotliwosci:
+    def __init__(self, wyrazy: np.ndarray, czestotliwosci: np.ndarray, ids: Optional[np.ndarray] = None,
+                 suma: Optional[int] = None):
+        self.wyrazy = wyrazy
+        self.ids = ids
+        self.f = czestotliwosci.astype(np.int64, copy=False)
+        self.r = np.arange(1, len(self.f) + 1, dtype=np.int64)
+        self.rf = self.r * self.f
+        self.suma_kumulatywna = np.cumsum(self.f)
+        self._suma = suma
+
+    @classmethod
+    def z_licznikow(cls, liczniki: np.ndarray, slownik: List[str]) -> 'TabelaCzestotliwosci':
+        # Sortowanie stabilne: remisy w kolejności identyfikatorów (pierwszego wystąpienia),
+        # tak jak Counter.most_common
+        kolejnosc = np.argsort(-liczniki, kind='stable')
+        kolejnosc = kolejnosc[liczniki[kolejnosc] > 0]
+
+        return cls(tablica_obiektow(slownik)[kolejnosc], liczniki[kolejnosc], kolejnosc)
+
+    def aktualizuj(self, zmienione: np.ndarray, liczniki: np.ndarray, slownik: List[str]) -> 'TabelaCzestotliwosci':
+        # Nowa tabela po zmianie liczników wyrazów z `zmienione`: pozostałe wiersze zachowują
+        # kolejność, zmienione są sortowane osobno i wstawiane wyszukiwaniem binarnym.
+        # Wiersze wyrazów spoza liczniki (słownik skrócony) są usuwane
+        zmieniony = np.ones(max(len(liczniki), int(self.ids.max()) + 1 if len(self.ids) else 0), dtype=bool)
+        zmieniony[:len(liczniki)] = False
+        zmieniony[zmienione[zmienione < len(liczniki)]] = True
+        zostaja = ~zmieniony[self.ids]
+        ids, f, wyrazy = self.ids[zostaja], self.f[zostaja], self.wyrazy[zostaja]
+
+        zmienione = np.flatnonzero(zmieniony[:len(liczniki)])
+        nowe_f = liczniki[zmienione]
+        zmienione, nowe_f = zmienione[nowe_f > 0], nowe_f[nowe_f > 0]
+        klucze = klucz_rangi(nowe_f, zmienione)
+        kolejnosc = np.argsort(klucze)
+        zmienione, nowe_f, klucze = zmienione[kolejnosc], nowe_f[kolejnosc], klucze[kolejnosc]
+
+        pozycje = np.searchsorted(klucz_rangi(f, ids), klucze)
+        return TabelaCzestotliwosci(
+            np.insert(wyrazy, pozycje, tablica_obiektow([slownik[i] for i in zmienione.tolist()])),
+            np.insert(f, pozycje, nowe_f),
+            np.insert(ids, pozycje, zmienione),
+        )
+
+    def __len__(self) -> int:
+        return len(self.f)
+
+    @property
+    def suma(self) -> int:
+        if self._suma is not None:
+            return self._suma
+        return int(self.suma_kumulatywna[-1]) if len(self) else 0
+
+    @property
+    def pokrycie(self) -> float:
+        # Część wszystkich wystąpień obejmowana przez tabelę (< 1 w trybie przybliżonym)
+        return float(self.suma_kumulatywna[-1]) / self.suma if self.suma else 1.0
+
+    def odciecia(self, poziomy: Sequence[float]) -> Dict[float, int]:
+        # Najmniejsza liczba najczęstszych słów, których suma f >= poziom * suma całkowita
+        progi = np.asarray(poziomy, dtype=np.float64) * self.suma
+        pozycje = np.searchsorted(self.suma_kumulatywna, progi, side='left') + 1
+        pozycje = np.minimum(pozycje, len(self))
+        return {poziom: int(pozycja) for poziom, pozycja in zip(poziomy, pozycje)}
+
+    def do_dataframe(self) -> 'pd.DataFrame':
+        import pandas as pd
+
+        return pd.DataFrame({
+            'wyraz': self.wyrazy,
+            'r': self.r,
+            'f': self.f,
+            'r*f': self.rf,
+        })
@@ -0,0 +1,65 @@
+import os
+import sys
+from importlib.metadata import version
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.magazyn_korpusu import KATALOG_REPO
+
+KATALOG_TAGOW = os.path.join(KATALOG_REPO, '.pjn_cache', 'tagi_pos')
+# Model taggera: nazwa pakietu NLTK i ścieżka zasobu (nowsze NLTK używają wersji _eng)
+ZASOBY_NLTK = [
+    ('averaged_perceptron_tagger', 'taggers/averaged_perceptron_tagger'),
+    ('averaged_perceptron_tagger_eng', 'taggers/averaged_perceptron_tagger_eng'),
+]
+
+
+def zapewnij_zasoby_nltk() -> None:
+    # Sprawdzenie (i ewentualne pobranie) zasobów przy pierwszym tagowaniu, nie przy imporcie
+    import nltk
+
+    for pakiet, zasob in ZASOBY_NLTK:
+        try:
+            nltk.data.find(zasob)
+        except LookupError:
+            nltk.download(pakiet, quiet=True)
+
+
+# Trwała pamięć tagów NLTK słowo -> tag, wspólna dla uruchomień i korpusów
+# (plik TSV dopisywany przy każdym nowym tagowaniu, osobny dla każdej wersji NLTK).
+# Tag zapamiętywany jest z kontekstu, w którym słowo zostało otagowane po raz pierwszy.
+class PamiecTagow:
+    def __init__(self, sciezka: Optional[str] = None):
+        if sciezka is None:
+            # Wersja z metadanych pakietu - bez importu NLTK
+            sciezka = os.path.join(KATALOG_TAGOW, f"nltk-{version('nltk')}.tsv")
+        self.sciezka = sciezka
+        self.tagi: Dict[str, str] = {}
+        self._tagger = None
+
+        if os.path.exists(sciezka):
+            with open(sciezka, 'r', encoding='utf-8') as f:
+                for linia in f:
+                    slowo, _, tag = linia.rstrip('\n').partition('\t')
+                    self.tagi[slowo] = tag
+
+    @property
+    def tagger(self):
+        # Jedna instancja taggera - nltk.pos_tag wczytuje model przy każdym wywołaniu
+        if self._tagger is None:
+            zapewnij_zasoby_nltk()
+            from nltk.tag.perceptron import PerceptronTagger
+            self._tagger = PerceptronTagger()
+        return self._tagger
+
+    def otaguj(self, slowa: List[str]) -> List[str]:
+        # Taguje (jak nltk.pos_tag, jako jedną sekwencję) tylko słowa spoza pamięci
+        nowe = list(dict.fromkeys(s for s in slowa if s not in self.tagi))
+        if nowe:
+            otagowane = self.tagger.tag(nowe)
+            os.makedirs(os.path.dirname(self.sciezka), exist_ok=True)
+            with open(self.sciezka, 'a', encoding='utf-8') as f:
+                for slowo, tag in otagowane:
+                    self.tagi[slowo] = tag
+                    f.write(f'{slowo}\t{tag}\n')
+        return [self.tagi[s] for s in slowa]
@@ -0,0 +1,74 @@
+import os
+import sys
+import numpy as np
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.renderowanie import zakoncz_rysunek, uklad_sprezynowy
+
+# matplotlib i networkx importowane dopiero przy rysowaniu
+if TYPE_CHECKING:
+    import networkx as nx
+
+LICZBA_PUNKTOW_ZIPFA = 2000
+
+
+def probkuj_logarytmicznie(r: np.ndarray, f: np.ndarray,
+                           liczba_punktow: int = LICZBA_PUNKTOW_ZIPFA) -> Tuple[np.ndarray, np.ndarray]:
+    # Jeden punkt na przedział rang o logarytmicznej szerokości (plus ostatnia ranga);
+    # krótsze tabele rysowane bez zmian
+    if len(r) <= liczba_punktow:
+        return r, f
+    indeksy = np.unique(np.geomspace(1, len(r), liczba_punktow).astype(np.int64) - 1)
+    indeksy = np.union1d(indeksy, [len(r) - 1])
+    return r[indeksy], f[indeksy]
+
+
+def rysuj_zipfa(r: np.ndarray, f: np.ndarray, sciezka: Optional[str], dpi: int = 300) -> None:
+    import matplotlib.pyplot as plt
+
+    r, f = probkuj_logarytmicznie(np.asarray(r), np.asarray(f))
+
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 5))
+
+    ax1.plot(r, f, 'b-', linewidth=1.5, alpha=0.7)
+    ax1.set_xlabel('Ranga (r)', fontsize=12)
+    ax1.set_ylabel('Częstotliwość (f)', fontsize=12)
+    ax1.set_title('Prawo Zipfa - Skala Liniowa', fontsize=14, fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+
+    ax2.loglog(r, f, 'r-', linewidth=1.5, alpha=0.7)
+    ax2.set_xlabel('Ranga (r) - skala log', fontsize=12)
+    ax2.set_ylabel('Częstotliwość (f) - skala log', fontsize=12)
+    ax2.set_title('Prawo Zipfa - Skala Logarytmiczna', fontsize=14, fontweight='bold')
+    ax2.grid(True, alpha=0.3, which='both')
+
+    plt.tight_layout()
+
+    zakoncz_rysunek(fig, sciezka, dpi, 'Wykres zapisany')
+
+
+def rysuj_graf_sasiedztwa(podgraf: 'nx.Graph', stopnie: Dict[str, int], top_n: int,
+                          sciezka: Optional[str], dpi: int = 300) -> None:
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    fig = plt.figure(figsize=(16, 12))
+
+    pos = uklad_sprezynowy(podgraf, k=0.5, iterations=50, seed=42)
+
+    rozmiary = [stopnie[node] * 30 for node in podgraf.nodes()]
+
+    nx.draw_networkx_nodes(podgraf, pos, node_size=rozmiary,
+                           node_color='lightblue', alpha=0.7,
+                           edgecolors='navy', linewidths=1.5)
+
+    nx.draw_networkx_edges(podgraf, pos, alpha=0.3, width=0.5)
+
+    nx.draw_networkx_labels(podgraf, pos, font_size=8, font_weight='bold')
+
+    plt.title(f'Graf Sąsiedztwa Słów (Top {top_n})', fontsize=16, fontweight='bold')
+    plt.axis('off')
+    plt.tight_layout()
+
+    zakoncz_rysunek(fig, sciezka, dpi, 'Graf zapisany')
@@ -0,0 +1,104 @@
+import os
+import json
+import numpy as np
+from typing import List, NamedTuple, Optional
+
+from macierz_sasiedztwa import MacierzSasiedztwa
+from tabela_czestotliwosci import TabelaCzestotliwosci, tablica_obiektow
+from dopasowanie_zipfa import WynikDopasowania
+
+WERSJA_FORMATU = 1
+
+
+# Wyniki wczytane z katalogu kolumnowego; tablice NumPy jako memmapy (tylko do odczytu)
+class WynikiKolumnowe(NamedTuple):
+    slownik: List[str]
+    tabela: TabelaCzestotliwosci
+    graf: Optional[MacierzSasiedztwa]
+    rzeczowniki: Optional[np.ndarray]
+    dopasowanie: Optional[WynikDopasowania]
+    meta: dict
+
+
+def _zapisz_npy(katalog: str, nazwa: str, tablica: np.ndarray) -> None:
+    sciezka = os.path.join(katalog, nazwa)
+    np.save(sciezka + '.tmp.npy', np.ascontiguousarray(tablica))
+    os.replace(sciezka + '.tmp.npy', sciezka)
+
+
+def zapisz_kolumnowo(katalog: str, slownik: List[str], tabela: TabelaCzestotliwosci,
+                     graf: Optional[MacierzSasiedztwa] = None, rzeczowniki: Optional[np.ndarray] = None,
+                     dopasowanie: Optional[WynikDopasowania] = None, zrodlo: Optional[str] = None) -> None:
+    # slownik.txt - jedno słowo na linię (identyfikator = numer linii), kolumny tabeli
+    # i krawędzie grafu jako pliki .npy, rzeczowniki - pozycje w tabeli (ranga - 1);
+    # meta.json zapisywany na końcu, więc niepełny zapis nie jest wczytywany
+    os.makedirs(katalog, exist_ok=True)
+    sciezka_meta = os.path.join(katalog, 'meta.json')
+    if os.path.exists(sciezka_meta):
+        os.remove(sciezka_meta)
+
+    with open(os.path.join(katalog, 'slownik.txt.tmp'), 'w', encoding='utf-8') as f:
+        for slowo in slownik:
+            f.write(slowo + '\n')
+    os.replace(os.path.join(katalog, 'slownik.txt.tmp'), os.path.join(katalog, 'slownik.txt'))
+
+    ids = tabela.ids if tabela.ids is not None else np.arange(len(tabela), dtype=np.int64)
+    _zapisz_npy(katalog, 'tabela_ids.npy', ids.astype(np.int64, copy=False))
+    _zapisz_npy(katalog, 'tabela_f.npy', tabela.f)
+    if graf is not None:
+        _zapisz_npy(katalog, 'graf_klucze.npy', graf.klucze)
+        _zapisz_npy(katalog, 'graf_pierwsze.npy', graf.pierwsze)
+        _zapisz_npy(katalog, 'graf_wagi.npy', graf.wagi)
+    if rzeczowniki is not None:
+        _zapisz_npy(katalog, 'rzeczowniki.npy', np.asarray(rzeczowniki, dtype=np.int64))
+
+    meta = {
+        'wersja': WERSJA_FORMATU,
+        'zrodlo': os.path.abspath(zrodlo) if zrodlo else None,
+        'liczba_slow': len(slownik),
+        'liczba_typow': len(tabela),
+        'suma': tabela.suma,
+        'liczba_krawedzi': len(graf) if graf is not None else None,
+        'liczba_rzeczownikow': len(rzeczowniki) if rzeczowniki is not None else None,
+        'dopasowanie': dopasowanie._asdict() if dopasowanie is not None else None,
+    }
+    with open(sciezka_meta + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(sciezka_meta + '.tmp', sciezka_meta)
+
+
+def wczytaj_kolumnowo(katalog: str, mmap: bool = True) -> WynikiKolumnowe:
+    sciezka_meta = os.path.join(katalog, 'meta.json')
+    if not os.path.exists(sciezka_meta):
+        raise FileNotFoundError(f"Brak wyników kolumnowych: {katalog} (najpierw zapisz_wyniki())")
+    with open(sciezka_meta, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta['wersja'] != WERSJA_FORMATU:
+        raise ValueError(f"Nieobsługiwana wersja wyników kolumnowych: {meta['wersja']}")
+
+    tryb = 'r' if mmap else None
+
+    def wczytaj(nazwa):
+        return np.load(os.path.join(katalog, nazwa), mmap_mode=tryb)
+
+    with open(os.path.join(katalog, 'slownik.txt'), 'r', encoding='utf-8') as f:
+        slownik = f.read().split('\n')[:-1]
+
+    ids = wczytaj('tabela_ids.npy')
+    tabela = TabelaCzestotliwosci(tablica_obiektow(slownik)[ids], wczytaj('tabela_f.npy'), ids, meta.get('suma'))
+
+    graf = None
+    if meta['liczba_krawedzi'] is not None:
+        graf = MacierzSasiedztwa(slownik, wczytaj('graf_klucze.npy'),
+                                 wczytaj('graf_pierwsze.npy'), wczytaj('graf_wagi.npy'))
+
+    rzeczowniki = wczytaj('rzeczowniki.npy') if meta['liczba_rzeczownikow'] is not None else None
+
+    dopasowanie = None
+    if meta['dopasowanie'] is not None:
+        # JSON zamienia krotki przedziałów ufności na listy
+        dopasowanie = WynikDopasowania(**{
+            k: tuple(v) if isinstance(v, list) else v for k, v in meta['dopasowanie'].items()
+        })
+
+    return WynikiKolumnowe(slownik, tabela, graf, rzeczowniki, dopasowanie, meta)
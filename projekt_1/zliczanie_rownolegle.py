@@ -0,0 +1,242 @@
+import os
+import re
+import glob
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from macierz_sasiedztwa import klucze_par, zlicz_klucze, ranga_alfabetyczna
+
+ROZMIAR_FRAGMENTU = 32 * 1024 * 1024
+BIALE_ZNAKI = b' \t\n\r\f\v'
+WZORZEC_TOKENU = re.compile(r'\w+')
+WZORZEC_KONCA_ZDANIA = re.compile(r'[.!?]+')
+
+
+def rozwin_zrodla(zrodlo: str) -> List[str]:
+    if os.path.isfile(zrodlo):
+        return [zrodlo]
+
+    if os.path.isdir(zrodlo):
+        pliki = []
+        for katalog, _, nazwy in os.walk(zrodlo):
+            pliki.extend(os.path.join(katalog, n) for n in nazwy if n.endswith('.txt'))
+        return sorted(pliki)
+
+    return sorted(p for p in glob.glob(zrodlo, recursive=True) if os.path.isfile(p))
+
+
+def podziel_na_fragmenty(pliki: List[str], rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU) -> List[Tuple[str, int, int]]:
+    fragmenty = []
+    for plik in pliki:
+        fragmenty.extend(fragmenty_zakresu(plik, 0, os.path.getsize(plik), rozmiar_fragmentu))
+    return fragmenty
+
+
+def fragmenty_zakresu(plik: str, start: int, koniec: int,
+                      rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU) -> List[Tuple[str, int, int]]:
+    # start i koniec muszą leżeć na granicy (0, koniec pliku lub biały znak ASCII)
+    return [
+        (plik, poczatek, min(poczatek + rozmiar_fragmentu, koniec))
+        for poczatek in range(start, max(koniec, start + 1), rozmiar_fragmentu)
+    ]
+
+
+def ostatnia_granica(plik: str) -> int:
+    # Pozycja po ostatnim pełnym słowie: koniec pliku albo ostatni biały znak ASCII
+    rozmiar = os.path.getsize(plik)
+    with open(plik, 'rb') as f:
+        pozycja = rozmiar
+        while pozycja > 0:
+            start = max(pozycja - 4096, 0)
+            f.seek(start)
+            bufor = f.read(pozycja - start)
+            if pozycja == rozmiar and bufor[-1] in BIALE_ZNAKI:
+                return rozmiar
+            for i in range(len(bufor) - 1, -1, -1):
+                if bufor[i] in BIALE_ZNAKI:
+                    return start + i
+            pozycja = start
+    return 0
+
+
+def poczatek_przyrostu(plik: str, pozycja: int) -> int:
+    # Początek dopisanego tekstu jako granica wyrównana: zapisany koniec przetworzonej
+    # części (ostatnia_granica) może być dawnym końcem pliku zakończonego białym znakiem;
+    # po dopisaniu leży na pierwszym nowym słowie i _wyrownaj by je przeskoczył. Cofnięcie
+    # na poprzedzający biały znak nie zmienia podziału, a _wyrownaj go nie przesuwa
+    if pozycja == 0:
+        return 0
+    with open(plik, 'rb') as f:
+        f.seek(pozycja - 1)
+        bajt = f.read(1)
+    return pozycja - 1 if bajt and bajt[0] in BIALE_ZNAKI else pozycja
+
+
+def _wyrownaj(f, pozycja: int, rozmiar: int) -> int:
+    # Granica fragmentu przesuwana do najbliższego białego znaku ASCII - nie przecina
+    # słowa ani znaku UTF-8, a sąsiednie fragmenty wyliczają ją identycznie
+    if pozycja == 0 or pozycja >= rozmiar:
+        return min(pozycja, rozmiar)
+
+    f.seek(pozycja)
+    while True:
+        bufor = f.read(4096)
+        if not bufor:
+            return rozmiar
+        for i, bajt in enumerate(bufor):
+            if bajt in BIALE_ZNAKI:
+                return pozycja + i
+        pozycja += len(bufor)
+
+
+def _zlicz_fragment(fragment: Tuple[str, int, int]) -> Dict:
+    plik, start, koniec = fragment
+    rozmiar = os.path.getsize(plik)
+
+    with open(plik, 'rb') as f:
+        start = _wyrownaj(f, start, rozmiar)
+        koniec = _wyrownaj(f, koniec, rozmiar)
+        f.seek(start)
+        tekst = f.read(max(koniec - start, 0)).decode('utf-8')
+
+    return zlicz_tekst(tekst)
+
+
+def zlicz_tekst(tekst: str) -> Dict:
+    # Liczniki słów i par jednego fragmentu tekstu (bez limitu; słownik lokalny)
+    tekst = tekst.lower()
+    indeks = {}
+    tokeny = []
+    poczatki_zdan = []
+    zdania = WZORZEC_KONCA_ZDANIA.split(tekst)
+    for nr, zdanie in enumerate(zdania):
+        if nr > 0:
+            poczatki_zdan.append(len(tokeny))
+        tokeny.extend([indeks.setdefault(t, len(indeks)) for t in WZORZEC_TOKENU.findall(zdanie)])
+
+    slownik = list(indeks)
+    tokeny = np.array(tokeny, dtype=np.int64)
+    liczniki = np.bincount(tokeny, minlength=len(slownik))
+
+    # Pary sąsiednich tokenów w obrębie zdania, oba dłuższe niż 1 znak,
+    # w porządku alfabetycznym i w kolejności pierwszego wystąpienia
+    dlugie = np.fromiter((len(t) > 1 for t in slownik), dtype=bool, count=len(slownik))
+    maska = np.ones(max(len(tokeny) - 1, 0), dtype=bool)
+    granice = np.array(poczatki_zdan, dtype=np.int64)
+    granice = granice[(granice > 0) & (granice < len(tokeny))]
+    maska[granice - 1] = False
+
+    slowo1, slowo2 = tokeny[:-1], tokeny[1:]
+    maska &= dlugie[slowo1] & dlugie[slowo2]
+    pozycje = np.flatnonzero(maska)
+    klucze = klucze_par(slowo1[maska], slowo2[maska], ranga_alfabetyczna(slownik))
+    klucze, pierwsze, liczby_par = zlicz_klucze(klucze)
+
+    return {
+        'slownik': slownik,
+        'liczniki': liczniki,
+        'klucze_par': klucze,
+        'pierwsze_pary': pozycje[pierwsze],
+        'liczby_par': liczby_par,
+        'liczba_pozycji': len(maska),
+        # Dane do sklejenia par na granicy z sąsiednimi fragmentami
+        'pierwszy': slownik[tokeny[0]] if len(tokeny) else None,
+        'otwarty_poczatek': len(zdania) == 1 or (len(tokeny) > 0 and poczatki_zdan[0] > 0),
+        'ostatni': slownik[tokeny[-1]] if len(tokeny) else None,
+        'otwarty_koniec': not poczatki_zdan or poczatki_zdan[-1] < len(tokeny),
+    }
+
+
+class WynikZliczania:
+    def __init__(self):
+        self.indeks = {}
+        self.slownik = []
+        self.liczniki = np.zeros(0, dtype=np.int64)
+        # Częściowe liczniki par (klucz uint64, pozycja pierwszego wystąpienia, liczba)
+        self.czesci_par = []
+        self.pozycja = 0
+        # Ostatni token otwartego zdania - do sklejenia pary z następnym fragmentem
+        self.ostatni = None
+        self.zmienione = []
+
+    def id_slowa(self, slowo: str) -> int:
+        id_ = self.indeks.get(slowo)
+        if id_ is None:
+            id_ = self.indeks[slowo] = len(self.slownik)
+            self.slownik.append(slowo)
+            self.liczniki = np.append(self.liczniki, 0)
+        return id_
+
+    def dodaj_pare(self, slowo1: str, slowo2: str) -> None:
+        if len(slowo1) > 1 and len(slowo2) > 1:
+            para = tuple(sorted([slowo1, slowo2]))
+            klucz = (self.id_slowa(para[0]) << 32) | self.id_slowa(para[1])
+            self.czesci_par.append((np.array([klucz], dtype=np.uint64),
+                                    np.array([self.pozycja], dtype=np.int64),
+                                    np.ones(1, dtype=np.int64)))
+        self.pozycja += 1
+
+    def nowy_plik(self) -> None:
+        self.ostatni = None
+
+    def dodaj_fragment(self, czesc: Dict) -> None:
+        if self.ostatni is not None and czesc['pierwszy'] is not None and czesc['otwarty_poczatek']:
+            self.dodaj_pare(self.ostatni, czesc['pierwszy'])
+
+        self.scal(czesc)
+
+        if czesc['pierwszy'] is None:
+            if not czesc['otwarty_poczatek']:
+                self.ostatni = None
+        else:
+            self.ostatni = czesc['ostatni'] if czesc['otwarty_koniec'] else None
+
+    def scal(self, czesc: Dict) -> None:
+        indeks = self.indeks
+        mapowanie = np.array([indeks.setdefault(t, len(indeks)) for t in czesc['slownik']], dtype=np.int64)
+        if len(indeks) > len(self.slownik):
+            self.slownik.extend(czesc['slownik'][i] for i in np.flatnonzero(mapowanie >= len(self.slownik)))
+            self.liczniki = np.concatenate([
+                self.liczniki, np.zeros(len(indeks) - len(self.liczniki), dtype=np.int64)
+            ])
+        self.liczniki[mapowanie] += czesc['liczniki']
+        self.zmienione.append(mapowanie)
+
+        klucze = czesc['klucze_par']
+        slowo1 = mapowanie[(klucze >> np.uint64(32)).astype(np.int64)].astype(np.uint64)
+        slowo2 = mapowanie[(klucze & np.uint64(0xFFFFFFFF)).astype(np.int64)].astype(np.uint64)
+        self.czesci_par.append(((slowo1 << np.uint64(32)) | slowo2,
+                                czesc['pierwsze_pary'] + self.pozycja,
+                                czesc['liczby_par']))
+        self.pozycja += czesc['liczba_pozycji']
+
+
+def zlicz_fragmenty(fragmenty: List[Tuple[str, int, int]], wynik: WynikZliczania,
+                    liczba_procesow: Optional[int] = None) -> WynikZliczania:
+    # Redukcja w kolejności fragmentów - słownik i pary zachowują kolejność
+    # pierwszego wystąpienia, jak przy przetwarzaniu szeregowym
+    def redukuj(czesci):
+        poprzedni_plik = None
+        for (plik, _, _), czesc in zip(fragmenty, czesci):
+            if plik != poprzedni_plik and poprzedni_plik is not None:
+                wynik.nowy_plik()
+            poprzedni_plik = plik
+            wynik.dodaj_fragment(czesc)
+
+    # Pojedynczy fragment (np. mały przyrost) liczony bez uruchamiania puli
+    if len(fragmenty) == 1 or liczba_procesow == 1:
+        redukuj(map(_zlicz_fragment, fragmenty))
+    else:
+        with ProcessPoolExecutor(max_workers=liczba_procesow) as pula:
+            redukuj(pula.map(_zlicz_fragment, fragmenty))
+    return wynik
+
+
+def zlicz_rownolegle(zrodlo: str, liczba_procesow: Optional[int] = None,
+                     rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU) -> WynikZliczania:
+    pliki = rozwin_zrodla(zrodlo)
+    if not pliki:
+        raise FileNotFoundError(f"Brak plików dla: {zrodlo}")
+
+    return zlicz_fragmenty(podziel_na_fragmenty(pliki, rozmiar_fragmentu), WynikZliczania(), liczba_procesow)
@@ -1,83 +1,29 @@
+import os
 import streamlit as st
-import json
-import inflect
-from lemminflect import getInflection
+from gramatyka import (CZASY, LICZBY, OSOBY, PRZEDIMKI, PUSTE_DANE, RODZAJE, TablicaOdmian,
+                       build_sentence, wczytaj_dane)
+
+DATA_PATH = 'data.json'
+
+
+@st.cache_resource(max_entries=1, show_spinner="Przygotowanie odmian słów...")
+def load_resources(path, stamp):
+    # Dane i tablica odmian wspólne dla wszystkich sesji; stamp (mtime, rozmiar pliku)
+    # zmienia się przy edycji data.json, więc zmiana pliku wczytuje go ponownie
+    data = wczytaj_dane(path)
+    return data, TablicaOdmian.z_danych(data)
 
-p = inflect.engine()
 
 def load_data():
     try:
-        with open('data.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
+        stat = os.stat(DATA_PATH)
+        return load_resources(DATA_PATH, (stat.st_mtime_ns, stat.st_size))
     except FileNotFoundError:
         st.error("Nie znaleziono pliku data.json! Upewnij się, że jest w tym samym folderze.")
-        return {"nouns": [], "adjectives": [], "verbs": []}
-
-def build_sentence(data):
-    s = data['subject']
-    v = data['verb']
-    o = data['object']
-    
-    subj_noun = p.plural(s['noun']) if s['number'] == "mnoga" else s['noun']
-    subj_phrase = f"{s['adj']} {subj_noun}" if s['adj'] else subj_noun
-    if s['number'] == "pojedyncza":
-        subj_final = p.a(subj_phrase)
-    else:
-        subj_final = subj_phrase
-    
-    v_base = v['base']
-    tense = v['tense']
-    mode = v['type'] 
-    
-    is_3rd_singular = (s['person'] == 3 and s['number'] == "pojedyncza")
-    
-    result = ""
-    
-    if mode == "rozkazujące":
-        return f"{v_base} {o['noun']}!".capitalize()
-
-    if tense == "Present Simple":
-        if mode == "twierdzące":
-            v_form = getInflection(v_base, tag='VBZ' if is_3rd_singular else 'VBP')[0]
-            result = f"{subj_final} {v_form}"
-        elif mode == "przeczące":
-            aux = "doesn't" if is_3rd_singular else "don't"
-            result = f"{subj_final} {aux} {v_base}"
-        elif mode == "pytające":
-            aux = "Does" if is_3rd_singular else "Do"
-            result = f"{aux} {subj_final} {v_base}"
-
-    elif tense == "Past Simple":
-        v_past = getInflection(v_base, tag='VBD')[0]
-        if mode == "twierdzące":
-            result = f"{subj_final} {v_past}"
-        elif mode == "przeczące":
-            result = f"{subj_final} didn't {v_base}"
-        elif mode == "pytające":
-            result = f"Did {subj_final} {v_base}"
-
-    elif tense == "Future Simple":
-        if mode == "twierdzące":
-            result = f"{subj_final} will {v_base}"
-        elif mode == "przeczące":
-            result = f"{subj_final} won't {v_base}"
-        elif mode == "pytające":
-            result = f"Will {subj_final} {v_base}"
-
-    obj_noun = o['noun']
-    if o['article'] == "a/an":
-        obj_final = p.a(obj_noun)
-    elif o['article'] == "the":
-        obj_final = f"the {obj_noun}"
-    else:
-        obj_final = obj_noun
-
-    punctuation = "?" if mode == "pytające" else "."
-    final_sentence = f"{result} {obj_final}{punctuation}"
-    return final_sentence.capitalize()
+        return PUSTE_DANE, TablicaOdmian()
 
 st.set_page_config(page_title="Grammar Builder", page_icon="✍️")
-data = load_data()
+data, odmiany = load_data()
 
 if 'step' not in st.session_state:
     st.session_state.step = 1
@@ -94,8 +40,8 @@ if st.session_state.step == 1:
     with st.expander("Wybierz cechy podmiotu", expanded=True):
         col1, col2 = st.columns(2)
         with col1:
-            number = st.radio("Liczba:", ["pojedyncza", "mnoga"])
-            person = st.select_slider("Osoba:", options=[1, 2, 3], value=3)
+            number = st.radio("Liczba:", LICZBY)
+            person = st.select_slider("Osoba:", options=OSOBY, value=3)
         with col2:
             noun = st.selectbox("Wybierz rzeczownik:", data['nouns'])
             use_adj = st.checkbox("Dodać przymiotnik?")
@@ -114,9 +60,9 @@ elif st.session_state.step == 2:
     
     col1, col2 = st.columns(2)
     with col1:
-        tense = st.selectbox("Wybierz czas:", ["Present Simple", "Past Simple", "Future Simple"])
+        tense = st.selectbox("Wybierz czas:", CZASY)
     with col2:
-        mode = st.radio("Rodzaj zdania:", ["twierdzące", "przeczące", "pytające", "rozkazujące"])
+        mode = st.radio("Rodzaj zdania:", RODZAJE)
 
     c1, c2 = st.columns(2)
     with c1:
@@ -134,7 +80,7 @@ elif st.session_state.step == 2:
 elif st.session_state.step == 3:
     st.subheader("Krok 3: Zdefiniuj Dopełnienie (O)")
     obj_noun = st.selectbox("Wybierz rzeczownik (obiekt):", data['nouns'])
-    article = st.radio("Przedimek:", ["a/an", "the", "brak"])
+    article = st.radio("Przedimek:", PRZEDIMKI)
 
     c1, c2 = st.columns(2)
     with c1:
@@ -152,7 +98,7 @@ elif st.session_state.step == 3:
 elif st.session_state.step == 4:
     st.subheader("Twój wynik:")
     
-    sentence = build_sentence(st.session_state.sentence_data)
+    sentence = build_sentence(st.session_state.sentence_data, odmiany)
     
     st.info("Wygenerowane poprawne zdanie:")
     st.header(f"\"{sentence}\"")
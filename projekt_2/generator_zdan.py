@@ -0,0 +1,235 @@
+import io
+import os
+import csv
+import json
+import math
+import time
+import argparse
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional, Tuple
+
+import numpy as np
+
+from gramatyka import CZASY, LICZBY, OSOBY, PRZEDIMKI, RODZAJE, TablicaOdmian, build_sentence, wczytaj_dane
+
+TRYBY = ('wszystkie', 'losowe')
+FORMATY = ('jsonl', 'csv')
+KOLUMNY = ('subject_noun', 'subject_adj', 'subject_number', 'subject_person',
+           'verb_base', 'verb_tense', 'verb_type', 'object_noun', 'object_article', 'sentence')
+ROZMIAR_PACZKI = 10_000
+# Co ile sekund wypisywany jest postęp zapisu
+CO_ILE_S = 5.0
+
+
+# Wszystkie kombinacje wyborów kreatora: rzeczownik x przymiotnik (lub brak) x liczba x osoba
+# x czasownik x czas x rodzaj x dopełnienie x przedimek. Kombinacja to jeden numer
+# w systemie mieszanym (pierwsza oś najbardziej znacząca) - paczki to zakresy numerów
+# albo losowe numery, bez trzymania kombinacji w pamięci
+class PrzestrzenZdan:
+    def __init__(self, data: dict):
+        self.osie = (data['nouns'], [None] + data['adjectives'], LICZBY, OSOBY,
+                     data['verbs'], CZASY, RODZAJE, data['nouns'], PRZEDIMKI)
+        self.wymiary = tuple(len(o) for o in self.osie)
+        self.liczba = math.prod(self.wymiary)
+        if self.liczba >= 2 ** 63:
+            raise ValueError(f"Za duża przestrzeń zdań: {self.liczba} kombinacji")
+
+    def kombinacje(self, numery: np.ndarray, osie: Optional[tuple] = None) -> Iterator[tuple]:
+        # osie - inne wartości o tych samych wymiarach (np. gotowe fragmenty JSON)
+        cyfry = np.unravel_index(numery, self.wymiary)
+        return zip(*[[wartosci[c] for c in cyfra.tolist()] for wartosci, cyfra in zip(osie or self.osie, cyfry)])
+
+    def osie_json(self) -> tuple:
+        # '"klucz": wartość' każdej wartości osi zakodowane raz - wiersz JSONL sklejany z gotowych
+        # fragmentów daje te same bajty co json.dumps słownika
+        return tuple([f"{json.dumps(klucz)}: {json.dumps(w, ensure_ascii=False)}" for w in wartosci]
+                     for klucz, wartosci in zip(KOLUMNY, self.osie))
+
+    @staticmethod
+    def dane(kombinacja: tuple) -> dict:
+        # Wejście build_sentence - jak st.session_state.sentence_data po czwartym kroku
+        noun, adj, number, person, verb, tense, mode, obj_noun, article = kombinacja
+        return {
+            'subject': {'noun': noun, 'number': number, 'person': person, 'adj': adj},
+            'verb': {'base': verb, 'tense': tense, 'type': mode},
+            'object': {'noun': obj_noun, 'article': article},
+        }
+
+
+def opisy_paczek(przestrzen: PrzestrzenZdan, tryb: str = 'wszystkie', liczba: Optional[int] = None,
+                 ziarno: int = 0, rozmiar_paczki: int = ROZMIAR_PACZKI) -> Iterator[tuple]:
+    # wszystkie: kolejne zakresy numerów (liczba - tylko pierwsze kombinacje);
+    # losowe: liczba numerów losowanych ze zwracaniem, każda paczka z własnego ziarna
+    # (ziarno, nr paczki) - wynik zależy od ziarna i rozmiaru paczki, nie od liczby procesów
+    if tryb not in TRYBY:
+        raise ValueError(f"Nieznany tryb: {tryb} (dostępne: {', '.join(TRYBY)})")
+    if tryb == 'wszystkie':
+        koniec = przestrzen.liczba if liczba is None else min(liczba, przestrzen.liczba)
+        for start in range(0, koniec, rozmiar_paczki):
+            yield ('zakres', start, min(start + rozmiar_paczki, koniec))
+    else:
+        if liczba is None:
+            raise ValueError("Tryb losowe wymaga liczby zdań")
+        if przestrzen.liczba == 0:
+            return
+        for nr, start in enumerate(range(0, liczba, rozmiar_paczki)):
+            yield ('losowe', (ziarno, nr), min(rozmiar_paczki, liczba - start))
+
+
+def numery_paczki(przestrzen: PrzestrzenZdan, opis: tuple) -> np.ndarray:
+    if opis[0] == 'zakres':
+        return np.arange(opis[1], opis[2], dtype=np.int64)
+    return np.random.default_rng(opis[1]).integers(0, przestrzen.liczba, size=opis[2], dtype=np.int64)
+
+
+def zdania(data: dict, tryb: str = 'wszystkie', liczba: Optional[int] = None, ziarno: int = 0,
+           odmiany: Optional[TablicaOdmian] = None,
+           rozmiar_paczki: int = ROZMIAR_PACZKI) -> Iterator[Tuple[dict, str]]:
+    # Pary (dane, zdanie) w bieżącym procesie - w tej samej kolejności co zapisz_zdania
+    przestrzen = PrzestrzenZdan(data)
+    if odmiany is None:
+        odmiany = TablicaOdmian.z_danych(data)
+    for opis in opisy_paczek(przestrzen, tryb, liczba, ziarno, rozmiar_paczki):
+        for kombinacja in przestrzen.kombinacje(numery_paczki(przestrzen, opis)):
+            dane = PrzestrzenZdan.dane(kombinacja)
+            yield dane, build_sentence(dane, odmiany)
+
+
+def naglowek(format_: str) -> str:
+    if format_ != 'csv':
+        return ''
+    bufor = io.StringIO()
+    csv.writer(bufor, lineterminator='\n').writerow(KOLUMNY)
+    return bufor.getvalue()
+
+
+def _formatuj(przestrzen: PrzestrzenZdan, odmiany: TablicaOdmian, opis: tuple, format_: str,
+              osie_json: Optional[tuple] = None) -> Tuple[int, str]:
+    numery = numery_paczki(przestrzen, opis)
+    if format_ == 'csv':
+        wiersze = [(*k, build_sentence(PrzestrzenZdan.dane(k), odmiany)) for k in przestrzen.kombinacje(numery)]
+        bufor = io.StringIO()
+        csv.writer(bufor, lineterminator='\n').writerows(wiersze)
+        return len(wiersze), bufor.getvalue()
+
+    klucz_zdania = json.dumps(KOLUMNY[-1])
+    wiersze = [
+        f"{{{', '.join(fragmenty)}, {klucz_zdania}: "
+        f"{json.dumps(build_sentence(PrzestrzenZdan.dane(k), odmiany), ensure_ascii=False)}}}\n"
+        for k, fragmenty in zip(przestrzen.kombinacje(numery),
+                                przestrzen.kombinacje(numery, osie_json or przestrzen.osie_json()))
+    ]
+    return len(wiersze), ''.join(wiersze)
+
+
+# Stan procesu roboczego: przestrzeń i tablica odmian przekazywane raz, przy starcie puli
+_PRZESTRZEN = None
+_ODMIANY = None
+_OSIE_JSON = None
+
+
+def _przygotuj_proces(przestrzen: PrzestrzenZdan, odmiany: TablicaOdmian) -> None:
+    global _PRZESTRZEN, _ODMIANY, _OSIE_JSON
+    _PRZESTRZEN, _ODMIANY, _OSIE_JSON = przestrzen, odmiany, przestrzen.osie_json()
+
+
+def _formatuj_w_procesie(zadanie: Tuple[tuple, str]) -> Tuple[int, str]:
+    opis, format_ = zadanie
+    return _formatuj(_PRZESTRZEN, _ODMIANY, opis, format_, _OSIE_JSON)
+
+
+def _w_kolejnosci(pula: ProcessPoolExecutor, zadania: Iterable, okno: int) -> Iterator:
+    # Najwyżej okno paczek w toku (Executor.map wysłałby od razu wszystkie) - pamięć
+    # nie rośnie z wielkością przestrzeni, a wyniki wracają w kolejności paczek
+    w_toku = deque()
+    for zadanie in zadania:
+        w_toku.append(pula.submit(_formatuj_w_procesie, zadanie))
+        if len(w_toku) >= okno:
+            yield w_toku.popleft().result()
+    while w_toku:
+        yield w_toku.popleft().result()
+
+
+def generuj_paczki(data: dict, format_: str = 'jsonl', tryb: str = 'wszystkie', liczba: Optional[int] = None,
+                   ziarno: int = 0, rozmiar_paczki: int = ROZMIAR_PACZKI,
+                   liczba_procesow: Optional[int] = None) -> Iterator[Tuple[int, str]]:
+    # Paczki (liczba zdań, sformatowany tekst) w kolejności kombinacji
+    if format_ not in FORMATY:
+        raise ValueError(f"Nieznany format: {format_} (dostępne: {', '.join(FORMATY)})")
+    przestrzen = PrzestrzenZdan(data)
+    odmiany = TablicaOdmian.z_danych(data)
+    opisy = opisy_paczek(przestrzen, tryb, liczba, ziarno, rozmiar_paczki)
+
+    liczba_procesow = liczba_procesow or os.cpu_count()
+    if liczba_procesow == 1:
+        osie_json = przestrzen.osie_json()
+        for opis in opisy:
+            yield _formatuj(przestrzen, odmiany, opis, format_, osie_json)
+        return
+
+    with ProcessPoolExecutor(max_workers=liczba_procesow, initializer=_przygotuj_proces,
+                             initargs=(przestrzen, odmiany)) as pula:
+        yield from _w_kolejnosci(pula, ((opis, format_) for opis in opisy), 2 * liczba_procesow)
+
+
+def zapisz_zdania(sciezka: str, data: dict, format_: str = 'jsonl', tryb: str = 'wszystkie',
+                  liczba: Optional[int] = None, ziarno: int = 0, rozmiar_paczki: int = ROZMIAR_PACZKI,
+                  liczba_procesow: Optional[int] = None) -> dict:
+    przestrzen = PrzestrzenZdan(data)
+    razem = liczba
+    if tryb == 'wszystkie':
+        razem = przestrzen.liczba if liczba is None else min(liczba, przestrzen.liczba)
+    print(f"Przestrzeń zdań: {' x '.join(map(str, przestrzen.wymiary))} = {przestrzen.liczba:,} kombinacji")
+    print(f"Generowanie {razem:,} zdań ({tryb}, {format_}, procesy: {liczba_procesow or os.cpu_count()}) "
+          f"-> {sciezka}")
+
+    start = time.perf_counter()
+    ostatni_wydruk = start
+    zapisano = 0
+    with open(sciezka, 'w', encoding='utf-8', newline='') as f:
+        f.write(naglowek(format_))
+        for n, tekst in generuj_paczki(data, format_, tryb, liczba, ziarno, rozmiar_paczki, liczba_procesow):
+            f.write(tekst)
+            zapisano += n
+            teraz = time.perf_counter()
+            if teraz - ostatni_wydruk >= CO_ILE_S:
+                ostatni_wydruk = teraz
+                print(f"  {zapisano:,} / {razem:,} zdań ({zapisano / (teraz - start):,.0f} zdań/s)")
+
+    czas = time.perf_counter() - start
+    tempo = zapisano / czas if czas > 0 else 0.0
+    print(f"Zapisano {zapisano:,} zdań w {czas:.1f} s ({tempo:,.0f} zdań/s)")
+    return {'zdania': zapisano, 'czas_s': czas, 'zdania_na_s': tempo}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generator zbiorów zdań SVO (wszystkie lub losowe kombinacje '
+                                                 'wyborów kreatora) do JSONL lub CSV')
+    parser.add_argument('--dane', default='data.json', help='plik słów (domyślnie data.json)')
+    parser.add_argument('--wyjscie', default='zdania.jsonl', help='plik wynikowy (domyślnie zdania.jsonl)')
+    parser.add_argument('--format', choices=FORMATY, default=None,
+                        help='format wyjścia (domyślnie z rozszerzenia pliku, inaczej jsonl)')
+    parser.add_argument('--tryb', choices=TRYBY, default='wszystkie',
+                        help='wszystkie kombinacje po kolei lub losowanie ze zwracaniem')
+    parser.add_argument('--liczba', type=int, default=None,
+                        help='liczba zdań (wymagana w trybie losowe; w trybie wszystkie - pierwsze N kombinacji)')
+    parser.add_argument('--ziarno', type=int, default=0, help='ziarno losowania (tryb losowe)')
+    parser.add_argument('--paczka', type=int, default=ROZMIAR_PACZKI, help='liczba zdań w paczce procesu')
+    parser.add_argument('--procesy', type=int, default=0, help='liczba procesów (0 - wszystkie rdzenie)')
+    args = parser.parse_args()
+
+    if args.tryb == 'losowe' and args.liczba is None:
+        parser.error('--tryb losowe wymaga --liczba')
+    format_ = args.format or ('csv' if args.wyjscie.lower().endswith('.csv') else 'jsonl')
+
+    try:
+        data = wczytaj_dane(args.dane)
+    except FileNotFoundError:
+        parser.error(f"Nie znaleziono pliku {args.dane}")
+    zapisz_zdania(args.wyjscie, data, format_, args.tryb, args.liczba, args.ziarno, args.paczka,
+                  args.procesy or None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+import json
+import inflect
+from lemminflect import getInflection
+from typing import Dict, Optional, Tuple
+
+PUSTE_DANE = {"nouns": [], "adjectives": [], "verbs": []}
+# Opcje kroków kreatora (app.py) - te same osie przestrzeni zdań w generator_zdan.py
+LICZBY = ["pojedyncza", "mnoga"]
+OSOBY = [1, 2, 3]
+CZASY = ["Present Simple", "Past Simple", "Future Simple"]
+RODZAJE = ["twierdzące", "przeczące", "pytające", "rozkazujące"]
+PRZEDIMKI = ["a/an", "the", "brak"]
+# Formy czasownika w tablicy odmian (kolejność w krotce)
+FORMY_CZASOWNIKA = ('VBZ', 'VBP', 'VBD')
+# Dowolne słowo po przymiotniku przy wyznaczaniu jego przedimka
+FRAZA_WZORCOWA = 'x'
+
+p = inflect.engine()
+
+
+def wczytaj_dane(sciezka: str = 'data.json') -> dict:
+    with open(sciezka, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Odmiany słów z data.json policzone raz, przed pierwszym zdaniem: rzeczownik -> liczba mnoga
+# i forma z a/an, przymiotnik -> przedimek frazy zaczynającej się od niego, czasownik ->
+# (VBZ, VBP, VBD). Słowa spoza tablicy (np. wybrane w sesji przed zmianą data.json)
+# odmieniane na bieżąco przez inflect i lemminflect
+class TablicaOdmian:
+    def __init__(self, mnogie: Optional[Dict[str, str]] = None, formy_a: Optional[Dict[str, str]] = None,
+                 przedimki: Optional[Dict[str, str]] = None,
+                 czasowniki: Optional[Dict[str, Tuple[str, ...]]] = None):
+        self.mnogie = mnogie or {}
+        self.formy_a = formy_a or {}
+        self.przedimki = przedimki or {}
+        self.czasowniki = czasowniki or {}
+
+    @classmethod
+    def z_danych(cls, data: dict) -> 'TablicaOdmian':
+        mnogie = {noun: p.plural(noun) for noun in data['nouns']}
+        formy_a = {noun: p.a(noun) for noun in data['nouns']}
+        # Reguły inflect dla frazy "przymiotnik rzeczownik" patrzą tylko na przymiotnik i znak
+        # po nim (spację) - dalsza część frazy nie zmienia przedimka; sam przymiotnik może
+        # dostać inny (jednoliterowe: "an x", ale "a x ray")
+        przedimki = {}
+        for adj in data['adjectives']:
+            fraza = f"{adj} {FRAZA_WZORCOWA}"
+            z_przedimkiem = p.a(fraza)
+            przedimek = z_przedimkiem.split(' ', 1)[0]
+            # Fraza zmieniona przez inflect (np. przymiotnik "a") zostaje poza tablicą
+            if z_przedimkiem == f"{przedimek} {fraza}":
+                przedimki[adj] = przedimek
+        czasowniki = {}
+        for verb in data['verbs']:
+            formy = [getInflection(verb, tag=tag) for tag in FORMY_CZASOWNIKA]
+            # Czasownik bez którejś formy zostaje poza tablicą - build_sentence zachowa się jak dotąd
+            if all(formy):
+                czasowniki[verb] = tuple(f[0] for f in formy)
+        return cls(mnogie, formy_a, przedimki, czasowniki)
+
+    def liczba_mnoga(self, noun: str) -> str:
+        mnoga = self.mnogie.get(noun)
+        return mnoga if mnoga is not None else p.plural(noun)
+
+    def z_przedimkiem(self, noun: str, adj: Optional[str] = None) -> str:
+        if adj:
+            przedimek = self.przedimki.get(adj)
+            return f"{przedimek} {adj} {noun}" if przedimek is not None else p.a(f"{adj} {noun}")
+        forma = self.formy_a.get(noun)
+        return forma if forma is not None else p.a(noun)
+
+    def forma(self, verb: str, tag: str) -> str:
+        formy = self.czasowniki.get(verb)
+        if formy is None:
+            return getInflection(verb, tag=tag)[0]
+        return formy[FORMY_CZASOWNIKA.index(tag)]
+
+
+# Bez tablicy wszystkie odmiany liczone na bieżąco
+NA_BIEZACO = TablicaOdmian()
+
+
+def build_sentence(data, odmiany: Optional[TablicaOdmian] = None):
+    if odmiany is None:
+        odmiany = NA_BIEZACO
+    s = data['subject']
+    v = data['verb']
+    o = data['object']
+
+    if s['number'] == "pojedyncza":
+        subj_final = odmiany.z_przedimkiem(s['noun'], s['adj'])
+    else:
+        subj_noun = odmiany.liczba_mnoga(s['noun']) if s['number'] == "mnoga" else s['noun']
+        subj_final = f"{s['adj']} {subj_noun}" if s['adj'] else subj_noun
+
+    v_base = v['base']
+    tense = v['tense']
+    mode = v['type']
+
+    is_3rd_singular = (s['person'] == 3 and s['number'] == "pojedyncza")
+
+    result = ""
+
+    if mode == "rozkazujące":
+        return f"{v_base} {o['noun']}!".capitalize()
+
+    if tense == "Present Simple":
+        if mode == "twierdzące":
+            v_form = odmiany.forma(v_base, 'VBZ' if is_3rd_singular else 'VBP')
+            result = f"{subj_final} {v_form}"
+        elif mode == "przeczące":
+            aux = "doesn't" if is_3rd_singular else "don't"
+            result = f"{subj_final} {aux} {v_base}"
+        elif mode == "pytające":
+            aux = "Does" if is_3rd_singular else "Do"
+            result = f"{aux} {subj_final} {v_base}"
+
+    elif tense == "Past Simple":
+        v_past = odmiany.forma(v_base, 'VBD')
+        if mode == "twierdzące":
+            result = f"{subj_final} {v_past}"
+        elif mode == "przeczące":
+            result = f"{subj_final} didn't {v_base}"
+        elif mode == "pytające":
+            result = f"Did {subj_final} {v_base}"
+
+    elif tense == "Future Simple":
+        if mode == "twierdzące":
+            result = f"{subj_final} will {v_base}"
+        elif mode == "przeczące":
+            result = f"{subj_final} won't {v_base}"
+        elif mode == "pytające":
+            result = f"Will {subj_final} {v_base}"
+
+    obj_noun = o['noun']
+    if o['article'] == "a/an":
+        obj_final = odmiany.z_przedimkiem(obj_noun)
+    elif o['article'] == "the":
+        obj_final = f"the {obj_noun}"
+    else:
+        obj_final = obj_noun
+
+    punctuation = "?" if mode == "pytające" else "."
+    final_sentence = f"{result} {obj_final}{punctuation}"
+    return final_sentence.capitalize()
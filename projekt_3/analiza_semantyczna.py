@@ -1,298 +1,329 @@
 import os
 import re
-from collections import defaultdict, Counter
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
+import sys
+import argparse
+import hashlib
+import contextlib
 import numpy as np
-import networkx as nx
-from networkx.algorithms import bipartite
-import spacy
-from typing import Dict, List, Tuple, Set
+from typing import Dict, List, Optional, Tuple, Set
 
-plt.rcParams['figure.facecolor'] = 'white'
-plt.rcParams['axes.facecolor'] = '#f8f9fa'
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.magazyn_korpusu import MagazynKorpusu
+from wspolne.renderowanie import KolejkaRysunkow, ustaw_tryb_wsadowy
+from wspolne.metryki import Metryki, etap, parsuj_profilowanie
+from wykresy_semantyczne import kolor_liczby, rysuj_graf_dwudzielny, rysuj_macierz_polaczen
+from potok_spacy import (dokumenty, kolumny_z_dokumentow, zaladuj_model, KolumnyParsowania,
+                         ROZMIAR_FRAGMENTU, ROZMIAR_PACZKI, PROFILE_POTOKU, PROFIL)
+from pamiec_parsowania import PamiecParsowania, wersja_pakietu
+from macierz_polaczen import MacierzPolaczen
+from indeks_kolokacji import zapisz_indeks as zapisz_indeks_kolokacji
+from miary_kolokacji import MIARY, OPISY_MIAR, ranking
+
+MODEL_SPACY = "en_core_web_sm"
+# Relacje składniowe połączeń w profilu 'zaleznosci': przymiotnik określający rzeczownik
+# oraz rzeczownik jako dopełnienie lub podmiot czasownika
+ZALEZNOSCI_PRZYMIOTNIKA = ('amod',)
+ZALEZNOSCI_CZASOWNIKA = ('dobj', 'nsubj', 'nsubjpass')
+
+
+def najczestsze(ids: np.ndarray, n: int) -> np.ndarray:
+    # n najczęstszych identyfikatorów; remisy w kolejności pierwszego wystąpienia (jak Counter.most_common)
+    unikalne, pierwsze, liczby = np.unique(ids, return_index=True, return_counts=True)
+    return unikalne[np.lexsort((pierwsze, -liczby))[:n]]
 
 
 class AnalizaSemanyczna:
     
-    def __init__(self, sciezka_korpusu: str):
+    def __init__(self, sciezka_korpusu: str, liczba_procesow: int = 1,
+                 rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU, rozmiar_paczki: int = ROZMIAR_PACZKI,
+                 uzyj_pamieci: bool = True, profil: str = PROFIL):
         self.sciezka_korpusu = sciezka_korpusu
+        self.model = MODEL_SPACY
+        # Składniki potoku spaCy (potok_spacy.PROFILE_POTOKU); 'zaleznosci' - połączenia z parsera
+        self.profil = profil
+        # Tekst przetwarzany strumieniem fragmentów przez nlp.pipe (potok_spacy.py)
+        self.liczba_procesow = liczba_procesow
+        self.rozmiar_fragmentu = rozmiar_fragmentu
+        self.rozmiar_paczki = rozmiar_paczki
+        self.magazyn = None
         self.nlp = None
+        # Sparsowane korpusy na dysku (pamiec_parsowania.py); None - parsowanie zawsze od nowa
+        self.pamiec_parsowania = PamiecParsowania() if uzyj_pamieci else None
+        # Tekst z wczytaj_korpus i jego źródło (hash korpusu, limit słów) - do klucza pamięci
+        self.wczytany_tekst = None
+        self.zrodlo_tekstu = None
+        # Wynik jedynego parsowania tekstu (parsuj), wspólny dla analiza_pos i znajdz_polaczenia
+        self.kolumny: Optional[KolumnyParsowania] = None
         self.rzeczowniki = []
         self.przymiotniki = []
         self.czasowniki = []
-        self.polaczenia_adj_noun = defaultdict(lambda: defaultdict(int))
-        self.polaczenia_verb_noun = defaultdict(lambda: defaultdict(int))
+        # Macierze rzadkie połączeń: wiersze - top przymiotniki / czasowniki, kolumny - top rzeczowniki
+        self.polaczenia_adj_noun: Optional[MacierzPolaczen] = None
+        self.polaczenia_verb_noun: Optional[MacierzPolaczen] = None
+        # Pomiary etapów (wspolne.metryki); None - bez pomiarów
+        self.metryki: Optional[Metryki] = None
         
+    @etap()
     def zaladuj_spacy(self):
-        print("Ładowanie modelu spaCy...")
+        print(f"Ładowanie modelu spaCy (profil {self.profil})...")
+        # spaCy importowany dopiero w zaladuj_model - sam import modułu go nie wymaga
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = zaladuj_model(self.model, self.profil)
         except:
-            print("Model en_core_web_sm nie znaleziony.")
+            print(f"Model {self.model} nie znaleziony.")
             print("Instalacja modelu...")
-            os.system("python -m spacy download en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
-        print("Model załadowany.\n")
+            os.system(f"python -m spacy download {self.model}")
+            self.nlp = zaladuj_model(self.model, self.profil)
+        print(f"Model załadowany: {', '.join(self.nlp.pipe_names)}\n")
+    
+    def dokumenty(self, tekst: str):
+        return dokumenty(self.nlp, tekst, self.rozmiar_fragmentu, self.rozmiar_paczki, self.liczba_procesow)
         
+    @etap(lambda self, tekst: {'znaki': len(tekst)})
     def wczytaj_korpus(self, limit_slow=100000):
         print(f"Wczytywanie korpusu z: {self.sciezka_korpusu}")
         
-        with open(self.sciezka_korpusu, 'r', encoding='utf-8') as f:
-            tekst = f.read()
+        if self.magazyn is None:
+            self.magazyn = MagazynKorpusu.otworz(self.sciezka_korpusu)
         
-        slowa_raw = re.findall(r'\b[a-zA-Z]+\b', tekst.lower())
-        slowa = slowa_raw[:limit_slow]
+        # Słowa z samych liter a-z, jak dawne re.findall(r'\b[a-zA-Z]+\b', tekst.lower())
+        maska = self.magazyn.maska_slownika(re.compile(r'[a-z]+'))
+        slowa = self.magazyn.filtruj(maska, limit_slow)
         
         print(f"Wczytano {len(slowa):,} słów\n")
-        return ' '.join(slowa)
-        
-    def analiza_pos(self, tekst: str):
+        self.wczytany_tekst = self.magazyn.tekst(slowa)
+        self.zrodlo_tekstu = f"{self.magazyn.meta['hash']}:{limit_slow}"
+        return self.wczytany_tekst
+        
+    def opis_parsowania(self, tekst: str) -> Optional[dict]:
+        # Wszystko, od czego zależy wynik parsowania; None, gdy model nie jest zainstalowany
+        wersja_modelu = self.nlp.meta['version'] if self.nlp is not None else wersja_pakietu(self.model)
+        if wersja_modelu is None:
+            return None
+        if tekst is self.wczytany_tekst:
+            korpus = self.zrodlo_tekstu
+        else:
+            korpus = hashlib.blake2b(tekst.encode(), digest_size=16).hexdigest()
+        return {
+            'korpus': korpus,
+            'model': self.model,
+            'wersja_modelu': wersja_modelu,
+            'spacy': wersja_pakietu('spacy'),
+            'fragment': self.rozmiar_fragmentu,
+            'skladniki': PROFILE_POTOKU[self.profil],
+        }
+        
+    @etap(lambda self, k: {'tokeny': k.liczba_tokenow, 'typy': len(k.slownik)})
+    def parsuj(self, tekst: str) -> KolumnyParsowania:
+        print("Parsowanie tekstu (spaCy)...")
+        
+        # Trafienie w pamięci parsowania pomija ładowanie modelu i parsowanie
+        if self.pamiec_parsowania is not None:
+            opis = self.opis_parsowania(tekst)
+            kolumny = self.pamiec_parsowania.wczytaj(opis) if opis is not None else None
+            if kolumny is not None:
+                self.kolumny = kolumny
+                print(f"Parsowanie wczytane z pamięci: {kolumny.liczba_tokenow:,} tokenów\n")
+                return kolumny
+        
+        if self.nlp is None:
+            self.zaladuj_spacy()
+        
+        # Jedno przejście spaCy; dalej tylko tablice identyfikatorów tokenów i części mowy
+        self.kolumny = kolumny_z_dokumentow(self.dokumenty(tekst), zaleznosci=self.profil == 'zaleznosci')
+        if self.pamiec_parsowania is not None:
+            self.pamiec_parsowania.zapisz(self.opis_parsowania(tekst), self.kolumny)
+        
+        print(f"Sparsowano {self.kolumny.liczba_tokenow:,} tokenów ({len(self.kolumny.slownik):,} różnych)\n")
+        return self.kolumny
+        
+    @etap(lambda self, _: {'rzeczowniki': len(self.rzeczowniki), 'przymiotniki': len(self.przymiotniki), 'czasowniki': len(self.czasowniki)})
+    def analiza_pos(self, tekst: Optional[str] = None, top_n=100):
         print("Analiza części mowy (POS tagging)...")
         
-        doc = self.nlp(tekst)
+        if self.kolumny is None:
+            self.parsuj(tekst)
+        k = self.kolumny
         
-        rzeczowniki_counter = Counter()
-        przymiotniki_counter = Counter()
-        czasowniki_counter = Counter()
+        dlugie = np.fromiter((len(s) > 2 for s in k.slownik), dtype=bool, count=len(k.slownik))[k.ids]
+        top = {}
+        for tag in ("NOUN", "ADJ", "VERB"):
+            top[tag] = [k.slownik[i] for i in najczestsze(k.ids[(k.pos == k.id_pos(tag)) & dlugie], top_n).tolist()]
         
-        for token in doc:
-            if token.pos_ == "NOUN" and len(token.text) > 2:
-                rzeczowniki_counter[token.text] += 1
-            elif token.pos_ == "ADJ" and len(token.text) > 2:
-                przymiotniki_counter[token.text] += 1
-            elif token.pos_ == "VERB" and len(token.text) > 2:
-                czasowniki_counter[token.text] += 1
-        
-        self.rzeczowniki = [word for word, _ in rzeczowniki_counter.most_common(100)]
-        self.przymiotniki = [word for word, _ in przymiotniki_counter.most_common(100)]
-        self.czasowniki = [word for word, _ in czasowniki_counter.most_common(100)]
+        self.rzeczowniki = top["NOUN"]
+        self.przymiotniki = top["ADJ"]
+        self.czasowniki = top["VERB"]
         
         print(f"Znaleziono {len(self.rzeczowniki)} top rzeczowników")
         print(f"Znaleziono {len(self.przymiotniki)} top przymiotników")
         print(f"Znaleziono {len(self.czasowniki)} top czasowników\n")
         
-    def znajdz_polaczenia(self, tekst: str):
+    @etap(lambda self, _: {'pary_adj_noun': self.polaczenia_adj_noun.liczba_par, 'pary_verb_noun': self.polaczenia_verb_noun.liczba_par})
+    def znajdz_polaczenia(self, tekst: Optional[str] = None):
         print("Szukanie połączeń przymiotnik-rzeczownik i czasownik-rzeczownik...")
         
-        doc = self.nlp(tekst)
-        
-        rzeczowniki_set = set(self.rzeczowniki)
-        przymiotniki_set = set(self.przymiotniki)
-        czasowniki_set = set(self.czasowniki)
-        
-        for i, token in enumerate(doc):
-            if token.text in rzeczowniki_set:
-                if i > 0 and doc[i-1].text in przymiotniki_set:
-                    self.polaczenia_adj_noun[doc[i-1].text][token.text] += 1
-                
-                if i > 0 and doc[i-1].text in czasowniki_set:
-                    self.polaczenia_verb_noun[doc[i-1].text][token.text] += 1
-                    
-                if i < len(doc) - 1 and doc[i+1].text in czasowniki_set:
-                    self.polaczenia_verb_noun[doc[i+1].text][token.text] += 1
-        
-        print(f"Znaleziono {sum(len(v) for v in self.polaczenia_adj_noun.values())} połączeń przymiotnik-rzeczownik")
-        print(f"Znaleziono {sum(len(v) for v in self.polaczenia_verb_noun.values())} połączeń czasownik-rzeczownik\n")
+        if self.kolumny is None:
+            self.parsuj(tekst)
+        k = self.kolumny
+        
+        # Numer słowa tokenu na liście top (indeks wiersza / kolumny macierzy) lub -1
+        ids = k.ids
+        nr_rzeczownika = k.numery(self.rzeczowniki)[ids]
+        nr_przymiotnika = k.numery(self.przymiotniki)[ids]
+        nr_czasownika = k.numery(self.czasowniki)[ids]
+        rzeczownik, przymiotnik, czasownik = nr_rzeczownika >= 0, nr_przymiotnika >= 0, nr_czasownika >= 0
+        
+        if k.glowy is not None:
+            # Połączenia składniowe: zależny przymiotnik -> rzeczownik nadrzędny (amod) i rzeczownik
+            # zależny od czasownika (dopełnienie, podmiot), w kolejności pozycji tokenu zależnego
+            glowy = k.glowy
+            adj = np.flatnonzero(k.maska_zaleznosci(ZALEZNOSCI_PRZYMIOTNIKA) & przymiotnik & rzeczownik[glowy])
+            verb = np.flatnonzero(k.maska_zaleznosci(ZALEZNOSCI_CZASOWNIKA) & rzeczownik & czasownik[glowy])
+            pary_adj = (nr_przymiotnika[adj], nr_rzeczownika[glowy[adj]], adj)
+            pary_verb = (nr_czasownika[glowy[verb]], nr_rzeczownika[verb], verb)
+        else:
+            # Zdarzenia (pozycja, lewe/prawe): rzeczownik na pozycji i z przymiotnikiem
+            # lub czasownikiem na i-1 oraz z czasownikiem na i+1
+            adj = np.flatnonzero(rzeczownik[1:] & przymiotnik[:-1]) + 1
+            verb_lewe = np.flatnonzero(rzeczownik[1:] & czasownik[:-1]) + 1
+            verb_prawe = np.flatnonzero(rzeczownik[:-1] & czasownik[1:])
+            pary_adj = (nr_przymiotnika[adj - 1], nr_rzeczownika[adj], 2 * adj)
+            pary_verb = (np.concatenate([nr_czasownika[verb_lewe - 1], nr_czasownika[verb_prawe + 1]]),
+                         np.concatenate([nr_rzeczownika[verb_lewe], nr_rzeczownika[verb_prawe]]),
+                         np.concatenate([2 * verb_lewe, 2 * verb_prawe + 1]))
+        
+        self.polaczenia_adj_noun = MacierzPolaczen.z_par(self.przymiotniki, self.rzeczowniki, *pary_adj)
+        self.polaczenia_verb_noun = MacierzPolaczen.z_par(self.czasowniki, self.rzeczowniki, *pary_verb)
+        
+        print(f"Znaleziono {self.polaczenia_adj_noun.liczba_par} połączeń przymiotnik-rzeczownik")
+        print(f"Znaleziono {self.polaczenia_verb_noun.liczba_par} połączeń czasownik-rzeczownik\n")
         
     def get_color(self, count: int) -> str:
-        if count == 0:
-            return '#e74c3c'
-        elif count == 1:
-            return '#f39c12'
-        elif count <= 10:
-            return '#27ae60'
-        else:
-            return '#3498db'
+        return kolor_liczby(count)
             
-    def wizualizuj_graf_dwudzielny(self, typ='adj-noun', top_n=30, zapisz=True):
+    @etap(lambda self, krawedzie: {'krawedzie': len(krawedzie[2])})
+    def wizualizuj_graf_dwudzielny(self, typ='adj-noun', top_n=30, zapisz=True,
+                                   kolejka: Optional[KolejkaRysunkow] = None, dpi=300,
+                                   miara='liczba', top_k: Optional[int] = None):
         if typ == 'adj-noun':
             polaczenia = self.polaczenia_adj_noun
-            set_a = self.przymiotniki[:top_n]
-            set_b = self.rzeczowniki[:top_n]
             tytul = f'Graf Dwudzielny: Przymiotnik-Rzeczownik (Top {top_n})'
             nazwa_pliku = 'graf_przymiotnik_rzeczownik.png'
             label_a = 'Przymiotniki'
             label_b = 'Rzeczowniki'
         else:
             polaczenia = self.polaczenia_verb_noun
-            set_a = self.czasowniki[:top_n]
-            set_b = self.rzeczowniki[:top_n]
             tytul = f'Graf Dwudzielny: Czasownik-Rzeczownik (Top {top_n})'
             nazwa_pliku = 'graf_czasownik_rzeczownik.png'
             label_a = 'Czasowniki'
             label_b = 'Rzeczowniki'
+        if top_k is not None:
+            tytul += f' - {top_k} najsilniejszych wg {OPISY_MIAR[miara]}'
             
         print(f"Wizualizacja: {tytul}")
         
-        G = nx.Graph()
-        
-        for node in set_a:
-            G.add_node(node, bipartite=0)
-        for node in set_b:
-            G.add_node(node, bipartite=1)
-        
-        edge_colors = []
-        edge_widths = []
-        
-        for word_a in set_a:
-            if word_a in polaczenia:
-                for word_b in set_b:
-                    count = polaczenia[word_a].get(word_b, 0)
-                    if count > 0:
-                        G.add_edge(word_a, word_b, weight=count)
-                        edge_colors.append(self.get_color(count))
-                        edge_widths.append(min(count * 0.5, 5))
-        
-        fig, ax = plt.subplots(figsize=(18, 12))
-        
-        pos = {}
-        y_spacing_a = 1.0 / (len(set_a) + 1)
-        y_spacing_b = 1.0 / (len(set_b) + 1)
-        
-        for i, node in enumerate(set_a):
-            pos[node] = (0, 1 - (i + 1) * y_spacing_a)
-        for i, node in enumerate(set_b):
-            pos[node] = (1, 1 - (i + 1) * y_spacing_b)
-        
-        nx.draw_networkx_edges(G, pos, edge_color=edge_colors, width=edge_widths, alpha=0.6, ax=ax)
-        
-        nx.draw_networkx_nodes(G, pos, nodelist=set_a, node_color='#ecf0f1', 
-                               node_size=800, node_shape='s', edgecolors='#34495e', 
-                               linewidths=2, ax=ax)
-        nx.draw_networkx_nodes(G, pos, nodelist=set_b, node_color='#ecf0f1', 
-                               node_size=800, node_shape='o', edgecolors='#34495e', 
-                               linewidths=2, ax=ax)
-        
-        labels_a = {node: node for node in set_a}
-        labels_b = {node: node for node in set_b}
-        
-        nx.draw_networkx_labels(G, pos, labels_a, font_size=8, font_weight='bold', ax=ax)
-        nx.draw_networkx_labels(G, pos, labels_b, font_size=8, font_weight='bold', ax=ax)
-        
-        ax.text(0, 1.05, label_a, ha='center', fontsize=14, fontweight='bold')
-        ax.text(1, 1.05, label_b, ha='center', fontsize=14, fontweight='bold')
-        
-        legend_elements = [
-            mpatches.Patch(facecolor='#e74c3c', label='0 wystąpień'),
-            mpatches.Patch(facecolor='#f39c12', label='1 wystąpienie'),
-            mpatches.Patch(facecolor='#27ae60', label='2-10 wystąpień'),
-            mpatches.Patch(facecolor='#3498db', label='>10 wystąpień')
-        ]
-        ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
-                  ncol=4, frameon=True, fontsize=10)
-        
-        ax.set_title(tytul, fontsize=16, fontweight='bold', pad=20)
-        ax.axis('off')
-        plt.tight_layout()
-        
-        if zapisz:
-            sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', nazwa_pliku)
-            plt.savefig(sciezka, dpi=300, bbox_inches='tight')
-            print(f"Graf zapisany: {sciezka}")
+        # Wycinek top_n x top_n macierzy - wiersze i kolumny są w kolejności rang; z top_k tylko
+        # najwyżej ocenione pary każdego słowa, rysowane w kolejności wierszy i kolumn
+        set_a = polaczenia.wiersze[:top_n]
+        set_b = polaczenia.kolumny[:top_n]
+        if top_k is None:
+            krawedzie = polaczenia.tablice_krawedzi(top_n, top_n)
+        else:
+            wybrane = ranking(polaczenia, miara, top_k, top_n, top_n)
+            kolejnosc = np.lexsort((wybrane.kolumny, wybrane.wiersze))
+            krawedzie = (wybrane.wiersze[kolejnosc], wybrane.kolumny[kolejnosc], wybrane.liczby[kolejnosc])
+        
+        sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', nazwa_pliku) if zapisz else None
+        # Przy kolejce rysunek renderowany jest później, razem z pozostałymi
+        if kolejka is not None:
+            kolejka.dodaj(rysuj_graf_dwudzielny, set_a, set_b, *krawedzie, tytul, label_a, label_b, sciezka, dpi)
+        else:
+            rysuj_graf_dwudzielny(set_a, set_b, *krawedzie, tytul, label_a, label_b, sciezka, dpi)
         
-        plt.show()
+        return krawedzie
         
-    def generuj_listy_polaczen(self):
+    @etap()
+    def generuj_listy_polaczen(self, miara='liczba', top_k: Optional[int] = None):
         print("\nGenerowanie list połączeń...")
         
         katalog = os.path.dirname(self.sciezka_korpusu)
         katalog_projekt = os.path.join(katalog, '..')
         
-        with open(os.path.join(katalog_projekt, 'lista_przymiotnik_rzeczownik.txt'), 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("LISTA POŁĄCZEŃ: PRZYMIOTNIK -> RZECZOWNIKI\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for adj in self.przymiotniki:
-                if adj in self.polaczenia_adj_noun:
-                    rzeczowniki_sorted = sorted(
-                        self.polaczenia_adj_noun[adj].items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )
-                    
-                    f.write(f"\n{adj.upper()}:\n")
-                    f.write("-" * 60 + "\n")
-                    
-                    for noun, count in rzeczowniki_sorted:
-                        f.write(f"  {noun:<20} [{count:>3} wystąpień]\n")
-        
-        with open(os.path.join(katalog_projekt, 'lista_czasownik_rzeczownik.txt'), 'w', encoding='utf-8') as f:
-            f.write("=" * 80 + "\n")
-            f.write("LISTA POŁĄCZEŃ: CZASOWNIK -> RZECZOWNIKI\n")
-            f.write("=" * 80 + "\n\n")
-            
-            for verb in self.czasowniki:
-                if verb in self.polaczenia_verb_noun:
-                    rzeczowniki_sorted = sorted(
-                        self.polaczenia_verb_noun[verb].items(),
-                        key=lambda x: x[1],
-                        reverse=True
-                    )
-                    
-                    f.write(f"\n{verb.upper()}:\n")
-                    f.write("-" * 60 + "\n")
-                    
-                    for noun, count in rzeczowniki_sorted:
-                        f.write(f"  {noun:<20} [{count:>3} wystąpień]\n")
+        self._zapisz_liste(os.path.join(katalog_projekt, 'lista_przymiotnik_rzeczownik.txt'),
+                           "LISTA POŁĄCZEŃ: PRZYMIOTNIK -> RZECZOWNIKI", self.polaczenia_adj_noun, miara, top_k)
+        self._zapisz_liste(os.path.join(katalog_projekt, 'lista_czasownik_rzeczownik.txt'),
+                           "LISTA POŁĄCZEŃ: CZASOWNIK -> RZECZOWNIKI", self.polaczenia_verb_noun, miara, top_k)
         
         print("Listy zapisane:")
         print(f"  - lista_przymiotnik_rzeczownik.txt")
         print(f"  - lista_czasownik_rzeczownik.txt")
-        
-    def generuj_macierz_polaczen(self, typ='adj-noun'):
+    
+    def _zapisz_liste(self, sciezka: str, naglowek: str, polaczenia: MacierzPolaczen, miara: str,
+                      top_k: Optional[int]):
+        # Rzeczowniki każdego słowa malejąco po wyniku miary (miary_kolokacji.ranking);
+        # dla 'liczba' bez top_k - pełne listy jak dotąd, bez kolumny wyniku
+        wybrane = ranking(polaczenia, miara, top_k)
+        granice = np.flatnonzero(np.diff(wybrane.wiersze)) + 1
+        with open(sciezka, 'w', encoding='utf-8') as f:
+            f.write("=" * 80 + "\n")
+            f.write(naglowek + (f" (miara: {OPISY_MIAR[miara]})" if miara != 'liczba' else "") + "\n")
+            f.write("=" * 80 + "\n\n")
+            
+            for start, koniec in zip([0] + granice.tolist(), granice.tolist() + [len(wybrane.wiersze)]):
+                if start == koniec:
+                    continue
+                f.write(f"\n{polaczenia.wiersze[int(wybrane.wiersze[start])].upper()}:\n")
+                f.write("-" * 60 + "\n")
+                
+                for j, count, wynik in zip(wybrane.kolumny[start:koniec].tolist(), wybrane.liczby[start:koniec].tolist(),
+                                           wybrane.wyniki[start:koniec].tolist()):
+                    if miara == 'liczba':
+                        f.write(f"  {polaczenia.kolumny[j]:<20} [{count:>3} wystąpień]\n")
+                    else:
+                        f.write(f"  {polaczenia.kolumny[j]:<20} [{count:>3} wystąpień, {miara}: {wynik:>8.3f}]\n")
+        
+    @etap()
+    def generuj_macierz_polaczen(self, typ='adj-noun', kolejka: Optional[KolejkaRysunkow] = None, dpi=300,
+                                 miara='liczba'):
         if typ == 'adj-noun':
             polaczenia = self.polaczenia_adj_noun
-            set_a = self.przymiotniki[:50]
-            set_b = self.rzeczowniki[:50]
             tytul = 'Macierz Połączeń: Przymiotnik-Rzeczownik'
             nazwa_pliku = 'macierz_przymiotnik_rzeczownik.png'
         else:
             polaczenia = self.polaczenia_verb_noun
-            set_a = self.czasowniki[:50]
-            set_b = self.rzeczowniki[:50]
             tytul = 'Macierz Połączeń: Czasownik-Rzeczownik'
             nazwa_pliku = 'macierz_czasownik_rzeczownik.png'
         
         print(f"\nGenerowanie macierzy: {tytul}")
         
-        matrix = np.zeros((len(set_a), len(set_b)))
-        
-        for i, word_a in enumerate(set_a):
-            if word_a in polaczenia:
-                for j, word_b in enumerate(set_b):
-                    matrix[i, j] = polaczenia[word_a].get(word_b, 0)
-        
-        fig, ax = plt.subplots(figsize=(16, 14))
-        
-        colors_map = []
-        for val in matrix.flatten():
-            colors_map.append(self.get_color(val))
-        
-        im = ax.imshow(matrix, cmap='YlOrRd', aspect='auto', interpolation='nearest')
-        
-        ax.set_xticks(np.arange(len(set_b)))
-        ax.set_yticks(np.arange(len(set_a)))
-        ax.set_xticklabels(set_b, rotation=90, ha='right', fontsize=7)
-        ax.set_yticklabels(set_a, fontsize=7)
-        
-        ax.set_title(tytul, fontsize=16, fontweight='bold', pad=20)
-        
-        cbar = plt.colorbar(im, ax=ax)
-        cbar.set_label('Liczba wystąpień', rotation=270, labelpad=20, fontsize=12)
-        
-        plt.tight_layout()
+        set_a = polaczenia.wiersze[:50]
+        set_b = polaczenia.kolumny[:50]
+        if miara == 'liczba':
+            matrix = polaczenia.gesta(50, 50).astype(np.float64)
+        else:
+            # Wyniki miary (z marginesów całej macierzy); pary bez wystąpień puste (NaN), nie 0
+            wybrane = ranking(polaczenia, miara, None, 50, 50)
+            matrix = np.full((len(set_a), len(set_b)), np.nan)
+            matrix[wybrane.wiersze, wybrane.kolumny] = wybrane.wyniki
+            tytul += f' ({OPISY_MIAR[miara]})'
         
         sciezka = os.path.join(os.path.dirname(self.sciezka_korpusu), '..', nazwa_pliku)
-        plt.savefig(sciezka, dpi=300, bbox_inches='tight')
-        print(f"Macierz zapisana: {sciezka}")
-        
-        plt.show()
+        if kolejka is not None:
+            kolejka.dodaj(rysuj_macierz_polaczen, matrix, set_a, set_b, tytul, sciezka, dpi, OPISY_MIAR[miara])
+        else:
+            rysuj_macierz_polaczen(matrix, set_a, set_b, tytul, sciezka, dpi, OPISY_MIAR[miara])
+    
+    @etap(lambda self, _: {'pary': self.polaczenia_adj_noun.liczba_par + self.polaczenia_verb_noun.liczba_par})
+    def zapisz_indeks(self, katalog: Optional[str] = None) -> str:
+        # Indeks kolokacji do zapytań bez ponownej analizy (indeks_kolokacji.py, serwer_kolokacji.py)
+        katalog = katalog or os.path.join(os.path.dirname(self.sciezka_korpusu), '..', 'kolokacje')
+        polaczenia = {'adj-noun': self.polaczenia_adj_noun, 'verb-noun': self.polaczenia_verb_noun}
+        zapisz_indeks_kolokacji(katalog, polaczenia, self.sciezka_korpusu)
+        print(f"Indeks kolokacji zapisany: {katalog}")
+        return katalog
 
 
-def main():
+def uruchom_analize(args, metryki: Optional[Metryki]) -> None:
     print("=" * 80)
     print("  PROJEKT 3: ANALIZA SEMANTYCZNA")
     print("  Grafy dwudzielne: Przymiotnik-Rzeczownik i Czasownik-Rzeczownik")
@@ -304,30 +335,82 @@ def main():
         'corpus.txt'
     )
     
-    analiza = AnalizaSemanyczna(sciezka_korpusu)
+    analiza = AnalizaSemanyczna(sciezka_korpusu, liczba_procesow=args.procesy, uzyj_pamieci=not args.bez_pamieci,
+                                profil=args.profil)
+    analiza.metryki = metryki
     
-    analiza.zaladuj_spacy()
+    kolejka = None
+    if args.wsadowo:
+        ustaw_tryb_wsadowy()
+        kolejka = KolejkaRysunkow()
     
+    # Model ładowany przez parsuj, tylko gdy parsowania nie ma w pamięci
     tekst = analiza.wczytaj_korpus(limit_slow=100000)
     
-    analiza.analiza_pos(tekst)
+    analiza.parsuj(tekst)
+    
+    analiza.analiza_pos()
     
-    analiza.znajdz_polaczenia(tekst)
+    analiza.znajdz_polaczenia()
     
-    analiza.wizualizuj_graf_dwudzielny(typ='adj-noun', top_n=30)
+    analiza.wizualizuj_graf_dwudzielny(typ='adj-noun', top_n=30, kolejka=kolejka, miara=args.miara, top_k=args.top_k)
     
-    analiza.wizualizuj_graf_dwudzielny(typ='verb-noun', top_n=30)
+    analiza.wizualizuj_graf_dwudzielny(typ='verb-noun', top_n=30, kolejka=kolejka, miara=args.miara, top_k=args.top_k)
     
-    analiza.generuj_macierz_polaczen(typ='adj-noun')
+    analiza.generuj_macierz_polaczen(typ='adj-noun', kolejka=kolejka, miara=args.miara)
     
-    analiza.generuj_macierz_polaczen(typ='verb-noun')
+    analiza.generuj_macierz_polaczen(typ='verb-noun', kolejka=kolejka, miara=args.miara)
     
-    analiza.generuj_listy_polaczen()
+    analiza.generuj_listy_polaczen(miara=args.miara, top_k=args.top_k)
+    
+    analiza.zapisz_indeks()
+    
+    if kolejka is not None:
+        kolejka.renderuj(args.procesy_rysowania)
     
     print("\n" + "=" * 80)
     print("  ANALIZA ZAKOŃCZONA POMYŚLNIE!")
     print("=" * 80)
 
 
+def main():
+    parser = argparse.ArgumentParser(description='Analiza semantyczna - grafy dwudzielne')
+    parser.add_argument('--procesy', type=int, default=1,
+                        help='liczba procesów spaCy (nlp.pipe n_process) przetwarzających fragmenty tekstu')
+    parser.add_argument('--profil', choices=list(PROFILE_POTOKU), default=PROFIL,
+                        help='składniki spaCy: pos (tagger), zaleznosci (+ parser, połączenia składniowe), pelny')
+    parser.add_argument('--miara', choices=MIARY, default='liczba',
+                        help='siła połączenia w listach, macierzach i grafach: liczba, pmi, llr (log-likelihood), t, dice')
+    parser.add_argument('--top-k', type=int, default=None,
+                        help='tylko K najwyżej ocenionych rzeczowników każdego przymiotnika / czasownika')
+    parser.add_argument('--bez-pamieci', action='store_true',
+                        help='parsowanie od nowa, bez odczytu i zapisu .pjn_cache/parsowania')
+    parser.add_argument('--wsadowo', action='store_true',
+                        help='rysunki tylko zapisywane (backend Agg), renderowane razem w puli procesów')
+    parser.add_argument('--procesy-rysowania', type=int, default=None,
+                        help='liczba procesów renderowania w trybie wsadowym (domyślnie liczba rdzeni)')
+    parser.add_argument('--metryki', default=None,
+                        help='plik JSON-lines z pomiarami etapów (czas, CPU, szczyt RSS, liczniki)')
+    parser.add_argument('--profiluj', default=None,
+                        help='etapy profilowane cProfile, np. analiza_pos,znajdz_polaczenia, lub "wszystkie"')
+    parser.add_argument('--cicho', action='store_true', help='bez wydruków na standardowe wyjście')
+    args = parser.parse_args()
+    if args.top_k is not None and args.top_k < 1:
+        parser.error(f"--top-k musi być dodatnie (podano {args.top_k})")
+    
+    metryki = None
+    if args.metryki or args.profiluj:
+        metryki = Metryki(args.metryki, profiluj=parsuj_profilowanie(args.profiluj))
+    
+    if args.cicho:
+        with open(os.devnull, 'w') as nic, contextlib.redirect_stdout(nic):
+            uruchom_analize(args, metryki)
+    else:
+        uruchom_analize(args, metryki)
+        if metryki is not None:
+            print("\nPomiary etapów:")
+            print(metryki.podsumowanie())
+
+
 if __name__ == "__main__":
     main()
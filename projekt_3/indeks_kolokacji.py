@@ -0,0 +1,162 @@
+import os
+import json
+import shutil
+import numpy as np
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from macierz_polaczen import MacierzPolaczen
+
+WERSJA_FORMATU = 1
+# Relacje indeksu - jak parametr typ w AnalizaSemanyczna
+RELACJE = ('adj-noun', 'verb-noun')
+# Liczba zapytań (relacja, kierunek, słowo, k) trzymanych w pamięci LRU
+POJEMNOSC_PAMIECI = 4096
+
+
+def _zapisz_slowa(sciezka: str, slowa: List[str]) -> None:
+    with open(sciezka, 'w', encoding='utf-8') as f:
+        for slowo in slowa:
+            f.write(slowo + '\n')
+
+
+def _wczytaj_slowa(sciezka: str) -> List[str]:
+    with open(sciezka, 'r', encoding='utf-8') as f:
+        return f.read().split('\n')[:-1]
+
+
+def _uporzadkuj(zrodlo: np.ndarray, cel: np.ndarray, liczby: np.ndarray, pierwsze: np.ndarray,
+                n_zrodel: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Układ CSR (indptr, cel, liczby) z wierszami posortowanymi malejąco po liczności,
+    # remisy w kolejności pierwszego wystąpienia - jak w listach połączeń;
+    # "top k" dla słowa to pierwsze k pozycji jego wiersza
+    kolejnosc = np.lexsort((pierwsze, -liczby, zrodlo))
+    indptr = np.searchsorted(zrodlo[kolejnosc], np.arange(n_zrodel + 1)).astype(np.int64)
+    return indptr, cel[kolejnosc].astype(np.int32), liczby[kolejnosc].astype(np.int64)
+
+
+def zapisz_indeks(katalog: str, polaczenia: Dict[str, MacierzPolaczen], zrodlo: Optional[str] = None) -> None:
+    # Dla każdej relacji podkatalog z listami słów (wiersze.txt - przymiotniki / czasowniki,
+    # kolumny.txt - rzeczowniki) i dwoma układami CSR w plikach .npy: wiersz -> rzeczowniki
+    # (indptr, indices, liczby) i rzeczownik -> określenia (t_indptr, t_indices, t_liczby).
+    # meta.json zapisywany na końcu, więc niepełny zapis nie jest wczytywany
+    os.makedirs(katalog, exist_ok=True)
+    sciezka_meta = os.path.join(katalog, 'meta.json')
+    if os.path.exists(sciezka_meta):
+        os.remove(sciezka_meta)
+
+    opis = {}
+    for relacja, macierz in polaczenia.items():
+        podkatalog = os.path.join(katalog, relacja)
+        if os.path.exists(podkatalog):
+            shutil.rmtree(podkatalog)
+        os.makedirs(podkatalog)
+        _zapisz_slowa(os.path.join(podkatalog, 'wiersze.txt'), macierz.wiersze)
+        _zapisz_slowa(os.path.join(podkatalog, 'kolumny.txt'), macierz.kolumny)
+
+        csr = macierz.macierz
+        wiersze = np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr))
+        for przedrostek, zrodlo_par, cel, n in (('', wiersze, csr.indices, csr.shape[0]),
+                                               ('t_', csr.indices, wiersze, csr.shape[1])):
+            for nazwa, tablica in zip(('indptr', 'indices', 'liczby'),
+                                      _uporzadkuj(zrodlo_par, cel, csr.data, macierz.pierwsze, n)):
+                np.save(os.path.join(podkatalog, f'{przedrostek}{nazwa}.npy'), tablica)
+        opis[relacja] = {'wiersze': len(macierz.wiersze), 'kolumny': len(macierz.kolumny),
+                         'pary': macierz.liczba_par}
+
+    meta = {
+        'wersja': WERSJA_FORMATU,
+        'zrodlo': os.path.abspath(zrodlo) if zrodlo else None,
+        'relacje': opis,
+    }
+    with open(sciezka_meta + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(meta, f, ensure_ascii=False, indent=2)
+    os.replace(sciezka_meta + '.tmp', sciezka_meta)
+
+
+# Jeden kierunek relacji: słowo -> numer wiersza, układ CSR (memmapy) i słowa docelowe
+class KierunekIndeksu(NamedTuple):
+    indeks: Dict[str, int]
+    indptr: np.ndarray
+    indices: np.ndarray
+    liczby: np.ndarray
+    slowa: List[str]
+
+
+# Indeks kolokacji wczytany z katalogu zapisz_indeks; tablice jako memmapy (tylko do odczytu).
+# Odpowiedzi to krotki (słowo, liczba) - wycinki posortowanych wierszy, bez sortowania
+# w zapytaniu; ostatnie odpowiedzi trzymane w pamięci LRU (functools.lru_cache)
+class IndeksKolokacji:
+    def __init__(self, kierunki: Dict[Tuple[str, str], KierunekIndeksu], meta: dict,
+                 pojemnosc_pamieci: int = POJEMNOSC_PAMIECI):
+        self.kierunki = kierunki
+        self.meta = meta
+        self._zapytanie = lru_cache(maxsize=pojemnosc_pamieci)(self._zapytaj)
+
+    @classmethod
+    def otworz(cls, katalog: str, mmap: bool = True,
+               pojemnosc_pamieci: int = POJEMNOSC_PAMIECI) -> 'IndeksKolokacji':
+        sciezka_meta = os.path.join(katalog, 'meta.json')
+        if not os.path.exists(sciezka_meta):
+            raise FileNotFoundError(f"Brak indeksu kolokacji: {katalog} (najpierw zapisz_indeks())")
+        with open(sciezka_meta, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta['wersja'] != WERSJA_FORMATU:
+            raise ValueError(f"Nieobsługiwana wersja indeksu kolokacji: {meta['wersja']}")
+
+        tryb = 'r' if mmap else None
+        kierunki = {}
+        for relacja in meta['relacje']:
+            podkatalog = os.path.join(katalog, relacja)
+            wiersze = _wczytaj_slowa(os.path.join(podkatalog, 'wiersze.txt'))
+            kolumny = _wczytaj_slowa(os.path.join(podkatalog, 'kolumny.txt'))
+            for kierunek, przedrostek, zrodla, cele in (('rzeczowniki', '', wiersze, kolumny),
+                                                        ('okreslenia', 't_', kolumny, wiersze)):
+                tablice = [np.load(os.path.join(podkatalog, f'{przedrostek}{nazwa}.npy'), mmap_mode=tryb)
+                           for nazwa in ('indptr', 'indices', 'liczby')]
+                kierunki[(relacja, kierunek)] = KierunekIndeksu({s: i for i, s in enumerate(zrodla)},
+                                                                *tablice, cele)
+        return cls(kierunki, meta, pojemnosc_pamieci)
+
+    def _zapytaj(self, relacja: str, kierunek: str, slowo: str, k: Optional[int]) -> Tuple[Tuple[str, int], ...]:
+        if (relacja, kierunek) not in self.kierunki:
+            raise ValueError(f"Nieznana relacja: {relacja} (dostępne: {', '.join(self.meta['relacje'])})")
+        if k is not None and k < 0:
+            raise ValueError(f"k musi być nieujemne (podano {k})")
+        czesc = self.kierunki[(relacja, kierunek)]
+        i = czesc.indeks.get(slowo)
+        if i is None:
+            return ()
+        start, koniec = int(czesc.indptr[i]), int(czesc.indptr[i + 1])
+        if k is not None:
+            koniec = min(koniec, start + k)
+        slowa = czesc.slowa
+        return tuple((slowa[j], c) for j, c in zip(czesc.indices[start:koniec].tolist(),
+                                                   czesc.liczby[start:koniec].tolist()))
+
+    def rzeczowniki(self, slowo: str, relacja: str = 'adj-noun', k: Optional[int] = 10) -> Tuple[Tuple[str, int], ...]:
+        # Najczęstsze rzeczowniki określane przez przymiotnik (adj-noun) lub czasownik (verb-noun)
+        return self._zapytanie(relacja, 'rzeczowniki', slowo, k)
+
+    def okreslenia(self, rzeczownik: str, relacja: str = 'adj-noun',
+                   k: Optional[int] = 10) -> Tuple[Tuple[str, int], ...]:
+        # Najczęstsze przymiotniki (adj-noun) lub czasowniki (verb-noun) przy rzeczowniku
+        return self._zapytanie(relacja, 'okreslenia', rzeczownik, k)
+
+    def wiele(self, zapytania: Iterable[dict]) -> List[Tuple[Tuple[str, int], ...]]:
+        # Zapytania {'typ': 'rzeczowniki' | 'okreslenia', 'slowo': ..., 'relacja': ..., 'k': ...}
+        wyniki = []
+        for z in zapytania:
+            if z.get('typ', 'rzeczowniki') not in ('rzeczowniki', 'okreslenia'):
+                raise ValueError(f"Nieznany typ zapytania: {z['typ']}")
+            wyniki.append(self._zapytanie(z.get('relacja', 'adj-noun'), z.get('typ', 'rzeczowniki'),
+                                          z['slowo'], z.get('k', 10)))
+        return wyniki
+
+    def stan_pamieci(self) -> dict:
+        info = self._zapytanie.cache_info()
+        return {'trafienia': info.hits, 'chybienia': info.misses, 'rozmiar': info.currsize,
+                'pojemnosc': info.maxsize}
+
+    def wyczysc_pamiec(self) -> None:
+        self._zapytanie.cache_clear()
@@ -0,0 +1,67 @@
+import numpy as np
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+# scipy.sparse importowany przy budowie macierzy - sam import modułu go nie wymaga
+if TYPE_CHECKING:
+    import scipy.sparse as sp
+
+
+# Liczności połączeń słowo A -> słowo B jako macierz CSR: wiersze - słowa A (np. top
+# przymiotniki w kolejności rang), kolumny - słowa B (top rzeczowniki). Zdarzenia zbierane
+# jako trójki COO (wiersz, kolumna, pozycja w tekście) i sumowane raz; pierwsze - pozycja
+# pierwszego zdarzenia każdej pary (w kolejności danych CSR), rozstrzyga remisy w listach
+class MacierzPolaczen:
+    def __init__(self, wiersze: List[str], kolumny: List[str], macierz: 'sp.csr_matrix', pierwsze: np.ndarray):
+        self.wiersze = wiersze
+        self.kolumny = kolumny
+        self.macierz = macierz
+        self.pierwsze = pierwsze
+        self.indeks_wierszy: Dict[str, int] = {s: i for i, s in enumerate(wiersze)}
+        self.indeks_kolumn: Dict[str, int] = {s: i for i, s in enumerate(kolumny)}
+
+    @classmethod
+    def z_par(cls, wiersze: List[str], kolumny: List[str], a: np.ndarray, b: np.ndarray,
+              pozycje: np.ndarray) -> 'MacierzPolaczen':
+        import scipy.sparse as sp
+
+        klucze = a.astype(np.int64) * len(kolumny) + b.astype(np.int64)
+        unikalne, odwrotne, liczby = np.unique(klucze, return_inverse=True, return_counts=True)
+        pierwsze = np.full(len(unikalne), np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(pierwsze, odwrotne, np.asarray(pozycje, dtype=np.int64))
+
+        # Klucze posortowane (wiersz, kolumna) - od razu układ CSR
+        n_kolumn = max(len(kolumny), 1)
+        indptr = np.searchsorted(unikalne // n_kolumn, np.arange(len(wiersze) + 1)).astype(np.int64)
+        macierz = sp.csr_matrix((liczby.astype(np.int64), (unikalne % n_kolumn).astype(np.int32), indptr),
+                                shape=(len(wiersze), len(kolumny)))
+        return cls(wiersze, kolumny, macierz, pierwsze)
+
+    @property
+    def liczba_par(self) -> int:
+        return self.macierz.nnz
+
+    def gesta(self, n_wierszy: int, n_kolumn: int) -> np.ndarray:
+        # Lewy górny wycinek (top n_wierszy x top n_kolumn) jako tablica gęsta
+        return self.macierz[:n_wierszy, :n_kolumn].toarray()
+
+    def tablice_krawedzi(self, n_wierszy: int, n_kolumn: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Niezerowe pary wycinka (indeks wiersza, indeks kolumny, liczba) wiersz po wierszu,
+        # kolumny w kolejności rang
+        wycinek = self.macierz[:n_wierszy, :n_kolumn].tocoo()
+        return wycinek.row, wycinek.col, wycinek.data
+
+    def krawedzie(self, n_wierszy: int, n_kolumn: int) -> List[Tuple[str, str, int]]:
+        wiersze, kolumny, liczby = self.tablice_krawedzi(n_wierszy, n_kolumn)
+        return [(self.wiersze[i], self.kolumny[j], c)
+                for i, j, c in zip(wiersze.tolist(), kolumny.tolist(), liczby.tolist())]
+
+    def wiersz(self, i: int) -> Tuple[np.ndarray, np.ndarray]:
+        # Kolumny i liczności wiersza malejąco po liczności, remisy w kolejności pierwszego wystąpienia
+        start, koniec = self.macierz.indptr[i], self.macierz.indptr[i + 1]
+        kolumny = self.macierz.indices[start:koniec]
+        liczby = self.macierz.data[start:koniec]
+        kolejnosc = np.lexsort((self.pierwsze[start:koniec], -liczby))
+        return kolumny[kolejnosc], liczby[kolejnosc]
+
+    def niepuste_wiersze(self) -> np.ndarray:
+        return np.flatnonzero(np.diff(self.macierz.indptr))
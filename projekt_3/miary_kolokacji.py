@@ -0,0 +1,151 @@
+import numpy as np
+from typing import NamedTuple, Optional, Tuple
+
+from macierz_polaczen import MacierzPolaczen
+
+MIARY = ('liczba', 'pmi', 'llr', 't', 'dice')
+OPISY_MIAR = {
+    'liczba': 'Liczba wystąpień',
+    'pmi': 'PMI',
+    'llr': 'Log-likelihood (G²)',
+    't': 't-score',
+    'dice': 'Współczynnik Dice',
+}
+# Najwięcej elementów tablicy pomocniczej (wiersze x najdłuższy wiersz) przy wyborze top-k
+ROZMIAR_BLOKU = 1 << 22
+
+
+# Pary wybrane z macierzy połączeń, wiersz po wierszu, w wierszu malejąco po wyniku miary
+# (remisy w kolejności pierwszego wystąpienia)
+class RankingPolaczen(NamedTuple):
+    wiersze: np.ndarray
+    kolumny: np.ndarray
+    liczby: np.ndarray
+    wyniki: np.ndarray
+
+
+def marginesy(macierz: MacierzPolaczen) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    # Dla każdej pary (w kolejności danych CSR): liczność k, suma wiersza r (wszystkie
+    # połączenia przymiotnika / czasownika), suma kolumny c (rzeczownika) i n - suma macierzy
+    csr = macierz.macierz
+    k = csr.data.astype(np.float64)
+    wiersze = np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr))
+    r = np.bincount(wiersze, k, minlength=csr.shape[0])[wiersze]
+    c = np.bincount(csr.indices, k, minlength=csr.shape[1])[csr.indices]
+    return k, r, c, float(k.sum())
+
+
+def _xlogx(k: np.ndarray, oczekiwane: np.ndarray) -> np.ndarray:
+    # k * log(k / oczekiwane), z 0 * log 0 = 0
+    wynik = np.zeros_like(k)
+    dodatnie = k > 0
+    wynik[dodatnie] = k[dodatnie] * np.log(k[dodatnie] / oczekiwane[dodatnie])
+    return wynik
+
+
+def ocen(macierz: MacierzPolaczen, miara: str = 'llr') -> np.ndarray:
+    # Wynik każdej pary liczony naraz dla całej tablicy par z liczników i marginesów:
+    # pmi = log k n / (r c), llr = G^2 Dunninga z tabeli 2x2, t = (k - r c / n) / sqrt(k),
+    # dice = 2 k / (r + c)
+    if miara not in MIARY:
+        raise ValueError(f"Nieznana miara: {miara} (dostępne: {', '.join(MIARY)})")
+    k, r, c, n = marginesy(macierz)
+    if miara == 'liczba':
+        return k
+    if miara == 'pmi':
+        return np.log(k * n / (r * c))
+    if miara == 't':
+        return (k - r * c / n) / np.sqrt(k)
+    if miara == 'dice':
+        return 2.0 * k / (r + c)
+
+    k12 = r - k
+    k21 = c - k
+    k22 = n - r - c + k
+    return 2.0 * (_xlogx(k, r * c / n) + _xlogx(k12, r * (n - c) / n)
+                  + _xlogx(k21, (n - r) * c / n) + _xlogx(k22, (n - r) * (n - c) / n))
+
+
+def _progi_wierszy(indptr: np.ndarray, wyniki: np.ndarray, wiersze: np.ndarray, dlugie: np.ndarray,
+                   k: int) -> np.ndarray:
+    # k-ty największy wynik każdego z długich wierszy (dłuższych niż k): wiersze o podobnej
+    # długości (ta sama potęga dwójki) wpisywane blokami w tablicę wypełnioną -inf
+    # i np.partition po osi wierszy - bez pełnego sortowania
+    dlugosci = indptr[dlugie + 1] - indptr[dlugie]
+    grupy = np.log2(dlugosci).astype(np.int64)
+    kolejnosc = np.argsort(grupy, kind='stable')
+    numer = np.full(len(indptr) - 1, -1)
+    numer[dlugie[kolejnosc]] = np.arange(len(dlugie))
+    pozycje = np.flatnonzero(numer[wiersze] >= 0)
+    nr = numer[wiersze[pozycje]]
+    porzadek = np.argsort(nr, kind='stable')
+    pozycje, nr = pozycje[porzadek], nr[porzadek]
+    przesuniecie = pozycje - indptr[wiersze[pozycje]]
+    dlugosci, grupy = dlugosci[kolejnosc], grupy[kolejnosc]
+
+    progi = np.empty(len(dlugie))
+    granice = np.flatnonzero(np.diff(grupy)) + 1
+    for poczatek_grupy, koniec_grupy in zip([0] + granice.tolist(), granice.tolist() + [len(dlugie)]):
+        szerokosc = int(dlugosci[poczatek_grupy:koniec_grupy].max())
+        wierszy_w_bloku = max(1, ROZMIAR_BLOKU // szerokosc)
+        for start in range(poczatek_grupy, koniec_grupy, wierszy_w_bloku):
+            koniec = min(start + wierszy_w_bloku, koniec_grupy)
+            a, b = np.searchsorted(nr, [start, koniec])
+            blok = np.full((koniec - start, szerokosc), -np.inf)
+            blok[nr[a:b] - start, przesuniecie[a:b]] = wyniki[pozycje[a:b]]
+            progi[start:koniec] = np.partition(blok, szerokosc - k, axis=1)[:, szerokosc - k]
+    # Z powrotem w kolejności dlugie
+    return progi[numer[dlugie]]
+
+
+def najlepsze_w_wierszach(indptr: np.ndarray, wyniki: np.ndarray, pierwsze: np.ndarray,
+                          k: Optional[int] = None) -> np.ndarray:
+    # Pozycje (w tablicach danych CSR) k najwyżej ocenionych par każdego wiersza, wiersz po
+    # wierszu, malejąco po wyniku; remisy - także na granicy top-k - rozstrzyga pierwsze wystąpienie
+    n_wierszy = len(indptr) - 1
+    wiersze = np.repeat(np.arange(n_wierszy), np.diff(indptr))
+    wybrane = np.arange(len(wyniki))
+
+    if k is not None:
+        dlugie = np.flatnonzero(np.diff(indptr) > k)
+        if len(dlugie):
+            prog = np.full(n_wierszy, -np.inf)
+            prog[dlugie] = _progi_wierszy(indptr, wyniki, wiersze, dlugie, k)
+            prog = prog[wiersze]
+            pewne = wyniki > prog
+            # Brakujące miejsca w wierszu dopełniane parami z wynikiem równym progowi
+            brakuje = k - np.bincount(wiersze[pewne], minlength=n_wierszy)
+            remisy = np.flatnonzero(wyniki == prog)
+            remisy = remisy[np.lexsort((pierwsze[remisy], wiersze[remisy]))]
+            w_remisie = np.arange(len(remisy)) - np.searchsorted(wiersze[remisy], wiersze[remisy])
+            pewne[remisy[w_remisie < brakuje[wiersze[remisy]]]] = True
+            wybrane = np.flatnonzero(pewne)
+
+    return wybrane[np.lexsort((pierwsze[wybrane], -wyniki[wybrane], wiersze[wybrane]))]
+
+
+def ranking(macierz: MacierzPolaczen, miara: str = 'liczba', k: Optional[int] = None,
+            n_wierszy: Optional[int] = None, n_kolumn: Optional[int] = None) -> RankingPolaczen:
+    # Wyniki z marginesów całej macierzy; top-k par każdego wiersza w wycinku
+    # n_wierszy x n_kolumn (pierwsze wiersze i kolumny - słowa w kolejności rang)
+    if k is not None and k < 0:
+        raise ValueError(f"k musi być nieujemne (podano {k})")
+    csr = macierz.macierz
+    wyniki = ocen(macierz, miara)
+    wiersze = np.repeat(np.arange(csr.shape[0]), np.diff(csr.indptr))
+    kolumny = csr.indices
+    pozycje = np.arange(len(wyniki))
+
+    if n_wierszy is not None or n_kolumn is not None:
+        w_wycinku = np.ones(len(wyniki), dtype=bool)
+        if n_wierszy is not None:
+            w_wycinku &= wiersze < n_wierszy
+        if n_kolumn is not None:
+            w_wycinku &= kolumny < n_kolumn
+        pozycje = np.flatnonzero(w_wycinku)
+    if k == 0:
+        pozycje = pozycje[:0]
+
+    indptr = np.searchsorted(wiersze[pozycje], np.arange(csr.shape[0] + 1))
+    wybrane = pozycje[najlepsze_w_wierszach(indptr, wyniki[pozycje], macierz.pierwsze[pozycje], k)]
+    return RankingPolaczen(wiersze[wybrane], kolumny[wybrane], csr.data[wybrane], wyniki[wybrane])
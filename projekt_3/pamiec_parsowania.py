@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from importlib.metadata import version, PackageNotFoundError
+from typing import Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.magazyn_korpusu import KATALOG_REPO
+from potok_spacy import KolumnyParsowania
+
+KATALOG_PARSOWAN = os.path.join(KATALOG_REPO, '.pjn_cache', 'parsowania')
+# Łączny rozmiar wpisów, powyżej którego usuwane są najdawniej używane
+LIMIT_BAJTOW = 512 << 20
+WERSJA_FORMATU = 1
+
+
+def wersja_pakietu(nazwa: str) -> Optional[str]:
+    # Wersja z metadanych pakietu (modelu spaCy lub samego spaCy) - bez importu
+    try:
+        return version(nazwa)
+    except PackageNotFoundError:
+        return None
+
+
+def rozmiar_katalogu(katalog: str) -> int:
+    return sum(e.stat().st_size for e in os.scandir(katalog) if e.is_file())
+
+
+# Sparsowany korpus (KolumnyParsowania) na dysku, w katalogu nazwanym hashem opisu
+# parsowania (korpus, limit słów, model i jego wersja, wersja spaCy, konfiguracja potoku):
+#   slownik.txt - teksty tokenów, id = numer linii
+#   ids.npy, pos.npy - kolumny tokenów (z parserem także glowy.npy, zaleznosci.npy)
+#   meta.json   - opis, nazwy części mowy; zapisywany na końcu
+# Trafienie odświeża czas modyfikacji meta.json; po zapisie wpisy najdawniej używane
+# usuwane są, dopóki łączny rozmiar przekracza limit
+class PamiecParsowania:
+    def __init__(self, katalog: str = KATALOG_PARSOWAN, limit_bajtow: int = LIMIT_BAJTOW):
+        self.katalog = katalog
+        self.limit_bajtow = limit_bajtow
+
+    @staticmethod
+    def klucz(opis: dict) -> str:
+        tekst = json.dumps({'wersja': WERSJA_FORMATU, **opis}, sort_keys=True)
+        return hashlib.blake2b(tekst.encode(), digest_size=16).hexdigest()
+
+    def wczytaj(self, opis: dict) -> Optional[KolumnyParsowania]:
+        katalog = os.path.join(self.katalog, self.klucz(opis))
+        sciezka_meta = os.path.join(katalog, 'meta.json')
+        if not os.path.exists(sciezka_meta):
+            return None
+
+        with open(sciezka_meta, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        with open(os.path.join(katalog, 'slownik.txt'), 'r', encoding='utf-8') as f:
+            slownik = f.read().split('\n')[:-1]
+        kolumny = KolumnyParsowania(slownik, np.load(os.path.join(katalog, 'ids.npy')),
+                                    np.load(os.path.join(katalog, 'pos.npy')), meta['nazwy_pos'])
+        if meta.get('nazwy_zaleznosci') is not None:
+            kolumny = kolumny._replace(glowy=np.load(os.path.join(katalog, 'glowy.npy')),
+                                       zaleznosci=np.load(os.path.join(katalog, 'zaleznosci.npy')),
+                                       nazwy_zaleznosci=meta['nazwy_zaleznosci'])
+        os.utime(sciezka_meta)
+        return kolumny
+
+    def zapisz(self, opis: dict, kolumny: KolumnyParsowania) -> str:
+        os.makedirs(self.katalog, exist_ok=True)
+        katalog = os.path.join(self.katalog, self.klucz(opis))
+        katalog_tmp = tempfile.mkdtemp(dir=self.katalog)
+
+        with open(os.path.join(katalog_tmp, 'slownik.txt'), 'w', encoding='utf-8') as f:
+            for slowo in kolumny.slownik:
+                f.write(slowo + '\n')
+        np.save(os.path.join(katalog_tmp, 'ids.npy'), kolumny.ids)
+        np.save(os.path.join(katalog_tmp, 'pos.npy'), kolumny.pos)
+        if kolumny.nazwy_zaleznosci is not None:
+            np.save(os.path.join(katalog_tmp, 'glowy.npy'), kolumny.glowy)
+            np.save(os.path.join(katalog_tmp, 'zaleznosci.npy'), kolumny.zaleznosci)
+        with open(os.path.join(katalog_tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({'opis': opis, 'nazwy_pos': kolumny.nazwy_pos, 'nazwy_zaleznosci': kolumny.nazwy_zaleznosci,
+                       'liczba_tokenow': kolumny.liczba_tokenow}, f, ensure_ascii=False, indent=2)
+
+        if os.path.exists(katalog):
+            shutil.rmtree(katalog)
+        os.replace(katalog_tmp, katalog)
+        self.przytnij(zachowaj=katalog)
+        return katalog
+
+    def przytnij(self, zachowaj: Optional[str] = None) -> int:
+        # Usuwa najdawniej używane wpisy ponad limit; zwraca liczbę usuniętych
+        wpisy = []
+        for wpis in os.scandir(self.katalog):
+            sciezka_meta = os.path.join(wpis.path, 'meta.json')
+            if wpis.is_dir() and os.path.exists(sciezka_meta):
+                wpisy.append((os.path.getmtime(sciezka_meta), rozmiar_katalogu(wpis.path), wpis.path))
+
+        razem = sum(rozmiar for _, rozmiar, _ in wpisy)
+        usuniete = 0
+        for _, rozmiar, sciezka in sorted(wpisy):
+            if razem <= self.limit_bajtow:
+                break
+            if sciezka == zachowaj:
+                continue
+            shutil.rmtree(sciezka)
+            razem -= rozmiar
+            usuniete += 1
+        return usuniete
@@ -0,0 +1,146 @@
+import os
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+# spaCy importowany dopiero przy ładowaniu modelu (AnalizaSemanyczna.zaladuj_spacy)
+if TYPE_CHECKING:
+    from spacy.language import Language
+    from spacy.tokens import Doc
+
+# Fragment tekstu przekazywany do spaCy jako osobny Doc (znaki) - dużo poniżej nlp.max_length
+ROZMIAR_FRAGMENTU = 20_000
+ROZMIAR_PACZKI = 32
+
+# Składniki potoku ładowane dla profilu (pozostałe wykluczane przy spacy.load); None - cały potok.
+# token.pos_ ustawia attribute_ruler na podstawie tagów taggera, parser potrzebny tylko do zależności
+PROFILE_POTOKU = {
+    'pos': ('tok2vec', 'tagger', 'attribute_ruler'),
+    'zaleznosci': ('tok2vec', 'tagger', 'parser', 'attribute_ruler'),
+    'pelny': None,
+}
+PROFIL = 'pos'
+
+
+def zaladuj_model(nazwa: str, profil: str = PROFIL) -> 'Language':
+    # Nazwa pakietu lub katalog modelu; składniki spoza profilu nie są nawet wczytywane
+    import spacy
+
+    skladniki = PROFILE_POTOKU[profil]
+    if skladniki is None:
+        return spacy.load(nazwa)
+    sciezka = nazwa if os.path.isdir(nazwa) else spacy.util.get_package_path(nazwa)
+    wszystkie = spacy.util.get_model_meta(sciezka).get('components', [])
+    return spacy.load(nazwa, exclude=[s for s in wszystkie if s not in skladniki])
+
+
+def podziel_tekst(tekst: str, rozmiar: int = ROZMIAR_FRAGMENTU) -> Iterator[str]:
+    # Fragmenty o długości do `rozmiar` znaków, cięte na ostatniej spacji (bez spacji - na
+    # ostatnim innym białym znaku), więc słowo nie jest dzielone, a tokeny fragmentów są takie
+    # jak całego tekstu (poza tokenami samych białych znaków w miejscach cięcia). Gdy okno nie
+    # zawiera żadnego białego znaku, cięcie twarde po `rozmiar` znakach - dzieli to słowo
+    # na dwa tokeny, ale fragment nigdy nie przekracza rozmiaru (ani nlp.max_length)
+    start = 0
+    while start < len(tekst):
+        koniec = start + rozmiar
+        if koniec >= len(tekst):
+            koniec = len(tekst)
+        else:
+            ciecie = tekst.rfind(' ', start, koniec + 1)
+            if ciecie <= start:
+                ciecie = max(tekst.rfind(znak, start, koniec + 1) for znak in '\n\t\r\f\v')
+            if ciecie > start:
+                koniec = ciecie
+        fragment = tekst[start:koniec].strip()
+        if fragment:
+            yield fragment
+        start = koniec + 1 if koniec < len(tekst) and tekst[koniec].isspace() else koniec
+
+
+def dokumenty(nlp: 'Language', tekst: str, rozmiar_fragmentu: int = ROZMIAR_FRAGMENTU,
+              rozmiar_paczki: int = ROZMIAR_PACZKI, liczba_procesow: int = 1) -> Iterator['Doc']:
+    # Strumień Doc dla kolejnych fragmentów; tekst krótszy od fragmentu to jeden Doc,
+    # jak self.nlp(tekst). Tagi przy granicach fragmentów mogą różnić się od analizy
+    # całości (krótszy kontekst), tokeny - nie
+    return nlp.pipe(podziel_tekst(tekst, rozmiar_fragmentu), batch_size=rozmiar_paczki,
+                    n_process=liczba_procesow)
+
+
+# Kolumnowy widok parsowania: jeden wiersz na token - identyfikator tekstu tokenu
+# (indeks w slownik, kolejność pierwszego wystąpienia) i identyfikator części mowy
+# (indeks w nazwy_pos); wystarcza do rankingu części mowy i połączeń sąsiednich słów.
+# Z parserem także pozycja nadrzędnika (glowy) i etykieta zależności (indeks w nazwy_zaleznosci)
+class KolumnyParsowania(NamedTuple):
+    slownik: List[str]
+    ids: np.ndarray
+    pos: np.ndarray
+    nazwy_pos: List[str]
+    glowy: Optional[np.ndarray] = None
+    zaleznosci: Optional[np.ndarray] = None
+    nazwy_zaleznosci: Optional[List[str]] = None
+
+    @property
+    def liczba_tokenow(self) -> int:
+        return len(self.ids)
+
+    def numery(self, slowa: List[str]) -> np.ndarray:
+        # Dla każdego identyfikatora słownika: indeks słowa na liście slowa lub -1
+        indeks = {slowo: i for i, slowo in enumerate(self.slownik)}
+        numery = np.full(len(self.slownik), -1, dtype=np.int64)
+        znane = [(indeks[s], i) for i, s in enumerate(slowa) if s in indeks]
+        if znane:
+            ids, pozycje = zip(*znane)
+            numery[list(ids)] = pozycje
+        return numery
+
+    def id_pos(self, nazwa: str) -> int:
+        # -1 gdy tag nie wystąpił w korpusie
+        return self.nazwy_pos.index(nazwa) if nazwa in self.nazwy_pos else -1
+
+    def maska_zaleznosci(self, etykiety: Iterable[str]) -> np.ndarray:
+        # Tokeny z jedną z etykiet zależności
+        etykiety = set(etykiety)
+        ids = [i for i, nazwa in enumerate(self.nazwy_zaleznosci) if nazwa in etykiety]
+        return np.isin(self.zaleznosci, ids)
+
+
+def kolumny_z_dokumentow(docs: Iterable['Doc'], zaleznosci: bool = False) -> KolumnyParsowania:
+    # doc.to_array([ORTH, POS]) dla kolejnych Doc; hashe tekstów i tagów zamieniane na małe
+    # identyfikatory od razu, więc pamięć to 4 + 1 bajty na token (z zależnościami: + 4 + 1)
+    from spacy.attrs import ORTH, POS, HEAD, DEP
+
+    slownik: List[str] = []
+    indeks: Dict[int, int] = {}
+    nazwy_pos: List[str] = []
+    indeks_pos: Dict[int, int] = {}
+    nazwy_zaleznosci: List[str] = []
+    indeks_zaleznosci: Dict[int, int] = {}
+    czesci_ids, czesci_pos, czesci_glow, czesci_zaleznosci = [], [], [], []
+    mapowania = [(0, slownik, indeks, czesci_ids, np.int32), (1, nazwy_pos, indeks_pos, czesci_pos, np.uint8)]
+    if zaleznosci:
+        mapowania.append((3, nazwy_zaleznosci, indeks_zaleznosci, czesci_zaleznosci, np.uint8))
+    przesuniecie = 0
+
+    for doc in docs:
+        tablica = doc.to_array([ORTH, POS, HEAD, DEP] if zaleznosci else [ORTH, POS])
+        if len(tablica) == 0:
+            continue
+        if zaleznosci:
+            # HEAD - przesunięcie nadrzędnika względem tokenu (uint64 z przeniesieniem)
+            czesci_glow.append((przesuniecie + np.arange(len(tablica)) + tablica[:, 2].astype(np.int64)).astype(np.int32))
+        przesuniecie += len(tablica)
+        for kolumna, sl, ind, czesci, typ in mapowania:
+            unikalne, pierwsze, odwrotne = np.unique(tablica[:, kolumna], return_index=True, return_inverse=True)
+            # Nowe hashe w kolejności pierwszego wystąpienia w dokumencie
+            for h in unikalne[np.argsort(pierwsze)].tolist():
+                if h not in ind:
+                    ind[h] = len(sl)
+                    sl.append(doc.vocab.strings[h])
+            czesci.append(np.array([ind[h] for h in unikalne.tolist()], dtype=typ)[odwrotne])
+
+    ids = np.concatenate(czesci_ids) if czesci_ids else np.zeros(0, dtype=np.int32)
+    pos = np.concatenate(czesci_pos) if czesci_pos else np.zeros(0, dtype=np.uint8)
+    if not zaleznosci:
+        return KolumnyParsowania(slownik, ids, pos, nazwy_pos)
+    glowy = np.concatenate(czesci_glow) if czesci_glow else np.zeros(0, dtype=np.int32)
+    etykiety = np.concatenate(czesci_zaleznosci) if czesci_zaleznosci else np.zeros(0, dtype=np.uint8)
+    return KolumnyParsowania(slownik, ids, pos, nazwy_pos, glowy, etykiety, nazwy_zaleznosci)
@@ -0,0 +1,119 @@
+import os
+import sys
+import json
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+from indeks_kolokacji import IndeksKolokacji, POJEMNOSC_PAMIECI
+
+KATALOG_INDEKSU = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'kolokacje')
+PORT = 8765
+
+
+# Zapytania do indeksu kolokacji przez HTTP (JSON):
+#   GET  /rzeczowniki?slowo=old&relacja=adj-noun&k=10 - rzeczowniki przy przymiotniku / czasowniku
+#   GET  /okreslenia?slowo=man&relacja=verb-noun&k=10 - przymiotniki / czasowniki przy rzeczowniku
+#   POST /wiele  [{"typ": "rzeczowniki", "slowo": "old", ...}, ...] - wiele zapytań naraz
+#   GET  /stan   - opis indeksu i statystyki pamięci LRU
+# HTTP/1.1 z Content-Length, więc klient może używać jednego połączenia dla wielu zapytań;
+# TCP_NODELAY - nagłówki i treść wysyłane osobno nie czekają na opóźnione ACK klienta
+class ObslugaKolokacji(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    indeks: IndeksKolokacji = None
+    gadatliwie = False
+
+    def _odpowiedz(self, kod: int, dane) -> None:
+        tresc = json.dumps(dane, ensure_ascii=False).encode('utf-8')
+        self.send_response(kod)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(tresc)))
+        self.end_headers()
+        self.wfile.write(tresc)
+
+    def do_GET(self):
+        adres = urlparse(self.path)
+        typ = adres.path.strip('/')
+        if typ == 'stan':
+            self._odpowiedz(200, {'meta': self.indeks.meta, 'pamiec': self.indeks.stan_pamieci()})
+            return
+        if typ not in ('rzeczowniki', 'okreslenia'):
+            self._odpowiedz(404, {'blad': f"Nieznana ścieżka: {adres.path}"})
+            return
+
+        parametry = {k: v[0] for k, v in parse_qs(adres.query).items()}
+        if 'slowo' not in parametry:
+            self._odpowiedz(400, {'blad': "Brak parametru slowo"})
+            return
+        try:
+            k = int(parametry['k']) if 'k' in parametry else 10
+        except ValueError:
+            self._odpowiedz(400, {'blad': f"Niepoprawny parametr k: {parametry['k']}"})
+            return
+        if k < 0:
+            self._odpowiedz(400, {'blad': f"k musi być nieujemne (podano {k})"})
+            return
+        try:
+            wynik = self.indeks.wiele([{'typ': typ, 'slowo': parametry['slowo'],
+                                        'relacja': parametry.get('relacja', 'adj-noun'), 'k': k}])[0]
+        except ValueError as e:
+            self._odpowiedz(400, {'blad': str(e)})
+            return
+        self._odpowiedz(200, {'slowo': parametry['slowo'], 'wyniki': wynik})
+
+    def do_POST(self):
+        if urlparse(self.path).path.strip('/') != 'wiele':
+            self._odpowiedz(404, {'blad': f"Nieznana ścieżka: {self.path}"})
+            return
+        try:
+            dlugosc = int(self.headers.get('Content-Length', 0))
+            zapytania = json.loads(self.rfile.read(dlugosc) or b'[]')
+            wyniki = self.indeks.wiele(zapytania)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self._odpowiedz(400, {'blad': f"Niepoprawne zapytania: {e}"})
+            return
+        self._odpowiedz(200, {'wyniki': wyniki})
+
+    def log_message(self, format, *args):
+        if self.gadatliwie:
+            super().log_message(format, *args)
+
+
+def utworz_serwer(indeks: IndeksKolokacji, host: str = '127.0.0.1', port: int = PORT,
+                  gadatliwie: bool = False) -> ThreadingHTTPServer:
+    # Klasa obsługi z przypiętym indeksem - wątki serwera dzielą memmapy i pamięć LRU
+    obsluga = type('Obsluga', (ObslugaKolokacji,), {'indeks': indeks, 'gadatliwie': gadatliwie})
+    return ThreadingHTTPServer((host, port), obsluga)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serwer zapytań do indeksu kolokacji (JSON przez HTTP)')
+    parser.add_argument('--indeks', default=KATALOG_INDEKSU,
+                        help='katalog indeksu z AnalizaSemanyczna.zapisz_indeks()')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=PORT)
+    parser.add_argument('--pojemnosc-pamieci', type=int, default=POJEMNOSC_PAMIECI,
+                        help='liczba odpowiedzi w pamięci LRU (0 - bez pamięci)')
+    parser.add_argument('--gadatliwie', action='store_true', help='wypisuje każde zapytanie')
+    args = parser.parse_args()
+
+    try:
+        indeks = IndeksKolokacji.otworz(args.indeks, pojemnosc_pamieci=args.pojemnosc_pamieci)
+    except FileNotFoundError as e:
+        print(e)
+        sys.exit(1)
+
+    serwer = utworz_serwer(indeks, args.host, args.port, args.gadatliwie)
+    print(f"Indeks kolokacji: {args.indeks}")
+    print(f"Serwer: http://{args.host}:{serwer.server_address[1]}/ (Ctrl+C kończy)", flush=True)
+    try:
+        serwer.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        serwer.server_close()
+
+
+if __name__ == "__main__":
+    main()
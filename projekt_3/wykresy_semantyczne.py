@@ -0,0 +1,105 @@
+import os
+import sys
+import numpy as np
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from wspolne.renderowanie import zakoncz_rysunek
+
+
+def _pyplot():
+    # matplotlib importowany dopiero przy rysowaniu, razem z ustawieniem stylu
+    import matplotlib.pyplot as plt
+
+    plt.rcParams['figure.facecolor'] = 'white'
+    plt.rcParams['axes.facecolor'] = '#f8f9fa'
+    return plt
+
+
+# Przedziały liczby wystąpień (0, 1, 2-10, >10) i ich kolory - wspólne dla krawędzi i legendy
+PROGI_KOLOROW = (1, 2, 11)
+KOLORY_LICZB = ('#e74c3c', '#f39c12', '#27ae60', '#3498db')
+# Powyżej tylu węzłów w kolumnie podpisywany jest co k-ty (pozostałe i tak by się nakładały),
+# a rozmiar znaczników i grubość krawędzi maleją z odstępem między węzłami
+MAKS_ETYKIET = 60
+
+
+def kolor_liczby(count: int) -> str:
+    return KOLORY_LICZB[int(np.digitize(count, PROGI_KOLOROW))]
+
+
+def rysuj_graf_dwudzielny(set_a: List[str], set_b: List[str], wiersze: np.ndarray, kolumny: np.ndarray,
+                          liczby: np.ndarray, tytul: str, label_a: str, label_b: str,
+                          sciezka: Optional[str], dpi: int = 300) -> None:
+    # Krawędzie jako tablice (indeks w set_a, indeks w set_b, liczba) rysowane jedną
+    # LineCollection; kolory i grubości liczone na tablicach, bez pętli po krawędziach
+    import matplotlib.patches as mpatches
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(18, 12))
+
+    y_a = 1 - (np.arange(len(set_a)) + 1) / (len(set_a) + 1)
+    y_b = 1 - (np.arange(len(set_b)) + 1) / (len(set_b) + 1)
+
+    liczby = np.asarray(liczby)
+    odcinki = np.zeros((len(liczby), 2, 2))
+    odcinki[:, 0, 1] = y_a[wiersze]
+    odcinki[:, 1, 0] = 1
+    odcinki[:, 1, 1] = y_b[kolumny]
+    kolory = to_rgba_array(KOLORY_LICZB)[np.digitize(liczby, PROGI_KOLOROW)]
+    skala = min(1.0, MAKS_ETYKIET / max(len(set_a), len(set_b), 1))
+    ax.add_collection(LineCollection(odcinki, colors=kolory, linewidths=np.minimum(liczby * 0.5, 5) * skala,
+                                     alpha=0.6, zorder=1))
+    # Margines 5% wokół węzłów, jak przy rysowaniu krawędzi przez networkx (0.5 - dla pustych kolumn)
+    y = np.concatenate([y_a, y_b, [0.5]])
+    margines = 0.05 * (y.max() - y.min())
+    ax.update_datalim([(-0.05, y.min() - margines), (1.05, y.max() + margines)])
+    ax.autoscale_view()
+
+    for x, slowa, y, znacznik in ((0, set_a, y_a, 's'), (1, set_b, y_b, 'o')):
+        skala = min(1.0, MAKS_ETYKIET / max(len(slowa), 1))
+        ax.scatter(np.full(len(slowa), x), y, s=800 * skala ** 2, marker=znacznik, c='#ecf0f1',
+                   edgecolors='#34495e', linewidths=2 * skala, zorder=2)
+        krok = -(-len(slowa) // MAKS_ETYKIET)
+        for slowo, y_slowa in zip(slowa[::krok], y[::krok].tolist()):
+            ax.text(x, y_slowa, slowo, ha='center', va='center', fontsize=8, fontweight='bold', zorder=3)
+
+    ax.text(0, 1.05, label_a, ha='center', fontsize=14, fontweight='bold')
+    ax.text(1, 1.05, label_b, ha='center', fontsize=14, fontweight='bold')
+
+    legend_elements = [
+        mpatches.Patch(facecolor=kolor, label=opis)
+        for kolor, opis in zip(KOLORY_LICZB, ('0 wystąpień', '1 wystąpienie', '2-10 wystąpień', '>10 wystąpień'))
+    ]
+    ax.legend(handles=legend_elements, loc='upper center', bbox_to_anchor=(0.5, -0.05),
+              ncol=4, frameon=True, fontsize=10)
+
+    ax.set_title(tytul, fontsize=16, fontweight='bold', pad=20)
+    ax.axis('off')
+    plt.tight_layout()
+
+    zakoncz_rysunek(fig, sciezka, dpi, 'Graf zapisany')
+
+
+def rysuj_macierz_polaczen(matrix: np.ndarray, set_a: List[str], set_b: List[str], tytul: str,
+                           sciezka: Optional[str], dpi: int = 300, etykieta: str = 'Liczba wystąpień') -> None:
+    plt = _pyplot()
+    fig, ax = plt.subplots(figsize=(16, 14))
+
+    im = ax.imshow(matrix, cmap='YlOrRd', aspect='auto', interpolation='nearest')
+
+    ax.set_xticks(np.arange(len(set_b)))
+    ax.set_yticks(np.arange(len(set_a)))
+    ax.set_xticklabels(set_b, rotation=90, ha='right', fontsize=7)
+    ax.set_yticklabels(set_a, fontsize=7)
+
+    ax.set_title(tytul, fontsize=16, fontweight='bold', pad=20)
+
+    cbar = plt.colorbar(im, ax=ax)
+    cbar.set_label(etykieta, rotation=270, labelpad=20, fontsize=12)
+
+    plt.tight_layout()
+
+    zakoncz_rysunek(fig, sciezka, dpi, 'Macierz zapisana')
@@ -0,0 +1,7 @@
+import os
+import sys
+
+KATALOG_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+for sciezka in (KATALOG_REPO, *(os.path.join(KATALOG_REPO, k) for k in ('projekt_1', 'projekt_2', 'projekt_3', 'benchmarki'))):
+    if sciezka not in sys.path:
+        sys.path.insert(0, sciezka)
@@ -0,0 +1,57 @@
+import sys
+
+import pytest
+
+import analiza_korpusu
+
+
+@pytest.fixture
+def katalog(tmp_path):
+    for nazwa in ('a.txt', 'b.txt'):
+        (tmp_path / nazwa).write_text("the cat sat on the mat.\n", encoding='utf-8')
+    return str(tmp_path)
+
+
+def _main(monkeypatch, *argumenty):
+    monkeypatch.setattr(sys, 'argv', ['analiza_korpusu.py', *argumenty])
+    with pytest.raises(SystemExit) as wyjatek:
+        analiza_korpusu.main()
+    return wyjatek.value.code
+
+
+@pytest.mark.parametrize('argumenty', [
+    (),
+    ('--procesy', '2', '--przyrostowo'),
+    ('--procesy', '2', '--okno', '3'),
+    ('--przyblizone', '100', '--miara', 'pmi'),
+])
+def test_wiele_plikow_odrzucone(katalog, monkeypatch, capsys, argumenty):
+    # Katalog w trybie szeregowym kończył się IsADirectoryError po wczytaniu
+    assert _main(monkeypatch, '--zrodlo', katalog, *argumenty) == 2
+    assert '--zrodlo' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argumenty, opcja', [
+    (('--top-sasiadow', '0'), '--top-sasiadow'),
+    (('--top-sasiadow', '-1'), '--top-sasiadow'),
+    (('--okno', '0'), '--okno'),
+    (('--okno', '-2'), '--okno'),
+])
+def test_okno_i_top_sasiadow(monkeypatch, capsys, argumenty, opcja):
+    # Wcześniej --top-sasiadow 0 było pomijane, a okno < 1 cofało do grafu sąsiedztwa
+    assert _main(monkeypatch, *argumenty) == 2
+    assert opcja in capsys.readouterr().err
+
+
+def test_brak_plikow(tmp_path, monkeypatch, capsys):
+    assert _main(monkeypatch, '--zrodlo', str(tmp_path / '*.txt'), '--procesy', '2') == 2
+    assert 'brak plików' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argumenty', [('--procesy', '2'), ('--przyblizone', '100')])
+def test_wiele_plikow_dozwolone(katalog, monkeypatch, argumenty):
+    wywolania = []
+    monkeypatch.setattr(analiza_korpusu, 'uruchom_analize', lambda args, metryki: wywolania.append(args))
+    monkeypatch.setattr(sys, 'argv', ['analiza_korpusu.py', '--zrodlo', katalog, '--cicho', *argumenty])
+    analiza_korpusu.main()
+    assert len(wywolania) == 1
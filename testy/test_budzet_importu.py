@@ -0,0 +1,19 @@
+import statistics
+
+import pytest
+
+from benchmark_importu import BUDZET_MS, MODULY, zmierz_import
+
+POWTORZENIA = 3
+
+
+@pytest.mark.parametrize('projekt, modul', MODULY)
+def test_budzet_importu(projekt, modul):
+    # Świeży interpreter na każdy pomiar (benchmark_importu); pierwszy przebieg rozgrzewa
+    # pliki .pyc i pamięć podręczną systemu plików, mediana z kolejnych
+    zmierz_import(projekt, modul)
+    pomiary = [zmierz_import(projekt, modul) for _ in range(POWTORZENIA)]
+    ciezkie = sorted({m for p in pomiary for m in p['ciezkie']})
+    assert not ciezkie, f"import {modul} ładuje {', '.join(ciezkie)}"
+    mediana = statistics.median(1000 * p['czas_s'] for p in pomiary)
+    assert mediana <= BUDZET_MS, f"import {modul}: {mediana:.1f} ms > budżet {BUDZET_MS:g} ms"
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from analiza_korpusu import AnalizaKorpusu
+from dopasowanie_zipfa import dopasuj_zipfa
+
+
+def _probka_zipfa(s: float, q: float = 0.0, liczba_rang: int = 3000, wystapienia: int = 5_000_000) -> np.ndarray:
+    # Częstotliwości z rozkładu p(r) ~ (r+q)^-s, posortowane malejąco; rang więcej niż
+    # DOKLADNE_RANGI - ogon liczony kwadraturą
+    rng = np.random.default_rng(0)
+    p = (np.arange(1, liczba_rang + 1) + q) ** -s
+    f = np.sort(rng.multinomial(wystapienia, p / p.sum()))[::-1]
+    return f[f > 0]
+
+
+@pytest.mark.parametrize('s', [0.9, 1.1, 1.5])
+def test_mle_odtwarza_wykladnik(s):
+    wynik = dopasuj_zipfa(_probka_zipfa(s), liczba_prob=200)
+    assert wynik.s_mle == pytest.approx(s, abs=0.005)
+    assert wynik.s_mle_ci[0] - 0.002 <= s <= wynik.s_mle_ci[1] + 0.002
+    assert wynik.s_regresja == pytest.approx(s, abs=0.05)
+
+
+def test_mle_mandelbrota():
+    wynik = dopasuj_zipfa(_probka_zipfa(1.2, q=2.0), liczba_prob=0)
+    assert wynik.s_mandelbrot == pytest.approx(1.2, abs=0.01)
+    assert wynik.q_mandelbrot == pytest.approx(2.0, abs=0.1)
+    assert wynik.ks_mandelbrot < wynik.ks_zipf
+
+
+def test_za_malo_rang():
+    with pytest.raises(ValueError):
+        dopasuj_zipfa(np.array([5]))
+
+
+def test_analiza_pomija_dopasowanie(tmp_path, capsys):
+    # Korpus z jednym słowem: analiza idzie dalej bez dopasowania
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text("word word word\n", encoding='utf-8')
+    analiza = AnalizaKorpusu(str(sciezka), uzyj_magazynu=False)
+    analiza.wczytaj_korpus(limit_slow=None)
+    analiza.oblicz_statystyki()
+    assert analiza.dopasuj_prawo_zipfa() is None
+    assert analiza.dopasowanie is None
+    assert 'pominięto' in capsys.readouterr().out
@@ -0,0 +1,61 @@
+import csv
+import itertools
+import json
+
+import numpy as np
+import pytest
+
+from generator_zdan import KOLUMNY, PrzestrzenZdan, zapisz_zdania
+from gramatyka import CZASY, LICZBY, OSOBY, PRZEDIMKI, RODZAJE, build_sentence
+
+DATA = {'nouns': ['cat', 'apple', 'hour'], 'adjectives': ['big', 'old'], 'verbs': ['see', 'go']}
+
+
+def _wszystkie():
+    # Kombinacje w kolejności osi, ostatnia oś zmienia się najszybciej
+    return list(itertools.product(DATA['nouns'], [None] + DATA['adjectives'], LICZBY, OSOBY,
+                                  DATA['verbs'], CZASY, RODZAJE, DATA['nouns'], PRZEDIMKI))
+
+
+def _oczekiwane():
+    return [(*k, build_sentence(PrzestrzenZdan.dane(k))) for k in _wszystkie()]
+
+
+def test_numeracja_obejmuje_kazda_kombinacje_raz():
+    przestrzen = PrzestrzenZdan(DATA)
+    wszystkie = _wszystkie()
+    assert przestrzen.liczba == len(wszystkie)
+    assert list(przestrzen.kombinacje(np.arange(przestrzen.liczba))) == wszystkie
+    assert len(set(wszystkie)) == len(wszystkie)
+
+
+@pytest.mark.parametrize('procesy', [1, 2])
+def test_jsonl(tmp_path, procesy):
+    sciezka = tmp_path / 'zdania.jsonl'
+    zapisz_zdania(str(sciezka), DATA, 'jsonl', rozmiar_paczki=97, liczba_procesow=procesy)
+    with open(sciezka, encoding='utf-8') as f:
+        wiersze = [json.loads(linia) for linia in f]
+    assert wiersze == [dict(zip(KOLUMNY, w)) for w in _oczekiwane()]
+
+
+@pytest.mark.parametrize('procesy', [1, 2])
+def test_csv(tmp_path, procesy):
+    sciezka = tmp_path / 'zdania.csv'
+    zapisz_zdania(str(sciezka), DATA, 'csv', rozmiar_paczki=97, liczba_procesow=procesy)
+    with open(sciezka, encoding='utf-8', newline='') as f:
+        wiersze = list(csv.reader(f))
+    assert wiersze[0] == list(KOLUMNY)
+    # csv zapisuje None jako pusty napis, liczby jako tekst
+    assert wiersze[1:] == [['' if w is None else str(w) for w in wiersz] for wiersz in _oczekiwane()]
+
+
+def test_losowe_niezalezne_od_procesow(tmp_path):
+    wyniki = []
+    for procesy in (1, 2):
+        sciezka = tmp_path / f'losowe_{procesy}.jsonl'
+        zapisz_zdania(str(sciezka), DATA, 'jsonl', 'losowe', liczba=500, ziarno=3, rozmiar_paczki=64,
+                      liczba_procesow=procesy)
+        wyniki.append(sciezka.read_text(encoding='utf-8'))
+    assert wyniki[0] == wyniki[1]
+    oczekiwane = {json.dumps(dict(zip(KOLUMNY, w)), ensure_ascii=False) for w in _oczekiwane()}
+    assert set(wyniki[0].splitlines()) <= oczekiwane
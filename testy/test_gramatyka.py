@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from gramatyka import (CZASY, LICZBY, OSOBY, PRZEDIMKI, RODZAJE, TablicaOdmian, build_sentence,
+                       wczytaj_dane)
+
+KATALOG_PROJEKTU = os.path.join(os.path.dirname(__file__), '..', 'projekt_2')
+
+
+@pytest.fixture(scope='module')
+def data():
+    return wczytaj_dane(os.path.join(KATALOG_PROJEKTU, 'data.json'))
+
+
+@pytest.fixture(scope='module')
+def tablica(data):
+    return TablicaOdmian.z_danych(data)
+
+
+def _zdanie(noun, adj=None, number='pojedyncza', person=3, verb='see', tense='Present Simple',
+            typ='twierdzące', obj='dog', article='the'):
+    return {
+        'subject': {'noun': noun, 'number': number, 'person': person, 'adj': adj},
+        'verb': {'base': verb, 'tense': tense, 'type': typ},
+        'object': {'noun': obj, 'article': article},
+    }
+
+
+def _porownaj(tablica, zdania):
+    for zd in zdania:
+        assert build_sentence(zd, tablica) == build_sentence(zd), zd
+
+
+def test_tablica_obejmuje_dane(data, tablica):
+    # Inaczej porównania niżej sprawdzałyby tylko odmiany na bieżąco
+    assert set(tablica.przedimki) == set(data['adjectives'])
+    assert set(tablica.mnogie) == set(tablica.formy_a) == set(data['nouns'])
+    assert set(tablica.czasowniki) == set(data['verbs'])
+
+
+def test_przymiotnik_z_rzeczownikiem(data, tablica):
+    # Przedimek przymiotnika wyznaczony z frazy "przymiotnik x" - dla każdej pary z data.json
+    # taki sam jak z całej frazy liczonej przez inflect
+    _porownaj(tablica, (_zdanie(noun, adj) for adj in data['adjectives'] for noun in data['nouns']))
+
+
+def test_rzeczowniki(data, tablica):
+    _porownaj(tablica, (_zdanie(noun, number=liczba, obj=noun, article=przedimek)
+                        for noun in data['nouns'] for liczba in LICZBY for przedimek in PRZEDIMKI))
+
+
+def test_czasowniki(data, tablica):
+    _porownaj(tablica, (_zdanie('cat', number=liczba, person=osoba, verb=verb, tense=czas, typ=rodzaj)
+                        for verb in data['verbs'] for liczba in LICZBY for osoba in OSOBY
+                        for czas in CZASY for rodzaj in RODZAJE))
@@ -0,0 +1,63 @@
+import json
+import threading
+import http.client
+
+import numpy as np
+import pytest
+
+from macierz_polaczen import MacierzPolaczen
+from indeks_kolokacji import IndeksKolokacji, zapisz_indeks
+from serwer_kolokacji import utworz_serwer
+
+
+@pytest.fixture
+def indeks(tmp_path):
+    # old: man x3, house x1; big: house x2, man x1; new: car x1
+    a = np.array([0, 0, 0, 0, 1, 1, 1, 2])
+    b = np.array([0, 0, 0, 1, 1, 1, 0, 2])
+    macierz = MacierzPolaczen.z_par(['old', 'big', 'new'], ['man', 'house', 'car'], a, b, np.arange(len(a)))
+    zapisz_indeks(str(tmp_path), {'adj-noun': macierz})
+    return IndeksKolokacji.otworz(str(tmp_path))
+
+
+def test_zapytania(indeks):
+    assert indeks.rzeczowniki('old', k=None) == (('man', 3), ('house', 1))
+    assert indeks.rzeczowniki('big', k=1) == (('house', 2),)
+    assert indeks.rzeczowniki('new', k=0) == ()
+    assert indeks.okreslenia('house') == (('big', 2), ('old', 1))
+
+
+def test_ujemne_k(indeks):
+    # Ujemne k nie może sięgać do wierszy innych słów
+    with pytest.raises(ValueError):
+        indeks.rzeczowniki('big', k=-2)
+    with pytest.raises(ValueError):
+        indeks.wiele([{'typ': 'okreslenia', 'slowo': 'man', 'k': -1}])
+
+
+@pytest.fixture
+def serwer(indeks):
+    serwer = utworz_serwer(indeks, port=0)
+    watek = threading.Thread(target=serwer.serve_forever, daemon=True)
+    watek.start()
+    yield serwer.server_address
+    serwer.shutdown()
+    serwer.server_close()
+
+
+def _get(adres, sciezka):
+    polaczenie = http.client.HTTPConnection(*adres)
+    polaczenie.request('GET', sciezka)
+    odpowiedz = polaczenie.getresponse()
+    wynik = odpowiedz.status, json.loads(odpowiedz.read())
+    polaczenie.close()
+    return wynik
+
+
+def test_serwer_k(serwer):
+    kod, dane = _get(serwer, '/rzeczowniki?slowo=old&k=1')
+    assert kod == 200 and dane['wyniki'] == [['man', 3]]
+    for k in ('-2', 'abc', '1.5'):
+        kod, dane = _get(serwer, f'/rzeczowniki?slowo=big&k={k}')
+        assert kod == 400, k
+        assert 'blad' in dane
@@ -0,0 +1,14 @@
+import numpy as np
+
+from macierz_sasiedztwa import ranga_alfabetyczna
+
+
+def test_ranga_alfabetyczna_jak_sorted():
+    slownik = ['the', 'cat', 'Zebra', 'żółw', 'a', 'ab', 'abc', 'ą', 'x' * 100_000, '']
+    ranga = ranga_alfabetyczna(slownik)
+    assert ranga.dtype == np.int64
+    assert [slownik[i] for i in np.argsort(ranga)] == sorted(slownik)
+
+
+def test_ranga_alfabetyczna_pusty_slownik():
+    assert len(ranga_alfabetyczna([])) == 0
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+from wspolne import magazyn_korpusu
+from wspolne.magazyn_korpusu import MagazynKorpusu
+from analiza_korpusu import AnalizaKorpusu
+
+TEKST = "The cat sat. A dog ran to the cat!\nI saw it, and the dog sat.\n"
+
+
+@pytest.fixture
+def korpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(magazyn_korpusu, 'KATALOG_CACHE', str(tmp_path / 'cache'))
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text(TEKST, encoding='utf-8')
+    return str(sciezka)
+
+
+@pytest.fixture
+def licznik_hashy(monkeypatch):
+    wywolania = []
+    hash_pliku = magazyn_korpusu.hash_pliku
+    monkeypatch.setattr(magazyn_korpusu, 'hash_pliku', lambda s: wywolania.append(s) or hash_pliku(s))
+    return wywolania
+
+
+def test_hash_tylko_po_zmianie_rozmiaru_lub_mtime(korpus, licznik_hashy):
+    pierwszy = MagazynKorpusu.otworz(korpus)
+    assert len(licznik_hashy) == 1
+
+    # Niezmieniony plik rozpoznany po (rozmiar, mtime_ns), bez czytania treści
+    assert MagazynKorpusu.otworz(korpus).katalog == pierwszy.katalog
+    assert len(licznik_hashy) == 1
+
+    # Nowy mtime przy tej samej treści - hash liczony ponownie, ten sam magazyn
+    stat = os.stat(korpus)
+    os.utime(korpus, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert MagazynKorpusu.otworz(korpus).katalog == pierwszy.katalog
+    assert len(licznik_hashy) == 2
+
+    with open(korpus, 'a', encoding='utf-8') as f:
+        f.write("The end.\n")
+    assert MagazynKorpusu.otworz(korpus).katalog != pierwszy.katalog
+    assert len(licznik_hashy) == 3
+
+
+def test_bez_kompilacji(korpus, licznik_hashy):
+    assert MagazynKorpusu.otworz(korpus, kompiluj=False) is None
+    assert not licznik_hashy
+    MagazynKorpusu.otworz(korpus)
+    assert MagazynKorpusu.otworz(korpus, kompiluj=False) is not None
+
+
+def _slowa(analiza: AnalizaKorpusu) -> list:
+    return [analiza.slownik[i] for i in analiza.tokeny.tolist()]
+
+
+def test_limit_nie_kompiluje_magazynu(korpus, licznik_hashy):
+    strumien = AnalizaKorpusu(korpus)
+    strumien.wczytaj_korpus(limit_slow=5)
+    assert not licznik_hashy
+    assert not os.path.exists(magazyn_korpusu.KATALOG_CACHE)
+
+    pelna = AnalizaKorpusu(korpus)
+    pelna.wczytaj_korpus(limit_slow=None)
+    assert len(licznik_hashy) == 1
+
+    # Gotowy magazyn używany także z limitem; te same słowa co przy odczycie blokami
+    z_magazynu = AnalizaKorpusu(korpus)
+    z_magazynu.wczytaj_korpus(limit_slow=5)
+    assert z_magazynu.magazyn is not None
+    assert len(licznik_hashy) == 1
+    assert _slowa(z_magazynu) == _slowa(strumien) == _slowa(pelna)[:5]
@@ -0,0 +1,51 @@
+import sys
+
+import numpy as np
+import pytest
+
+from macierz_polaczen import MacierzPolaczen
+from miary_kolokacji import MIARY, ocen, ranking
+
+
+@pytest.fixture
+def macierz():
+    rng = np.random.default_rng(0)
+    a = rng.integers(0, 6, 400)
+    b = rng.integers(0, 9, 400)
+    return MacierzPolaczen.z_par([f'a{i}' for i in range(6)], [f'b{i}' for i in range(9)], a, b, np.arange(400))
+
+
+def _wzorzec(macierz, miara, k):
+    # Każdy wiersz osobno: malejąco po wyniku, remisy po pierwszym wystąpieniu
+    csr = macierz.macierz
+    wyniki = ocen(macierz, miara)
+    pary = []
+    for w in range(csr.shape[0]):
+        pozycje = range(csr.indptr[w], csr.indptr[w + 1])
+        najlepsze = sorted(pozycje, key=lambda p: (-wyniki[p], macierz.pierwsze[p]))[:k]
+        pary.extend((w, int(csr.indices[p])) for p in najlepsze)
+    return pary
+
+
+@pytest.mark.parametrize('miara', MIARY)
+@pytest.mark.parametrize('k', [None, 1, 2, 5, 100])
+def test_ranking_jak_sortowanie_wierszy(macierz, miara, k):
+    wynik = ranking(macierz, miara, k)
+    assert list(zip(wynik.wiersze.tolist(), wynik.kolumny.tolist())) == _wzorzec(macierz, miara, k)
+
+
+def test_ranking_k_zero_i_ujemne(macierz):
+    wynik = ranking(macierz, 'pmi', 0)
+    assert len(wynik.wiersze) == len(wynik.kolumny) == len(wynik.wyniki) == 0
+    with pytest.raises(ValueError):
+        ranking(macierz, 'pmi', -1)
+
+
+@pytest.mark.parametrize('k', ['0', '-3'])
+def test_top_k_w_argumentach(monkeypatch, k):
+    import analiza_semantyczna
+
+    monkeypatch.setattr(sys, 'argv', ['analiza_semantyczna.py', '--top-k', k])
+    with pytest.raises(SystemExit) as wyjatek:
+        analiza_semantyczna.main()
+    assert wyjatek.value.code == 2
@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pytest
+
+from macierz_sasiedztwa import MacierzSasiedztwa
+from miary_wspolwystepowania import ocen, wybierz_krawedzie
+
+
+@pytest.fixture
+def macierz():
+    # Pary: (a,b) x2, (a,c) x1, (b,b) x1, (b,c) x1. Macierz symetryczna: sumy wierszy
+    # a = 3, b = 2 + 1 + 2 * 1 = 5, c = 2, n = 2 * 5 par = 10; k11 pary (b,b) = 2
+    pary = [(0, 1, 2), (0, 2, 1), (1, 1, 1), (1, 2, 1)]
+    klucze = np.array([(a << 32) | b for a, b, _ in pary], dtype=np.uint64)
+    return MacierzSasiedztwa(['a', 'b', 'c'], klucze, np.arange(len(pary)), np.array([w for *_, w in pary]))
+
+
+def _g2(tabela):
+    # G^2 = 2 sum O log(O / E) z tabeli 2x2 i jej marginesów
+    n = sum(map(sum, tabela))
+    wiersze = [sum(w) for w in tabela]
+    kolumny = [tabela[0][j] + tabela[1][j] for j in range(2)]
+    return 2 * sum(o * math.log(o / (wiersze[i] * kolumny[j] / n))
+                   for i in range(2) for j in range(2) if (o := tabela[i][j]) > 0)
+
+
+def test_pmi_i_ppmi(macierz):
+    pmi = [math.log(2 * 10 / (3 * 5)), math.log(1 * 10 / (3 * 2)), math.log(2 * 10 / (5 * 5)), 0.0]
+    assert ocen(macierz, 'pmi') == pytest.approx(pmi)
+    assert ocen(macierz, 'ppmi') == pytest.approx([max(p, 0.0) for p in pmi])
+    assert ocen(macierz, 'liczba').tolist() == [2, 1, 1, 1]
+
+
+def test_llr(macierz):
+    # Tabele [[k11, c1 - k11], [c2 - k11, n - c1 - c2 + k11]]
+    tabele = [[[2, 1], [3, 4]], [[1, 2], [1, 6]], [[2, 3], [3, 2]], [[1, 4], [1, 4]]]
+    assert ocen(macierz, 'llr') == pytest.approx([_g2(t) for t in tabele])
+    assert ocen(macierz, 'llr')[3] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_wybor_krawedzi(macierz):
+    def pary(m):
+        return [(m.slownik[int(k >> np.uint64(32))], m.slownik[int(k & np.uint64(0xFFFFFFFF))]) for k in m.klucze]
+
+    # ppmi: tylko dodatnie wyniki
+    assert pary(wybierz_krawedzie(macierz, 'ppmi')) == [('a', 'b'), ('a', 'c')]
+    assert pary(wybierz_krawedzie(macierz, 'liczba', min_czestotliwosc=2)) == [('a', 'b')]
+    # Najlepszy sąsiad a i b to b/a, c - remis (a,c)/(b,c) rozstrzyga kolejność kluczy
+    assert pary(wybierz_krawedzie(macierz, 'liczba', top_n=1)) == [('a', 'b'), ('a', 'c')]
+    with pytest.raises(ValueError):
+        wybierz_krawedzie(macierz, 'pmi', top_n=0)
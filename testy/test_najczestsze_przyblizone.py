@@ -0,0 +1,62 @@
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from najczestsze_przyblizone import SzkicNajczestszych, przytnij
+from tabela_czestotliwosci import tablica_obiektow
+
+
+def _strumien(ziarno: int, n: int = 20_000) -> list:
+    rng = np.random.default_rng(ziarno)
+    return [f'w{i}' for i in rng.zipf(1.3, n) % 500]
+
+
+def _szkic(slowa: list, pojemnosc: int, paczka: int = 1000) -> SzkicNajczestszych:
+    # Jak StrumienNajczestszych: każda paczka liczona dokładnie, przycinana i dodawana
+    szkic = SzkicNajczestszych(pojemnosc)
+    for start in range(0, len(slowa), paczka):
+        licznik = Counter(slowa[start:start + paczka])
+        klucze = list(licznik)
+        liczby = np.array([licznik[k] for k in klucze], dtype=np.int64)
+        zostaja, prog = przytnij(liczby, pojemnosc)
+        szkic.dodaj(tablica_obiektow([klucze[i] for i in zostaja.tolist()]), liczby[zostaja], prog, int(liczby.sum()))
+    return szkic
+
+
+def _sprawdz_granice(szkic: SzkicNajczestszych, slowa: list) -> None:
+    prawdziwe = Counter(slowa)
+    assert szkic.suma == len(slowa)
+    sledzone = dict(zip(szkic.klucze.tolist(), zip(szkic.liczniki.tolist(), szkic.bledy.tolist())))
+    for klucz, (licznik, blad) in sledzone.items():
+        assert licznik - blad <= prawdziwe[klucz] <= licznik, klucz
+    # Każdy element częstszy niż prog jest śledzony
+    for klucz, f in prawdziwe.items():
+        if klucz not in sledzone:
+            assert f <= szkic.prog, klucz
+    for klucz in szkic.klucze[szkic.pewne()].tolist():
+        assert all(prawdziwe[klucz] > f for k, f in prawdziwe.items() if k not in sledzone)
+
+
+@pytest.mark.parametrize('pojemnosc', [10, 50, 1000])
+def test_granice_bledu(pojemnosc):
+    slowa = _strumien(0)
+    _sprawdz_granice(_szkic(slowa, pojemnosc), slowa)
+
+
+@pytest.mark.parametrize('pojemnosc', [10, 50])
+def test_scalanie_szkicow(pojemnosc):
+    # Dwa szkice z różnych części strumienia - granice względem całości, także z błędami drugiego
+    pierwsze, drugie = _strumien(1), _strumien(2)
+    szkic = _szkic(pierwsze, pojemnosc)
+    szkic.scal(_szkic(drugie, pojemnosc))
+    _sprawdz_granice(szkic, pierwsze + drugie)
+
+
+def test_najczestsze_bez_tablicy_napisow():
+    szkic = SzkicNajczestszych(10)
+    dlugi = 'x' * 1_000_000
+    szkic.dodaj(tablica_obiektow(['b', dlugi, 'a', 'c']), np.array([2, 2, 2, 5]))
+    klucze, liczniki, _ = szkic.najczestsze()
+    assert klucze.tolist() == ['c', 'a', 'b', dlugi]
+    assert liczniki.tolist() == [5, 2, 2, 2]
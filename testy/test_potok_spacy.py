@@ -0,0 +1,52 @@
+import pytest
+
+from potok_spacy import podziel_tekst
+
+TEKST = ("The quick brown fox jumps over the lazy dog. She sells sea shells by the sea shore.\n"
+         "Colorless green ideas sleep furiously. Time flies like an arrow; fruit flies like a banana.\n")
+# Zdania równej długości - przy rozmiarze fragmentu = długość zdania cięcia wypadają między zdaniami
+ZDANIA = ('She sells sea shells.', 'Time flies very fast.', 'The dog ate my shoes.')
+
+
+def test_fragmenty_ciete_na_bialych_znakach():
+    fragmenty = list(podziel_tekst(TEKST, 30))
+    assert all(len(f) <= 30 for f in fragmenty)
+    assert ' '.join(fragmenty).split() == TEKST.split()
+
+
+def test_bez_spacji_ciecie_na_nowej_linii():
+    tekst = '\n'.join(['słowo'] * 20)
+    fragmenty = list(podziel_tekst(tekst, 16))
+    assert all(len(f) <= 16 for f in fragmenty)
+    assert '\n'.join(fragmenty).split() == tekst.split()
+
+
+def test_bez_bialych_znakow_ciecie_twarde():
+    tekst = 'ż' * 50
+    fragmenty = list(podziel_tekst(tekst, 16))
+    assert [len(f) for f in fragmenty] == [16, 16, 16, 2]
+    assert ''.join(fragmenty) == tekst
+
+
+def bez_bialych(docs):
+    return [(t.text, t.pos_) for doc in docs for t in doc if not t.is_space]
+
+
+def test_tokeny_fragmentow_jak_calego_tekstu():
+    spacy = pytest.importorskip('spacy')
+    nlp = spacy.blank('en')
+    calosc = bez_bialych([nlp(TEKST)])
+    for rozmiar in (20, 45, 100):
+        assert bez_bialych(nlp.pipe(podziel_tekst(TEKST, rozmiar))) == calosc
+
+
+def test_tokeny_i_pos_fragmentow_jak_calego_tekstu():
+    spacy = pytest.importorskip('spacy')
+    try:
+        nlp = spacy.load('en_core_web_sm')
+    except OSError:
+        pytest.skip('brak modelu en_core_web_sm')
+    tekst = ' '.join(ZDANIA)
+    fragmenty = list(podziel_tekst(tekst, len(ZDANIA[0])))
+    assert fragmenty == list(ZDANIA)
+    assert bez_bialych(nlp.pipe(fragmenty)) == bez_bialych([nlp(tekst)])
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+nx = pytest.importorskip('networkx')
+
+from wspolne.renderowanie import przytnij_uklady, uklad_sprezynowy
+
+
+def graf(n: int):
+    return nx.path_graph(n)
+
+
+def pliki(katalog) -> set:
+    return {p for p in os.listdir(katalog) if p.endswith('.json')}
+
+
+def test_trafienie_zwraca_ten_sam_uklad(tmp_path):
+    pierwszy = uklad_sprezynowy(graf(5), seed=1, katalog=str(tmp_path))
+    drugi = uklad_sprezynowy(graf(5), seed=1, katalog=str(tmp_path))
+    assert pierwszy.keys() == drugi.keys()
+    for wezel in pierwszy:
+        assert tuple(pierwszy[wezel]) == pytest.approx(tuple(drugi[wezel]))
+    assert len(pliki(tmp_path)) == 1
+
+
+def test_najdawniej_uzywane_uklady_usuwane_ponad_limit(tmp_path):
+    katalog = str(tmp_path)
+    kolejne = []
+    for n, czas in zip((4, 5, 6), (100, 200, 300)):
+        przed = pliki(tmp_path)
+        uklad_sprezynowy(graf(n), seed=1, katalog=katalog)
+        (nowy,) = pliki(tmp_path) - przed
+        os.utime(tmp_path / nowy, (czas, czas))
+        kolejne.append(nowy)
+    najstarszy, _, najnowszy = kolejne
+
+    # Trafienie odświeża czas użycia: najstarszy staje się najnowszym
+    uklad_sprezynowy(graf(4), seed=1, katalog=katalog)
+    assert os.stat(tmp_path / najstarszy).st_mtime > 300
+
+    # Limit mieszczący dwa pliki: usuwany najdawniej używany
+    limit = sum(os.path.getsize(tmp_path / p) for p in (najstarszy, najnowszy))
+    assert przytnij_uklady(katalog, limit) == 1
+    assert pliki(tmp_path) == {najstarszy, najnowszy}
+
+
+def test_zapis_nowego_ukladu_przycina_katalog(tmp_path):
+    katalog = str(tmp_path)
+    uklad_sprezynowy(graf(4), seed=1, katalog=katalog)
+    (stary,) = pliki(tmp_path)
+    os.utime(tmp_path / stary, (100, 100))
+
+    # Limit 1 bajt: świeżo zapisany układ zostaje, starszy usunięty
+    uklad_sprezynowy(graf(5), seed=1, katalog=katalog, limit_bajtow=1)
+    assert len(pliki(tmp_path)) == 1
+    assert stary not in pliki(tmp_path)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+from stan_przyrostowy import StanKorpusu
+from macierz_sasiedztwa import MacierzSasiedztwa
+from tabela_czestotliwosci import TabelaCzestotliwosci
+from zliczanie_rownolegle import zlicz_rownolegle
+
+
+def _slowa(stan: StanKorpusu) -> dict:
+    return {slowo: int(n) for slowo, n in zip(stan.slownik, stan.liczniki) if n}
+
+
+def _pary(stan: StanKorpusu) -> dict:
+    return _pary_macierzy(stan.pary)
+
+
+def _pary_macierzy(pary: MacierzSasiedztwa) -> dict:
+    pierwsze = (pary.klucze >> np.uint64(32)).astype(np.int64)
+    drugie = (pary.klucze & np.uint64(0xFFFFFFFF)).astype(np.int64)
+    return {(pary.slownik[a], pary.slownik[b]): int(w)
+            for a, b, w in zip(pierwsze.tolist(), drugie.tolist(), pary.wagi.tolist())}
+
+
+def _przelicz(tmp_path, sciezka, nazwa: str) -> StanKorpusu:
+    stan = StanKorpusu(str(sciezka), lambda t: True, str(tmp_path / nazwa))
+    stan.aktualizuj()
+    return stan
+
+
+@pytest.mark.parametrize('poczatek, dopisane', [
+    ("hello world.\n", "dog cat.\n"),
+    ("hello world \n", "dog cat\n"),
+    ("hello world", " dog cat.\n"),
+    ("hello world.\n\n", "dog cat dog. hello\n"),
+])
+def test_przyrost_jak_pelne_przeliczenie(tmp_path, poczatek, dopisane):
+    # Dopisanie do pliku zakończonego białym znakiem nie gubi pierwszego nowego słowa
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text(poczatek, encoding='utf-8')
+    stan = _przelicz(tmp_path, sciezka, 'stan')
+    with open(sciezka, 'a', encoding='utf-8') as f:
+        f.write(dopisane)
+    stan.aktualizuj()
+
+    pelny = _przelicz(tmp_path, sciezka, 'pelny')
+    assert _slowa(stan) == _slowa(pelny)
+    assert _pary(stan) == _pary(pelny)
+
+
+def test_przyrost_po_zapisie_stanu(tmp_path):
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text("the cat sat on the mat.\n", encoding='utf-8')
+    stan = _przelicz(tmp_path, sciezka, 'stan')
+    stan.zapisz()
+    with open(sciezka, 'a', encoding='utf-8') as f:
+        f.write("dog ran to the cat.\n")
+
+    wczytany = StanKorpusu.wczytaj(str(sciezka), lambda t: True, str(tmp_path / 'stan'))
+    wczytany.aktualizuj()
+    pelny = _przelicz(tmp_path, sciezka, 'pelny')
+    assert _slowa(wczytany) == _slowa(pelny)
+    assert _pary(wczytany) == _pary(pelny)
+
+
+def _porownaj_z_pelnym_zliczeniem(stan: StanKorpusu, sciezka) -> None:
+    # Wzorzec niezależny od stanu: zliczanie całego pliku (szeregowo, małe fragmenty)
+    wynik = zlicz_rownolegle(str(sciezka), liczba_procesow=1, rozmiar_fragmentu=7)
+    pary = MacierzSasiedztwa.z_czesci(wynik.slownik, wynik.czesci_par)
+    assert _slowa(stan) == {s: int(n) for s, n in zip(wynik.slownik, wynik.liczniki) if n}
+    assert _pary(stan) == _pary_macierzy(pary)
+
+    tabela = TabelaCzestotliwosci.z_licznikow(wynik.liczniki, wynik.slownik)
+    assert stan.tabela.wyrazy.tolist() == tabela.wyrazy.tolist()
+    assert stan.tabela.f.tolist() == tabela.f.tolist()
+    assert _pary_macierzy(stan.graf) == _pary_macierzy(pary.przytnij(2))
+    assert _krawedzie(stan.pary) == _krawedzie(pary)
+
+
+def _krawedzie(pary: MacierzSasiedztwa) -> list:
+    # Kolejność pierwszego wystąpienia par (same pozycje zależą od podziału na fragmenty)
+    slowo1, slowo2, _ = pary.krawedzie()
+    return [(pary.slownik[a], pary.slownik[b]) for a, b in zip(slowo1.tolist(), slowo2.tolist())]
+
+
+def test_ostatnie_slowo_bez_bialego_znaku(tmp_path):
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text("the cat sat on the mat", encoding='utf-8')
+    stan = _przelicz(tmp_path, sciezka, 'stan')
+    stan.ustaw_prog(2)
+    assert _slowa(stan) == {'the': 2, 'cat': 1, 'sat': 1, 'on': 1, 'mat': 1}
+    _porownaj_z_pelnym_zliczeniem(stan, sciezka)
+
+
+@pytest.mark.parametrize('dopiski', [
+    ["s and the mats sat", " the cat"],
+    ["", "s. mat cat", "\n"],
+    ["ter of the mat.", "ter the cat"],
+    [" mat", "ter", "s on the mat"],
+])
+def test_dopisywanie_do_niedokonczonego_slowa(tmp_path, dopiski):
+    # Dopisek może dokończyć ostatnie słowo ("mat" -> "mats"); stan po każdej aktualizacji
+    # i po zapisie/odczycie jak zliczenie całego pliku
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text("the cat sat on the mat", encoding='utf-8')
+    stan = _przelicz(tmp_path, sciezka, 'stan')
+    stan.ustaw_prog(2)
+    for dopisek in dopiski:
+        with open(sciezka, 'a', encoding='utf-8') as f:
+            f.write(dopisek)
+        stan.zapisz()
+        stan = StanKorpusu.wczytaj(str(sciezka), lambda t: True, str(tmp_path / 'stan'))
+        stan.aktualizuj()
+        stan.ustaw_prog(2)
+        _porownaj_z_pelnym_zliczeniem(stan, sciezka)
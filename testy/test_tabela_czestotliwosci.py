@@ -0,0 +1,63 @@
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from tabela_czestotliwosci import TabelaCzestotliwosci
+
+TEKST = ("the cat sat on the mat and the dog sat on the log a cat and a dog "
+         "met on a mat the end i think i saw a cat").split()
+
+
+def _tabela(slowa) -> TabelaCzestotliwosci:
+    indeks = {}
+    ids = [indeks.setdefault(s, len(indeks)) for s in slowa]
+    return TabelaCzestotliwosci.z_licznikow(np.bincount(ids, minlength=len(indeks)), list(indeks))
+
+
+def _odciecie(najczestsze, poziom: float) -> int:
+    # Dawna pętla po wierszach DataFrame: pierwsza ranga, od której suma f >= poziom * suma
+    suma = sum(f for _, f in najczestsze)
+    kumulatywna = 0
+    for r, (_, f) in enumerate(najczestsze, start=1):
+        kumulatywna += f
+        if kumulatywna >= poziom * suma:
+            return r
+    return 0
+
+
+def test_jak_counter():
+    tabela = _tabela(TEKST)
+    najczestsze = Counter(TEKST).most_common()
+    # Remisy (np. sat/on/mat/dog...) w kolejności pierwszego wystąpienia, jak most_common
+    assert list(zip(tabela.wyrazy.tolist(), tabela.f.tolist())) == najczestsze
+    assert tabela.r.tolist() == list(range(1, len(najczestsze) + 1))
+    assert tabela.rf.tolist() == [r * f for r, (_, f) in enumerate(najczestsze, start=1)]
+    assert tabela.suma == len(TEKST)
+
+    poziomy = [0.1, 0.5, 0.9, 1.0]
+    assert tabela.odciecia(poziomy) == {p: _odciecie(najczestsze, p) for p in poziomy}
+
+
+def test_dataframe():
+    pd = pytest.importorskip('pandas')
+    najczestsze = Counter(TEKST).most_common()
+    oczekiwany = pd.DataFrame([{'wyraz': w, 'r': r, 'f': f, 'r*f': r * f}
+                               for r, (w, f) in enumerate(najczestsze, start=1)])
+    pd.testing.assert_frame_equal(_tabela(TEKST).do_dataframe(), oczekiwany, check_dtype=False)
+
+
+def test_aktualizacja_jak_nowa_tabela():
+    rng = random.Random(0)
+    slowa = list(TEKST)
+    tabela = _tabela(slowa)
+    for _ in range(20):
+        dopisane = rng.choices(TEKST + ['new', 'words'], k=rng.randint(1, 8))
+        slowa += dopisane
+        indeks = {}
+        ids = [indeks.setdefault(s, len(indeks)) for s in slowa]
+        liczniki = np.bincount(ids, minlength=len(indeks))
+        zmienione = np.array(sorted({indeks[s] for s in dopisane}))
+        tabela = tabela.aktualizuj(zmienione, liczniki, list(indeks))
+        assert list(zip(tabela.wyrazy.tolist(), tabela.f.tolist())) == Counter(slowa).most_common()
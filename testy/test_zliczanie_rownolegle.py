@@ -0,0 +1,60 @@
+import re
+from collections import Counter
+
+import pytest
+
+from macierz_sasiedztwa import MacierzSasiedztwa
+from zliczanie_rownolegle import zlicz_rownolegle
+
+TEKST = ("Zażółć gęślą jaźń, the cat sat.  On the MAT!? Żółw i kot\n"
+         "spali... a dog ran\tto the   cat; ósmy dzień\r\nthe end.Next word ąę ąę")
+
+
+def _szeregowo(teksty):
+    # Wzorzec: cały tekst naraz - słowa \w+ małymi literami, pary sąsiednich słów
+    # dłuższych niż 1 znak w obrębie zdania ([.!?]+), w kolejności pierwszego wystąpienia
+    slowa, pary = Counter(), Counter()
+    for tekst in teksty:
+        for zdanie in re.split(r'[.!?]+', tekst.lower()):
+            tokeny = re.findall(r'\w+', zdanie)
+            slowa.update(tokeny)
+            pary.update(tuple(sorted(p)) for p in zip(tokeny, tokeny[1:]) if len(p[0]) > 1 and len(p[1]) > 1)
+    return dict(slowa), list(pary.items())
+
+
+def _rownolegle(zrodlo, **kwargs):
+    wynik = zlicz_rownolegle(str(zrodlo), **kwargs)
+    slowa = {s: int(n) for s, n in zip(wynik.slownik, wynik.liczniki)}
+    pary = MacierzSasiedztwa.z_czesci(wynik.slownik, wynik.czesci_par)
+    slowo1, slowo2, wagi = pary.krawedzie()
+    return slowa, [((wynik.slownik[a], wynik.slownik[b]), int(w))
+                   for a, b, w in zip(slowo1.tolist(), slowo2.tolist(), wagi.tolist())]
+
+
+@pytest.fixture
+def plik(tmp_path):
+    sciezka = tmp_path / 'korpus.txt'
+    sciezka.write_text(TEKST, encoding='utf-8')
+    return sciezka
+
+
+def test_kazdy_rozmiar_fragmentu(plik):
+    # Rozmiary od 1 bajtu: granice w środku słowa, zdania i znaku UTF-8, przy białych znakach
+    # i końcach zdań - wyrównanie i sklejanie par przez granice daje wynik szeregowy
+    oczekiwany = _szeregowo([TEKST])
+    for rozmiar in range(1, len(TEKST.encode('utf-8')) + 2):
+        assert _rownolegle(plik, liczba_procesow=1, rozmiar_fragmentu=rozmiar) == oczekiwany, rozmiar
+
+
+@pytest.mark.parametrize('rozmiar', [3, 17])
+def test_pula_procesow(plik, rozmiar):
+    assert _rownolegle(plik, liczba_procesow=2, rozmiar_fragmentu=rozmiar) == _szeregowo([TEKST])
+
+
+def test_wiele_plikow(tmp_path):
+    # Para nie przechodzi przez granicę plików
+    teksty = ["the cat sat on", "mat and the dog", "dog sat on the mat."]
+    for i, tekst in enumerate(teksty):
+        (tmp_path / f'{i}.txt').write_text(tekst, encoding='utf-8')
+    for rozmiar in (2, 5, 100):
+        assert _rownolegle(tmp_path, liczba_procesow=1, rozmiar_fragmentu=rozmiar) == _szeregowo(teksty)
@@ -0,0 +1,223 @@
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+from typing import Iterator, Optional
+
+KATALOG_REPO = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+KATALOG_CACHE = os.path.join(KATALOG_REPO, '.pjn_cache', 'korpusy')
+KATALOG_ZRODEL = 'zrodla'
+
+WERSJA_FORMATU = 1
+ROZMIAR_BLOKU = 1 << 20
+ZNAK_SLOWA = re.compile(r'\w')
+WZORZEC_TOKENU = re.compile(r'\w+')
+WZORZEC_KONCA_ZDANIA = re.compile(r'[.!?]+')
+
+
+def czytaj_bloki(sciezka: str, rozmiar_bloku: int = ROZMIAR_BLOKU) -> Iterator[str]:
+    # Każdy blok kończy się poza słowem - niedokończone słowo przechodzi do następnego bloku
+    reszta = ''
+    with open(sciezka, 'r', encoding='utf-8') as f:
+        while True:
+            blok = f.read(rozmiar_bloku)
+            if not blok:
+                break
+            blok = reszta + blok
+
+            granica = len(blok)
+            while granica > 0 and ZNAK_SLOWA.match(blok, granica - 1):
+                granica -= 1
+
+            reszta = blok[granica:]
+            if granica:
+                yield blok[:granica]
+
+    if reszta:
+        yield reszta
+
+
+def hash_pliku(sciezka: str) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"v{WERSJA_FORMATU}".encode())
+    with open(sciezka, 'rb') as f:
+        for blok in iter(lambda: f.read(ROZMIAR_BLOKU), b''):
+            h.update(blok)
+    return h.hexdigest()
+
+
+def sciezka_zrodla(sciezka: str, katalog_cache: str) -> str:
+    klucz = hashlib.blake2b(os.path.abspath(sciezka).encode(), digest_size=8).hexdigest()
+    return os.path.join(katalog_cache, KATALOG_ZRODEL, klucz + '.json')
+
+
+# Korpus zakodowany jako identyfikatory uint32, w katalogu nazwanym hashem treści:
+#   slownik.txt - jeden token (małe litery, \w+) na linię, id = numer linii
+#   tokeny.u32  - identyfikatory tokenów w kolejności tekstu (memmap)
+#   zdania.npy  - indeksy tokenów rozpoczynających zdania (podział na [.!?]+)
+#   meta.json   - hash, liczba tokenów i typów
+class MagazynKorpusu:
+
+    def __init__(self, katalog: str):
+        self.katalog = katalog
+
+        with open(os.path.join(katalog, 'meta.json'), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+
+        with open(os.path.join(katalog, 'slownik.txt'), 'r', encoding='utf-8') as f:
+            self.slownik = f.read().split('\n')[:-1]
+
+        liczba_tokenow = self.meta['liczba_tokenow']
+        if liczba_tokenow:
+            self.tokeny = np.memmap(os.path.join(katalog, 'tokeny.u32'), dtype=np.uint32,
+                                    mode='r', shape=(liczba_tokenow,))
+        else:
+            self.tokeny = np.zeros(0, dtype=np.uint32)
+
+        self.poczatki_zdan = np.load(os.path.join(katalog, 'zdania.npy'), mmap_mode='r')
+
+    @classmethod
+    def otworz(cls, sciezka_korpusu: str, katalog_cache: Optional[str] = None,
+               kompiluj: bool = True) -> Optional['MagazynKorpusu']:
+        # Magazyn rozpoznawany po rozmiarze i mtime_ns zapisanych przy ostatnim otwarciu;
+        # hash (odczyt całego pliku) liczony tylko, gdy się nie zgadzają. Z kompiluj=False
+        # zwraca None zamiast liczyć hash i kompilować
+        katalog_cache = katalog_cache or KATALOG_CACHE
+        katalog = cls.znajdz(sciezka_korpusu, katalog_cache)
+        if katalog is not None:
+            return cls(katalog)
+        if not kompiluj:
+            return None
+
+        # stat przed hashem - plik zmieniony w trakcie odczytu nie zgodzi się przy następnym otwarciu
+        stat = os.stat(sciezka_korpusu)
+        hash_ = hash_pliku(sciezka_korpusu)
+        katalog = os.path.join(katalog_cache, hash_)
+        if not os.path.exists(os.path.join(katalog, 'meta.json')):
+            cls.skompiluj(sciezka_korpusu, katalog)
+
+        zrodlo = sciezka_zrodla(sciezka_korpusu, katalog_cache)
+        os.makedirs(os.path.dirname(zrodlo), exist_ok=True)
+        with open(zrodlo + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'rozmiar': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'hash': hash_}, f)
+        os.replace(zrodlo + '.tmp', zrodlo)
+
+        return cls(katalog)
+
+    @staticmethod
+    def znajdz(sciezka_korpusu: str, katalog_cache: Optional[str] = None) -> Optional[str]:
+        # Katalog skompilowanego magazynu, jeśli rozmiar i mtime_ns pliku są niezmienione
+        katalog_cache = katalog_cache or KATALOG_CACHE
+        try:
+            with open(sciezka_zrodla(sciezka_korpusu, katalog_cache), 'r', encoding='utf-8') as f:
+                zapisane = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        stat = os.stat(sciezka_korpusu)
+        katalog = os.path.join(katalog_cache, zapisane['hash'])
+        if (stat.st_size, stat.st_mtime_ns) != (zapisane['rozmiar'], zapisane['mtime_ns']) or \
+                not os.path.exists(os.path.join(katalog, 'meta.json')):
+            return None
+        return katalog
+
+    @staticmethod
+    def skompiluj(sciezka_korpusu: str, katalog: str, rozmiar_bloku: int = ROZMIAR_BLOKU) -> None:
+        print(f"Kompilacja korpusu: {sciezka_korpusu}")
+
+        os.makedirs(os.path.dirname(katalog), exist_ok=True)
+        katalog_tmp = tempfile.mkdtemp(dir=os.path.dirname(katalog))
+
+        indeks = {}
+        poczatki_zdan = [0]
+        liczba_tokenow = 0
+
+        with open(os.path.join(katalog_tmp, 'tokeny.u32'), 'wb') as f_tokeny:
+            for blok in czytaj_bloki(sciezka_korpusu, rozmiar_bloku):
+                ids = []
+                for nr, zdanie in enumerate(WZORZEC_KONCA_ZDANIA.split(blok.lower())):
+                    if nr > 0:
+                        poczatki_zdan.append(liczba_tokenow + len(ids))
+                    ids.extend([indeks.setdefault(t, len(indeks))
+                                for t in WZORZEC_TOKENU.findall(zdanie)])
+
+                np.array(ids, dtype=np.uint32).tofile(f_tokeny)
+                liczba_tokenow += len(ids)
+
+        with open(os.path.join(katalog_tmp, 'slownik.txt'), 'w', encoding='utf-8') as f:
+            for token in indeks:
+                f.write(token + '\n')
+
+        zdania = np.unique(np.array(poczatki_zdan, dtype=np.int64))
+        np.save(os.path.join(katalog_tmp, 'zdania.npy'), zdania[zdania < liczba_tokenow])
+
+        meta = {
+            'wersja': WERSJA_FORMATU,
+            'zrodlo': os.path.abspath(sciezka_korpusu),
+            'hash': os.path.basename(katalog),
+            'liczba_tokenow': liczba_tokenow,
+            'liczba_typow': len(indeks),
+        }
+        with open(os.path.join(katalog_tmp, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, ensure_ascii=False, indent=2)
+
+        try:
+            os.replace(katalog_tmp, katalog)
+        except OSError:
+            # Inny proces skompilował ten sam korpus równolegle
+            shutil.rmtree(katalog_tmp, ignore_errors=True)
+
+        print(f"Zapisano {liczba_tokenow:,} tokenów, {len(indeks):,} typów -> {katalog}")
+
+    def maska_slownika(self, wzorzec: re.Pattern) -> np.ndarray:
+        return np.fromiter((wzorzec.fullmatch(t) is not None for t in self.slownik),
+                           dtype=bool, count=len(self.slownik))
+
+    def filtruj(self, maska: np.ndarray, limit: Optional[int] = None,
+                rozmiar_okna: int = 1 << 22) -> np.ndarray:
+        # Tokeny, których typ spełnia maskę; czytane oknami, koniec po zebraniu limitu
+        wybrane = []
+        zebrano = 0
+        for start in range(0, len(self.tokeny), rozmiar_okna):
+            okno = self.tokeny[start:start + rozmiar_okna]
+            okno = okno[maska[okno]]
+            wybrane.append(okno)
+            zebrano += len(okno)
+            if limit is not None and zebrano >= limit:
+                break
+
+        if not wybrane:
+            return np.zeros(0, dtype=np.uint32)
+        return np.concatenate(wybrane)[:limit]
+
+    def maska_par_w_zdaniu(self) -> np.ndarray:
+        # maska[i] == True gdy tokeny i oraz i+1 należą do tego samego zdania
+        maska = np.ones(max(len(self.tokeny) - 1, 0), dtype=bool)
+        granice = np.asarray(self.poczatki_zdan)
+        granice = granice[granice > 0]
+        maska[granice - 1] = False
+        return maska
+
+    def tekst(self, ids: np.ndarray) -> str:
+        slownik = self.slownik
+        return ' '.join([slownik[i] for i in ids.tolist()])
+
+
+def main():
+    if len(sys.argv) < 2:
+        print("Użycie: python -m wspolne.magazyn_korpusu <korpus.txt> [katalog_cache]")
+        sys.exit(1)
+
+    katalog_cache = sys.argv[2] if len(sys.argv) > 2 else None
+    magazyn = MagazynKorpusu.otworz(sys.argv[1], katalog_cache)
+    print(f"Magazyn: {magazyn.katalog}")
+    print(f"Tokeny: {magazyn.meta['liczba_tokenow']:,}, typy: {magazyn.meta['liczba_typow']:,}, "
+          f"zdania: {len(magazyn.poczatki_zdan):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import os
+import sys
+import json
+import time
+import uuid
+import resource
+import cProfile
+import functools
+import contextlib
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+
+def szczyt_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux podaje ru_maxrss w KB, macOS w bajtach
+    if sys.platform == 'darwin':
+        return rss / (1024 * 1024)
+    return rss / 1024
+
+
+def zeruj_szczyt_rss() -> bool:
+    # Linux: zapis "5" do clear_refs zeruje VmHWM - szczyt RSS liczony od tej chwili
+    try:
+        with open('/proc/self/clear_refs', 'w') as f:
+            f.write('5')
+        return True
+    except OSError:
+        return False
+
+
+def szczyt_rss_od_zerowania_mb() -> float:
+    try:
+        with open('/proc/self/status') as f:
+            for linia in f:
+                if linia.startswith('VmHWM:'):
+                    return int(linia.split()[1]) / 1024
+    except OSError:
+        pass
+    return szczyt_rss_mb()
+
+
+def _proste_argumenty(args: tuple, kwargs: dict) -> Dict[str, Any]:
+    # Do rekordu trafiają tylko krótkie argumenty skalarne (np. typ='adj-noun', top_n=50)
+    proste = (str, int, float, bool, type(None))
+    wynik = {str(i): a for i, a in enumerate(args) if isinstance(a, proste) and len(str(a)) <= 100}
+    wynik.update({k: v for k, v in kwargs.items() if isinstance(v, proste) and len(str(v)) <= 100})
+    return wynik
+
+
+# Pomiary etapów (metod oznaczonych @etap): czas, czas CPU, szczyt RSS etapu i jego przyrost
+# względem RSS na starcie, liczniki elementów. Rekordy trafiają do listy `rekordy` i opcjonalnie
+# do pliku JSON-lines; `profiluj` - nazwy etapów (lub True dla wszystkich) profilowanych cProfile,
+# `hak` - własna fabryka menedżera kontekstu hak(nazwa_etapu), np. profiler próbkujący;
+# `cicho` - wydruki etapów wyciszone
+class Metryki:
+    def __init__(self, sciezka: Optional[str] = None, profiluj: Union[bool, Iterable[str]] = False,
+                 katalog_profili: Optional[str] = None, hak: Optional[Callable[[str], Any]] = None,
+                 cicho: bool = False):
+        self.sciezka = sciezka
+        self.profiluj = profiluj if isinstance(profiluj, bool) else set(profiluj)
+        self.katalog_profili = katalog_profili or (os.path.dirname(os.path.abspath(sciezka)) if sciezka else '.')
+        self.hak = hak
+        self.cicho = cicho
+        self.rekordy: List[Dict[str, Any]] = []
+        self.id_uruchomienia = uuid.uuid4().hex[:12]
+        self._stos: List[Dict[str, float]] = []
+        self._numer = 0
+
+    def czy_profilowac(self, nazwa: str) -> bool:
+        return self.profiluj is True or (self.profiluj is not False and nazwa in self.profiluj)
+
+    def zmierz(self, obiekt: Any, metoda: Callable, args: tuple, kwargs: dict,
+               liczniki: Optional[Callable[[Any, Any], Dict[str, int]]] = None) -> Any:
+        nazwa = metoda.__name__
+        self._numer += 1
+        numer = self._numer
+
+        # Szczyt RSS etapu nadrzędnego zapamiętywany przed wyzerowaniem VmHWM przez etap zagnieżdżony
+        if self._stos:
+            self._stos[-1]['szczyt'] = max(self._stos[-1]['szczyt'], szczyt_rss_od_zerowania_mb())
+        wyzerowano = zeruj_szczyt_rss()
+        rss_start = szczyt_rss_od_zerowania_mb() if wyzerowano else szczyt_rss_mb()
+        ramka = {'szczyt': rss_start}
+        self._stos.append(ramka)
+
+        profil = cProfile.Profile() if self.czy_profilowac(nazwa) else None
+        rekord = {
+            'uruchomienie': self.id_uruchomienia,
+            'numer': numer,
+            'czas': datetime.now().isoformat(timespec='milliseconds'),
+            'klasa': type(obiekt).__name__,
+            'etap': nazwa,
+            'poziom': len(self._stos) - 1,
+            'argumenty': _proste_argumenty(args, kwargs),
+        }
+        start, cpu_start = time.perf_counter(), time.process_time()
+        blad = None
+        try:
+            with contextlib.ExitStack() as stos:
+                if self.cicho:
+                    nic = stos.enter_context(open(os.devnull, 'w'))
+                    stos.enter_context(contextlib.redirect_stdout(nic))
+                if self.hak is not None:
+                    stos.enter_context(self.hak(nazwa))
+                if profil is not None:
+                    profil.enable()
+                    stos.callback(profil.disable)
+                wynik = metoda(obiekt, *args, **kwargs)
+        except BaseException as e:
+            blad = e
+            raise
+        finally:
+            rekord['czas_s'] = time.perf_counter() - start
+            rekord['cpu_s'] = time.process_time() - cpu_start
+            self._stos.pop()
+            szczyt = max(ramka['szczyt'], szczyt_rss_od_zerowania_mb() if wyzerowano else szczyt_rss_mb())
+            if self._stos:
+                self._stos[-1]['szczyt'] = max(self._stos[-1]['szczyt'], szczyt)
+            rekord['szczyt_rss_mb'] = round(szczyt, 1)
+            rekord['przyrost_rss_mb'] = round(max(szczyt - rss_start, 0.0), 1)
+
+            if blad is not None:
+                # Pierwsza treściwa linia komunikatu (LookupError NLTK zaczyna się od gwiazdek)
+                tresc = next((l.strip() for l in str(blad).splitlines() if l.strip(' *')), '')
+                rekord['blad'] = f"{type(blad).__name__}: {tresc}"
+            elif liczniki is not None:
+                try:
+                    rekord['liczniki'] = {k: int(v) for k, v in liczniki(obiekt, wynik).items()}
+                except Exception as e:
+                    rekord['liczniki'] = {'blad': str(e)}
+
+            if profil is not None:
+                os.makedirs(self.katalog_profili, exist_ok=True)
+                sciezka_profilu = os.path.join(
+                    self.katalog_profili, f'{self.id_uruchomienia}-{numer:03d}-{nazwa}.prof'
+                )
+                profil.dump_stats(sciezka_profilu)
+                rekord['profil'] = sciezka_profilu
+
+            self.zapisz(rekord)
+        return wynik
+
+    def zapisz(self, rekord: Dict[str, Any]) -> None:
+        self.rekordy.append(rekord)
+        if self.sciezka:
+            with open(self.sciezka, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(rekord, ensure_ascii=False) + '\n')
+
+    def podsumowanie(self) -> str:
+        linie = [f"{'etap':<28}{'czas [s]':>10}{'CPU [s]':>10}{'RSS [MB]':>10}{'+RSS [MB]':>11}  liczniki"]
+        # Rekordy zapisywane są po zakończeniu etapu - wydruk w kolejności rozpoczęcia
+        for r in sorted(self.rekordy, key=lambda r: r['numer']):
+            liczniki = ', '.join(f'{k}={v:,}' if isinstance(v, int) else f'{k}={v}'
+                                 for k, v in r.get('liczniki', {}).items())
+            linie.append(f"{'  ' * r['poziom'] + r['etap']:<28}{r['czas_s']:>10.3f}{r['cpu_s']:>10.3f}"
+                         f"{r['szczyt_rss_mb']:>10.0f}{r['przyrost_rss_mb']:>11.0f}  {liczniki}")
+        return '\n'.join(linie)
+
+
+def parsuj_profilowanie(wartosc: Optional[str]) -> Union[bool, List[str]]:
+    # Wartość opcji --profiluj: "etap1,etap2" lub "wszystkie"
+    if not wartosc:
+        return False
+    if wartosc == 'wszystkie':
+        return True
+    return [e.strip() for e in wartosc.split(',') if e.strip()]
+
+
+def etap(liczniki: Optional[Callable[[Any, Any], Dict[str, int]]] = None) -> Callable:
+    # Dekorator metody: pomiar przez self.metryki, a gdy go brak - zwykłe wywołanie
+    def dekorator(metoda: Callable) -> Callable:
+        @functools.wraps(metoda)
+        def opakowanie(self, *args, **kwargs):
+            metryki = getattr(self, 'metryki', None)
+            if metryki is None:
+                return metoda(self, *args, **kwargs)
+            return metryki.zmierz(self, metoda, args, kwargs, liczniki)
+        return opakowanie
+    return dekorator
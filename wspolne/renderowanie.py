@@ -0,0 +1,122 @@
+import os
+import json
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from wspolne.magazyn_korpusu import KATALOG_REPO
+
+KATALOG_UKLADOW = os.path.join(KATALOG_REPO, '.pjn_cache', 'uklady')
+# Łączny rozmiar zapisanych układów, powyżej którego usuwane są najdawniej używane
+LIMIT_BAJTOW_UKLADOW = 64 << 20
+
+# W trybie wsadowym rysunki są tylko zapisywane (backend Agg, bez okien i plt.show())
+WSADOWY = False
+
+
+def ustaw_tryb_wsadowy() -> None:
+    import matplotlib
+
+    global WSADOWY
+    WSADOWY = True
+    matplotlib.use('Agg', force=True)
+
+
+def zakoncz_rysunek(fig, sciezka: Optional[str], dpi: int = 300, komunikat: str = 'Wykres zapisany') -> None:
+    import matplotlib.pyplot as plt
+
+    if sciezka:
+        fig.savefig(sciezka, dpi=dpi, bbox_inches='tight')
+        print(f"{komunikat}: {sciezka}")
+
+    if WSADOWY:
+        plt.close(fig)
+    else:
+        plt.show()
+
+
+def _rysuj(zadanie) -> Any:
+    funkcja, args, kwargs = zadanie
+    return funkcja(*args, **kwargs)
+
+
+# Rysunki zbierane w trakcie analizy i renderowane razem w puli procesów (backend Agg).
+# Funkcje rysujące muszą być zdefiniowane na poziomie modułu i przyjmować gotowe dane.
+class KolejkaRysunkow:
+    def __init__(self):
+        self.zadania = []
+
+    def dodaj(self, funkcja: Callable, *args, **kwargs) -> None:
+        self.zadania.append((funkcja, args, kwargs))
+
+    def __len__(self) -> int:
+        return len(self.zadania)
+
+    def renderuj(self, liczba_procesow: Optional[int] = None) -> List[Any]:
+        zadania, self.zadania = self.zadania, []
+        if not zadania:
+            return []
+
+        print(f"\nRenderowanie {len(zadania)} rysunków (procesy: {liczba_procesow or os.cpu_count()})...")
+        if liczba_procesow == 1 or len(zadania) == 1:
+            ustaw_tryb_wsadowy()
+            return [_rysuj(z) for z in zadania]
+
+        with ProcessPoolExecutor(max_workers=liczba_procesow, initializer=ustaw_tryb_wsadowy) as pula:
+            return list(pula.map(_rysuj, zadania))
+
+
+def przytnij_uklady(katalog: str = KATALOG_UKLADOW, limit_bajtow: int = LIMIT_BAJTOW_UKLADOW,
+                    zachowaj: Optional[str] = None) -> int:
+    # Usuwa najdawniej używane układy ponad limit (jak PamiecParsowania.przytnij); zwraca liczbę usuniętych
+    wpisy = []
+    for wpis in os.scandir(katalog):
+        if wpis.is_file() and wpis.name.endswith('.json'):
+            stat = wpis.stat()
+            wpisy.append((stat.st_mtime, stat.st_size, wpis.path))
+
+    razem = sum(rozmiar for _, rozmiar, _ in wpisy)
+    usuniete = 0
+    for _, rozmiar, sciezka in sorted(wpisy):
+        if razem <= limit_bajtow:
+            break
+        if sciezka == zachowaj:
+            continue
+        try:
+            os.remove(sciezka)
+        except FileNotFoundError:
+            # Usunięty równolegle przez inny proces
+            pass
+        razem -= rozmiar
+        usuniete += 1
+    return usuniete
+
+
+def uklad_sprezynowy(G, k: Optional[float] = None, iterations: int = 50, seed: Optional[int] = None,
+                     katalog: str = KATALOG_UKLADOW, limit_bajtow: int = LIMIT_BAJTOW_UKLADOW) -> Dict[Any, tuple]:
+    # nx.spring_layout z pamięcią na dysku; klucz: węzły i ważone krawędzie (w kolejności
+    # grafu - od niej zależą losowe pozycje startowe) oraz parametry układu. Trafienie
+    # odświeża czas modyfikacji pliku; po zapisie katalog przycinany do limit_bajtow
+    import networkx as nx
+
+    opis = json.dumps([
+        [str(w) for w in G.nodes()],
+        [[str(u), str(v), float(d.get('weight', 1))] for u, v, d in G.edges(data=True)],
+        k, iterations, seed,
+    ])
+    sciezka = os.path.join(katalog, hashlib.blake2b(opis.encode(), digest_size=16).hexdigest() + '.json')
+
+    if os.path.exists(sciezka):
+        with open(sciezka, 'r', encoding='utf-8') as f:
+            pozycje = json.load(f)
+        os.utime(sciezka)
+        return {w: tuple(pozycje[str(w)]) for w in G.nodes()}
+
+    pos = nx.spring_layout(G, k=k, iterations=iterations, seed=seed)
+
+    os.makedirs(katalog, exist_ok=True)
+    with open(sciezka + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump({str(w): [float(x), float(y)] for w, (x, y) in pos.items()}, f)
+    os.replace(sciezka + '.tmp', sciezka)
+    przytnij_uklady(katalog, limit_bajtow, zachowaj=sciezka)
+    return pos